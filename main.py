@@ -5,6 +5,7 @@ Assetto Corsa Car Modifier Application
 
 import sys
 import os
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 
 # Add src to path
@@ -31,4 +32,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the bulk-unpack process pool in the PyInstaller build
+    multiprocessing.freeze_support()
     main()
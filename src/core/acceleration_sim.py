@@ -0,0 +1,289 @@
+"""
+Straight-line acceleration simulator for Assetto Corsa cars.
+
+Estimates 0-100 km/h, 0-200 km/h, quarter-mile time and trap speed from
+the car's data files:
+
+    power.lut      torque (Nm) by RPM, boosted by the TURBO_n sections
+                   (steady state, see PowerTorqueCalculator)
+    engine.ini     LIMITER, INERTIA (flywheel)
+    drivetrain.ini gear ratios, FINAL, CHANGE_UP_TIME, TRACTION TYPE
+    car.ini        TOTALMASS
+    suspensions.ini CG_LOCATION (load on the driven axle)
+    tyres.ini      RADIUS, ROLLING_RESISTANCE_0/1 and DX0 (grip) per axle
+    aero.ini       CHORD × SPAN × CD(ANGLE) × CD_GAIN of every WING_n
+
+At a speed v the drive force in each gear is T(rpm) × ratio / radius,
+capped by grip (DX0 × load on the driven wheels) and zero past the
+limiter, against drag ½ρ·CdA·v² and rolling resistance. The flywheel adds
+INERTIA × (ratio / radius)² to the mass, except while the clutch slips
+below launch_rpm (the engine is held there, so its torque at launch_rpm
+is used). The gear with the highest acceleration is chosen, never
+shifting down, and each upshift costs CHANGE_UP_TIME without drive.
+
+A time-stepped loop would be sequential and too slow in Python, so the
+equation is integrated with a fixed step in speed instead: the whole
+speed grid × gear table is one array expression, and time and distance
+are cumulative sums of dv / a and v·dv / a. One run takes well under
+10 ms (tests/benchmark_accel.py), so it can update live in the editor.
+
+This is a flat-road model for comparing setups (no weight transfer, tyre
+slip or load sensitivity), not a replacement for a timed run in the game.
+"""
+
+import math
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.ini_parser import IniParser
+from core.lut_parser import LUTCurve
+from core.power_calculator import PowerTorqueCalculator
+from core.speed_calculator import SpeedCalculator
+from core.turbo_spool import read_turbo_configs
+
+AIR_DENSITY = SpeedCalculator.AIR_DENSITY
+GRAVITY = 9.81           # m/s²
+QUARTER_MILE = 402.336   # m
+
+
+class AccelerationSimulator:
+    """Straight-line acceleration run over a fixed speed grid"""
+
+    def __init__(self, torque_points: List[Tuple[float, float]], gear_ratios: List[float],
+                 final_ratio: float, mass: float, tyre_radius: float,
+                 turbo_configs: Optional[List[Dict]] = None, limiter: float = 0.0,
+                 drag_area: float = 0.0, rolling_resistance: Tuple[float, float] = (0.0, 0.0),
+                 engine_inertia: float = 0.0, shift_time: float = 0.25,
+                 launch_rpm: Optional[float] = None, grip: float = 0.0,
+                 driven_load: float = 1.0):
+        """
+        Args:
+            torque_points: List of (RPM, Nm) tuples from power.lut
+            gear_ratios: Forward gear ratios, first gear first
+            final_ratio: Final drive ratio
+            mass: Total mass in kg
+            tyre_radius: Driven tyre radius in meters
+            turbo_configs: Turbo config dicts (see PowerTorqueCalculator)
+            limiter: Rev limiter RPM (0 = last RPM of the LUT)
+            drag_area: CD × area in m² (sum over the aero elements)
+            rolling_resistance: (N, N per (m/s)²) summed over the four tyres
+            engine_inertia: Flywheel inertia in kg·m²
+            shift_time: Upshift time in seconds (no drive force)
+            launch_rpm: RPM held while the clutch slips (default: peak torque RPM)
+            grip: Friction coefficient of the driven tyres (0 = no traction limit)
+            driven_load: Fraction of the weight on the driven wheels
+        """
+        self.gear_ratios = list(gear_ratios)
+        self.final_ratio = final_ratio
+        self.mass = mass
+        self.tyre_radius = tyre_radius
+        self.limiter = limiter
+        self.drag_area = drag_area
+        self.rolling_resistance = rolling_resistance
+        self.engine_inertia = engine_inertia
+        self.shift_time = shift_time
+        self.launch_rpm = launch_rpm
+        self.grip = grip
+        self.driven_load = driven_load
+
+        curves = PowerTorqueCalculator(torque_points, turbo_configs).compute_curves(rpm_step=25)
+        self._curve_rpm = np.array(curves['rpm_values'], dtype=np.float64)
+        self._curve_torque = np.array(curves['effective_torque'], dtype=np.float64)
+        self._peak_rpm = curves['peak_eff_torque'][0]
+
+    @classmethod
+    def from_car_data(cls, data_path: str) -> 'AccelerationSimulator':
+        """
+        Simulator with every input read from a car's data folder
+
+        Files are read through PARSE_CACHE, so rebuilding the simulator
+        after an edit only re-parses the files that changed. Attributes
+        can be overridden before run() (e.g. gear ratios from the editor).
+
+        Args:
+            data_path: Path to the car's data/ folder
+
+        Returns:
+            AccelerationSimulator (run() returns no times if inputs are missing)
+        """
+        def ini(name: str) -> IniParser:
+            return IniParser.cached(os.path.join(data_path, name))
+
+        engine = ini('engine.ini')
+        power_file = engine.get_value('HEADER', 'POWER_CURVE', 'power.lut')
+        if not os.path.isfile(os.path.join(data_path, power_file)):
+            power_file = 'power.lut'
+        torque_points = LUTCurve.cached(os.path.join(data_path, power_file)).get_points()
+        engine_data = engine.get_many('ENGINE_DATA', {'LIMITER': float, 'INERTIA': float},
+                                      {'LIMITER': 0.0, 'INERTIA': 0.0})
+
+        drivetrain = ini('drivetrain.ini')
+        count = drivetrain.get_many('GEARS', {'COUNT': int}, {'COUNT': 0})['COUNT']
+        gear_keys = {f'GEAR_{i}': float for i in range(1, count + 1)}
+        gears = drivetrain.get_many('GEARS', dict(gear_keys, FINAL=float), {'FINAL': 0.0})
+        ratios = [gears[key] for key in gear_keys if gears[key]]
+        up_time = drivetrain.get_many('GEARBOX', {'CHANGE_UP_TIME': float},
+                                      {'CHANGE_UP_TIME': 250.0})['CHANGE_UP_TIME']
+        traction = (drivetrain.get_value('TRACTION', 'TYPE', 'RWD') or 'RWD').upper()
+
+        mass = ini('car.ini').get_many('BASIC', {'TOTALMASS': float}, {'TOTALMASS': 0.0})['TOTALMASS']
+        front_share = ini('suspensions.ini').get_many(
+            'BASIC', {'CG_LOCATION': float}, {'CG_LOCATION': 0.5})['CG_LOCATION']
+        driven_load = {'FWD': front_share, 'AWD': 1.0}.get(traction, 1.0 - front_share)
+
+        tyres = ini('tyres.ini')
+        tyre_types = {'RADIUS': float, 'ROLLING_RESISTANCE_0': float,
+                      'ROLLING_RESISTANCE_1': float, 'DX0': float}
+        tyre_defaults = {'RADIUS': 0.0, 'ROLLING_RESISTANCE_0': 0.0,
+                         'ROLLING_RESISTANCE_1': 0.0, 'DX0': 0.0}
+        front = tyres.get_many('FRONT', tyre_types, tyre_defaults)
+        rear = tyres.get_many('REAR', tyre_types, tyre_defaults)
+        driven = front if traction == 'FWD' else rear
+        if not driven['RADIUS']:
+            driven = front
+        rolling = (2.0 * (front['ROLLING_RESISTANCE_0'] + rear['ROLLING_RESISTANCE_0']),
+                   2.0 * (front['ROLLING_RESISTANCE_1'] + rear['ROLLING_RESISTANCE_1']))
+
+        return cls(torque_points, ratios, gears['FINAL'], mass, driven['RADIUS'],
+                   turbo_configs=read_turbo_configs(engine),
+                   limiter=engine_data['LIMITER'],
+                   drag_area=cls._drag_area(ini('aero.ini'), data_path),
+                   rolling_resistance=rolling,
+                   engine_inertia=engine_data['INERTIA'],
+                   shift_time=up_time / 1000.0,
+                   grip=driven['DX0'],
+                   driven_load=driven_load)
+
+    @staticmethod
+    def _drag_area(aero: IniParser, data_path: str) -> float:
+        """Σ CHORD × SPAN × CD × CD_GAIN over WING_n (CD from LUT_AOA_CD at ANGLE if present)"""
+        total = 0.0
+        i = 0
+        while aero.has_section(f'WING_{i}'):
+            section = f'WING_{i}'
+            wing = aero.get_many(section, {
+                'CHORD': float, 'SPAN': float, 'ANGLE': float, 'CD': float, 'CD_GAIN': float,
+            }, {'CHORD': 0.0, 'SPAN': 0.0, 'ANGLE': 0.0, 'CD': 0.0, 'CD_GAIN': 1.0})
+            cd = wing['CD']
+            lut_name = aero.get_value(section, 'LUT_AOA_CD')
+            if lut_name and os.path.isfile(os.path.join(data_path, lut_name)):
+                curve = LUTCurve.cached(os.path.join(data_path, lut_name))
+                if len(curve):
+                    cd = curve.interpolate(wing['ANGLE'])
+            total += wing['CHORD'] * wing['SPAN'] * cd * wing['CD_GAIN']
+            i += 1
+        return total
+
+    def top_speeds(self) -> Optional[List[float]]:
+        """
+        Top speed of each gear against drag and rolling resistance
+
+        Returns:
+            km/h per gear in gear_ratios (see
+            SpeedCalculator.calculate_power_limited_speeds()), or None if
+            there is no torque curve, tyre radius, final ratio or limiter to
+            solve with (0.0 for a gear then means it cannot pull)
+        """
+        limiter = self.limiter if self.limiter > 0 else (
+            self._curve_rpm[-1] if len(self._curve_rpm) else 0.0)
+        if (not (self._curve_torque > 0).any() or self.tyre_radius <= 0
+                or self.final_ratio <= 0 or limiter <= 0):
+            return None
+        return SpeedCalculator.calculate_power_limited_speeds(
+            np.column_stack((self._curve_rpm, self._curve_torque)), self.gear_ratios,
+            self.final_ratio, limiter, self.tyre_radius, self.drag_area, self.rolling_resistance)
+
+    @staticmethod
+    def _empty_result() -> Dict:
+        return {
+            'zero_to_100': None, 'zero_to_200': None,
+            'quarter_mile': None, 'trap_speed': None,
+            'speed': np.empty(0), 'time': np.empty(0),
+            'distance': np.empty(0), 'gear': np.empty(0, dtype=int),
+        }
+
+    def run(self, dv: float = 0.05) -> Dict:
+        """
+        Simulate a full-throttle standing start
+
+        Args:
+            dv: Speed step of the integration in m/s
+
+        Returns:
+            dict with keys:
+              zero_to_100  – seconds to 100 km/h (None if not reached)
+              zero_to_200  – seconds to 200 km/h (None if not reached)
+              quarter_mile – seconds to 402.3 m (None if not reached)
+              trap_speed   – km/h at 402.3 m (None if not reached)
+              speed        – km/h at each grid point
+              time         – seconds at each grid point (shifts included)
+              distance     – meters at each grid point
+              gear         – gear (1-based) at each grid point
+        """
+        ratios = np.array([g for g in self.gear_ratios if g > 0], dtype=np.float64)
+        radius = self.tyre_radius
+        if (not len(ratios) or self.final_ratio <= 0 or self.mass <= 0 or radius <= 0
+                or not len(self._curve_rpm)):
+            return self._empty_result()
+
+        limiter = self.limiter if self.limiter > 0 else self._curve_rpm[-1]
+        overall = ratios * self.final_ratio
+        rpm_per_ms = overall * (60.0 / (2.0 * math.pi * radius))   # engine RPM per m/s
+        v = np.arange(0.0, limiter / rpm_per_ms[-1], dv)
+
+        # (speed, gear) tables
+        rpm = v[:, None] * rpm_per_ms
+        launch_rpm = self.launch_rpm or min(self._peak_rpm or limiter, limiter)
+        slipping = rpm < launch_rpm
+        torque = np.interp(np.maximum(rpm, launch_rpm), self._curve_rpm, self._curve_torque)
+        force = torque * (overall / radius)
+        if self.grip > 0:
+            np.minimum(force, self.grip * self.driven_load * self.mass * GRAVITY, out=force)
+        rr0, rr1 = self.rolling_resistance
+        resist = rr0 + (0.5 * AIR_DENSITY * self.drag_area + rr1) * v * v
+        mass = self.mass + np.where(slipping, 0.0, self.engine_inertia * (overall / radius) ** 2)
+        accel = (force - resist[:, None]) / mass
+        accel[rpm > limiter] = -np.inf
+
+        gear = np.maximum.accumulate(np.argmax(accel, axis=1))
+        a = accel[np.arange(len(v)), gear]
+        stalled = np.flatnonzero(a <= 1e-3)   # no more acceleration (drag or limiter)
+        end = stalled[0] if len(stalled) else len(v)
+        if end < 2:
+            return self._empty_result()
+        v, a, gear, resist = v[:end], a[:end], gear[:end], resist[:end]
+
+        # Fixed-step integration in speed: dt = dv / a, dx = v dv / a (trapezoid)
+        dt = 2.0 * dv / (a[:-1] + a[1:])
+        time = np.concatenate(([0.0], np.cumsum(dt)))
+        distance = np.concatenate(([0.0], np.cumsum(0.5 * (v[:-1] + v[1:]) * dt)))
+
+        # Upshifts: coast for shift_time, then regain the speed lost meanwhile
+        shifts = np.flatnonzero(np.diff(gear)) + 1
+        if len(shifts) and self.shift_time > 0:
+            lost = resist[shifts] / self.mass * self.shift_time
+            extra_time = np.zeros_like(time)
+            extra_distance = np.zeros_like(time)
+            extra_time[shifts] = self.shift_time + lost / a[shifts]
+            extra_distance[shifts] = v[shifts] * extra_time[shifts]
+            time += np.cumsum(extra_time)
+            distance += np.cumsum(extra_distance)
+
+        result = {
+            'zero_to_100': None, 'zero_to_200': None,
+            'quarter_mile': None, 'trap_speed': None,
+            'speed': v * 3.6, 'time': time, 'distance': distance, 'gear': gear + 1,
+        }
+        for key, kmh in (('zero_to_100', 100.0), ('zero_to_200', 200.0)):
+            if v[-1] >= kmh / 3.6:
+                result[key] = float(np.interp(kmh / 3.6, v, time))
+        if distance[-1] >= QUARTER_MILE:
+            result['quarter_mile'] = float(np.interp(QUARTER_MILE, distance, time))
+            result['trap_speed'] = float(np.interp(QUARTER_MILE, distance, v)) * 3.6
+        else:
+            # Top speed reached before the line: cover the rest at that speed
+            result['quarter_mile'] = float(time[-1] + (QUARTER_MILE - distance[-1]) / v[-1])
+            result['trap_speed'] = float(v[-1]) * 3.6
+        return result
@@ -0,0 +1,557 @@
+"""
+Native reader for Assetto Corsa data.acd archives.
+
+Replaces the quickBMS subprocess (tools/assetto_corsa_acd.bms) with a
+pure-Python implementation of the same format:
+
+    [int32 -1111, int32 ?]          optional header (newer archives only)
+    repeated until EOF:
+        uint32   name_length
+        bytes    name               (e.g. "engine.ini")
+        uint32   size               (plaintext length in bytes)
+        uint32[] data               (one 32-bit field per plaintext byte)
+
+Each plaintext byte is stored in the low byte of its 32-bit field, shifted
+up by one character of the key string (ROT cipher).  The key string is
+"K1-K2-K3-K4-K5-K6-K7-K8", with the eight values derived from the
+lowercased car folder name (see assettocorsa_car_data_documentation.md §2.1).
+
+Decoding is vectorized: the archive is memory-mapped, each entry is viewed
+as a strided uint8 array over the low bytes of its 32-bit fields, and the
+key is subtracted with NumPy (uint8 arithmetic wraps modulo 256) into a
+preallocated output buffer.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+def _c_div(a: int, b: int) -> int:
+    """Integer division truncating towards zero (C semantics, as in quickBMS)."""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+def _c_mod(a: int, b: int) -> int:
+    """Remainder matching _c_div (sign follows the dividend)."""
+    return a - b * _c_div(a, b)
+
+
+def generate_acd_key(folder_name: str) -> str:
+    """
+    Derive the data.acd key string from a car folder name.
+
+    Port of the key generation in tools/assetto_corsa_acd.bms.  Only the
+    low 8 bits of each value are kept, so Python's unbounded integers give
+    the same result as the 32-bit arithmetic of the original script.
+
+    Args:
+        folder_name: Car folder name (e.g. 'ks_nissan_gtr')
+
+    Returns:
+        Key string such as '81-59-220-147-254-196-21-105'
+    """
+    s = [ord(c) for c in folder_name.lower()]
+    n = len(s)
+
+    key1 = sum(s)
+
+    key2 = 0
+    for i in range(0, n - 1, 2):
+        key2 = key2 * s[i] - s[i + 1]
+
+    key3 = 0
+    for i in range(1, n - 3, 3):
+        key3 = _c_div(key3 * s[i], s[i + 1] + 0x1b)
+        key3 += -0x1b - s[i - 1]
+
+    key4 = 0x1683
+    for i in range(1, n):
+        key4 -= s[i]
+
+    key5 = 0x42
+    for i in range(1, n - 4, 4):
+        key5 = (s[i] + 0xf) * key5 * (s[i - 1] + 0xf) + 0x16
+
+    key6 = 0x65
+    for i in range(0, n - 2, 2):
+        key6 -= s[i]
+
+    key7 = 0xab
+    for i in range(0, n - 2, 2):
+        key7 = _c_mod(key7, s[i])
+
+    key8 = 0xab
+    for i in range(0, n - 1):
+        key8 = _c_div(key8, s[i]) + s[i + 1]
+
+    keys = (key1, key2, key3, key4, key5, key6, key7, key8)
+    return '-'.join(str(k & 0xff) for k in keys)
+
+
+@lru_cache(maxsize=32)
+def _key_array(key: str) -> np.ndarray:
+    """Key string as a read-only uint8 array"""
+    arr = np.frombuffer(key.encode('ascii'), dtype=np.uint8)
+    arr.flags.writeable = False
+    return arr
+
+
+def _tiled_key(key: str, length: int) -> np.ndarray:
+    """Key repeated to cover `length` bytes (the key restarts at each entry)"""
+    key_arr = _key_array(key)
+    reps = -(-length // len(key_arr))
+    return np.tile(key_arr, reps)[:length]
+
+
+def _decode_into(buffer: np.ndarray, offset: int, size: int,
+                 key_tile: np.ndarray, out: np.ndarray):
+    """
+    Decryption kernel: out[i] = low_byte(field[i]) - key[i % len(key)]
+
+    Args:
+        buffer: Whole archive as a uint8 array (typically over an mmap)
+        offset: Byte offset of the entry payload in buffer
+        size: Plaintext size (number of 32-bit fields)
+        key_tile: Tiled key, at least `size` long
+        out: Preallocated uint8 output of length `size`
+    """
+    # Little-endian: the low byte of field i is at offset + 4*i
+    low = buffer[offset:offset + size * 4:4]
+    np.subtract(low, key_tile[:size], out=out)
+
+
+def decode_entry(raw: bytes, key: str) -> bytes:
+    """
+    Decrypt one entry payload.
+
+    Args:
+        raw: The entry's 32-bit fields (4 bytes per plaintext byte)
+        key: Key string from generate_acd_key()
+
+    Returns:
+        Decrypted file content
+    """
+    size = len(raw) // 4
+    out = np.empty(size, dtype=np.uint8)
+    _decode_into(np.frombuffer(raw, dtype=np.uint8), 0, size, _tiled_key(key, size), out)
+    return out.tobytes()
+
+
+def encode_entry(content: bytes, key: str) -> bytes:
+    """
+    Encrypt one file for data.acd (inverse of decode_entry).
+
+    Args:
+        content: Plaintext file content
+        key: Key string from generate_acd_key()
+
+    Returns:
+        Little-endian 32-bit fields, 4 bytes per plaintext byte
+    """
+    size = len(content)
+    plain = np.frombuffer(content, dtype=np.uint8)
+    fields = np.zeros(size, dtype='<u4')
+    # Write the shifted bytes straight into the low byte of each field
+    low = fields.view(np.uint8)[0::4]
+    np.add(plain, _tiled_key(key, size), out=low)
+    return fields.tobytes()
+
+
+def iter_acd_entries(f: BinaryIO) -> Iterator[Tuple[str, int, int]]:
+    """
+    Walk the entry table of a data.acd file without reading any payload.
+
+    Only the per-entry headers are read; payloads are skipped with seek().
+
+    Args:
+        f: Archive opened in binary mode, or an mmap (must be seekable)
+
+    Yields:
+        (name, payload_offset, plaintext_size) for each entry
+
+    Raises:
+        ValueError: If the archive is truncated or malformed
+    """
+    f.seek(0, os.SEEK_END)
+    total = f.tell()
+    offset = 0
+    f.seek(0)
+    head = f.read(4)
+    if len(head) == 4 and struct.unpack('<i', head)[0] < 0:
+        offset = 8  # Newer archives: -1111 marker + one extra int32
+
+    while offset < total:
+        f.seek(offset)
+        header = f.read(4)
+        if len(header) < 4:
+            raise ValueError(f"Truncated entry header at offset {offset}")
+        name_len = struct.unpack('<I', header)[0]
+        if name_len == 0 or offset + 8 + name_len > total:
+            raise ValueError(f"Invalid entry name length {name_len} at offset {offset}")
+        name = f.read(name_len).decode('latin-1')
+        size = struct.unpack('<I', f.read(4))[0]
+        payload = offset + 8 + name_len
+        end = payload + size * 4
+        if end > total:
+            raise ValueError(f"Entry '{name}' extends past end of archive")
+        yield name, payload, size
+        offset = end
+
+
+def _default_folder_name(acd_path: str) -> str:
+    """The key comes from the folder that contains data.acd."""
+    return os.path.basename(os.path.dirname(os.path.abspath(acd_path)))
+
+
+class AcdArchive:
+    """
+    Random-access, read-only view of a data.acd file.
+
+    The entry table is indexed once on open (headers only); entries are
+    decrypted from a memory map on first access and then kept in memory, so
+    reading engine.ini from a packed car never touches the other entries.
+    The map is only held during a decode, so data.acd can still be renamed
+    (CarFileManager.delete_data_acd) while an archive object is alive.
+    """
+
+    def __init__(self, acd_path: str, folder_name: Optional[str] = None):
+        """
+        Open a data.acd and index its entries
+
+        Args:
+            acd_path: Path to data.acd
+            folder_name: Car folder name used for the key (defaults to the
+                         folder containing acd_path)
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the archive is malformed
+        """
+        self.acd_path = acd_path
+        self.folder_name = folder_name or _default_folder_name(acd_path)
+        self.key = generate_acd_key(self.folder_name)
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._cache: Dict[str, bytes] = {}
+
+        with open(acd_path, 'rb') as f:
+            for name, offset, size in iter_acd_entries(f):
+                self._index[name] = (offset, size)
+
+    def names(self) -> List[str]:
+        """Entry names in archive order"""
+        return list(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self):
+        return f"AcdArchive({self.acd_path!r}, entries={len(self._index)})"
+
+    def read_bytes(self, name: str) -> bytes:
+        """
+        Decrypted content of one entry
+
+        Args:
+            name: Entry name (e.g. 'engine.ini')
+
+        Returns:
+            Decrypted bytes
+
+        Raises:
+            KeyError: If the entry does not exist
+        """
+        content = self._cache.get(name)
+        if content is None:
+            if name not in self._index:
+                raise KeyError(name)
+            self._decode_entries([name])
+            content = self._cache[name]
+        return content
+
+    def _decode_entries(self, names: List[str]):
+        """Memory-map the archive and decrypt `names` into the cache"""
+        with open(self.acd_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self._decode_from(np.frombuffer(mm, dtype=np.uint8), names)
+            finally:
+                try:
+                    mm.close()
+                except BufferError:
+                    # A traceback still references a view; the mapping is
+                    # released when that goes away.
+                    pass
+
+    def _decode_from(self, buffer: np.ndarray, names: List[str]):
+        """Decrypt entries into one preallocated buffer, then cache each slice"""
+        spans = [self._index[name] for name in names]
+        total = sum(size for _, size in spans)
+        if total == 0:
+            for name in names:
+                self._cache[name] = b''
+            return
+        out = np.empty(total, dtype=np.uint8)
+        key_tile = _tiled_key(self.key, max(size for _, size in spans))
+        pos = 0
+        for name, (offset, size) in zip(names, spans):
+            _decode_into(buffer, offset, size, key_tile, out[pos:pos + size])
+            self._cache[name] = out[pos:pos + size].tobytes()
+            pos += size
+
+    def read_text(self, name: str) -> str:
+        """Decrypted content of one entry as text (UTF-8, BOM stripped)"""
+        return self.read_bytes(name).decode('utf-8-sig', errors='replace')
+
+    def _virtual_path(self, name: str) -> str:
+        """Path reported by parsers built from an entry (not a real file)"""
+        return os.path.join(self.acd_path, name)
+
+    def get_ini(self, name: str) -> Optional['IniParser']:
+        """IniParser over an entry, or None if the entry is missing"""
+        from core.ini_parser import IniParser
+        if name not in self._index:
+            return None
+        return IniParser.from_string(self.read_text(name), self._virtual_path(name))
+
+    def get_lut(self, name: str) -> Optional['LUTCurve']:
+        """LUTCurve over an entry, or None if the entry is missing"""
+        from core.lut_parser import LUTCurve
+        if name not in self._index:
+            return None
+        return LUTCurve.from_string(self.read_text(name), self._virtual_path(name))
+
+    def get_rto(self, name: str) -> Optional['RTOParser']:
+        """RTOParser over an entry, or None if the entry is missing"""
+        from core.rto_parser import RTOParser
+        if name not in self._index:
+            return None
+        return RTOParser.from_string(self.read_text(name), self._virtual_path(name))
+
+    def read_all(self) -> Dict[str, bytes]:
+        """Decrypt every entry (archive order)"""
+        pending = [name for name in self._index if name not in self._cache]
+        if pending:
+            self._decode_entries(pending)
+        return {name: self._cache[name] for name in self._index}
+
+
+def read_acd(acd_path: str, folder_name: Optional[str] = None) -> Dict[str, bytes]:
+    """
+    Decrypt every entry of a data.acd file into memory.
+
+    Args:
+        acd_path: Path to data.acd
+        folder_name: Car folder name used for the key (defaults to the
+                     folder containing acd_path)
+
+    Returns:
+        Mapping of entry name -> decrypted content, in archive order
+    """
+    return AcdArchive(acd_path, folder_name).read_all()
+
+
+def extract_acd(acd_path: str, output_dir: str, folder_name: Optional[str] = None) -> List[str]:
+    """
+    Extract a data.acd file to a folder (native replacement for quickBMS).
+
+    Args:
+        acd_path: Path to data.acd
+        output_dir: Destination folder (created if missing, files overwritten)
+        folder_name: Car folder name used for the key (defaults to the
+                     folder containing acd_path)
+
+    Returns:
+        List of extracted file names
+    """
+    entries = read_acd(acd_path, folder_name)
+    os.makedirs(output_dir, exist_ok=True)
+    root = os.path.abspath(output_dir)
+
+    for name, content in entries.items():
+        out_path = os.path.abspath(os.path.join(root, name))
+        # Refuse entry names that would escape the output folder
+        if os.path.commonpath([root, out_path]) != root:
+            raise ValueError(f"Refusing to extract entry outside output folder: {name}")
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        with open(out_path, 'wb') as f:
+            f.write(content)
+
+    return list(entries)
+
+
+# Sidecar written next to data.acd by pack_acd(); lets the next incremental
+# pack tell which files changed without decrypting the previous archive.
+MANIFEST_SUFFIX = '.manifest.json'
+_MANIFEST_VERSION = 1
+
+
+def _list_pack_files(data_dir: str) -> List[str]:
+    """
+    Files that go into data.acd: top-level files of data/, minus .bak backups.
+
+    Sorted like an NTFS directory listing (upper-cased compare, so
+    'suspensions.ini' < 'suspension_graphics.ini'), which is the order
+    found in Kunos/modder archives.
+    """
+    return sorted(
+        (name for name in os.listdir(data_dir)
+         if not name.endswith('.bak') and os.path.isfile(os.path.join(data_dir, name))),
+        key=str.upper
+    )
+
+
+def _load_manifest(acd_path: str, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the pack manifest if it still describes the data.acd on disk.
+
+    Returns None when the manifest is missing, unreadable, from another key
+    (folder renamed) or when data.acd was replaced since the last pack.
+    """
+    manifest_path = acd_path + MANIFEST_SUFFIX
+    if not os.path.exists(manifest_path) or not os.path.exists(acd_path):
+        return None
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        st = os.stat(acd_path)
+        if (manifest.get('version') != _MANIFEST_VERSION
+                or manifest.get('key') != key
+                or manifest.get('acd_size') != st.st_size
+                or manifest.get('acd_mtime_ns') != st.st_mtime_ns):
+            return None
+        return manifest
+    except (OSError, ValueError) as e:
+        print(f"Ignoring pack manifest {manifest_path}: {e}")
+        return None
+
+
+def pack_acd(data_dir: str, acd_path: str, folder_name: Optional[str] = None,
+             incremental: bool = False) -> Dict[str, int]:
+    """
+    Pack a data/ folder into data.acd (legacy layout without the -1111 header,
+    which both AC and tools/assetto_corsa_acd.bms read).
+
+    The archive is streamed to a temporary file and moved over acd_path at
+    the end, so a failed pack never leaves a truncated data.acd behind.
+
+    In incremental mode, files whose size/mtime (or, failing that, SHA-1)
+    match the manifest of the previous pack are copied verbatim from the old
+    archive; only changed or new files are re-encrypted.
+
+    Args:
+        data_dir: Folder with the plaintext files
+        acd_path: Destination data.acd
+        folder_name: Car folder name used for the key (defaults to the
+                     folder containing acd_path)
+        incremental: Reuse unchanged entries of the existing data.acd
+
+    Returns:
+        Dictionary with 'entries', 'encrypted' and 'copied' counts
+
+    Raises:
+        ValueError: If a file name cannot be stored (names are Latin-1) or
+                    the previous archive is corrupt; data.acd is left as is
+    """
+    folder_name = folder_name or _default_folder_name(acd_path)
+    key = generate_acd_key(folder_name)
+    names = _list_pack_files(data_dir)
+
+    # Check every name before writing anything, so all offenders are reported at once
+    encoded_names: Dict[str, bytes] = {}
+    errors = []
+    for name in names:
+        try:
+            encoded_names[name] = name.encode('latin-1')
+        except UnicodeEncodeError as e:
+            errors.append(e)
+    if errors:
+        raise ValueError(
+            "File names not representable in data.acd: "
+            + "; ".join(f"{e.object!r} ({e})" for e in errors)
+        ) from errors[0]
+
+    manifest = _load_manifest(acd_path, key) if incremental else None
+    old_entries = manifest['entries'] if manifest else {}
+    old_index: Dict[str, Tuple[int, int]] = {}
+    old_file = None
+
+    stats = {'entries': 0, 'encrypted': 0, 'copied': 0}
+    new_entries: Dict[str, Dict[str, Any]] = {}
+    tmp_path = acd_path + '.tmp'
+
+    try:
+        if old_entries:
+            old_file = open(acd_path, 'rb')
+            old_index = {name: (offset, size) for name, offset, size in iter_acd_entries(old_file)}
+
+        with open(tmp_path, 'wb') as out:
+            for name in names:
+                path = os.path.join(data_dir, name)
+                st = os.stat(path)
+                record = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+                previous = old_entries.get(name)
+                reusable = (previous is not None and name in old_index
+                            and old_index[name][1] == st.st_size)
+
+                raw = None
+                if reusable and (previous['size'], previous['mtime_ns']) == (st.st_size, st.st_mtime_ns):
+                    record['sha1'] = previous['sha1']
+                else:
+                    with open(path, 'rb') as f:
+                        content = f.read()
+                    record['sha1'] = hashlib.sha1(content).hexdigest()
+                    if not (reusable and previous['sha1'] == record['sha1']):
+                        raw = encode_entry(content, key)
+
+                if raw is None:
+                    offset, size = old_index[name]
+                    old_file.seek(offset)
+                    raw = old_file.read(size * 4)
+                    stats['copied'] += 1
+                else:
+                    stats['encrypted'] += 1
+
+                encoded_name = encoded_names[name]
+                out.write(struct.pack('<I', len(encoded_name)))
+                out.write(encoded_name)
+                out.write(struct.pack('<I', len(raw) // 4))
+                out.write(raw)
+                new_entries[name] = record
+                stats['entries'] += 1
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        if old_file is not None:
+            old_file.close()
+
+    os.replace(tmp_path, acd_path)
+
+    st = os.stat(acd_path)
+    manifest = {
+        'version': _MANIFEST_VERSION,
+        'key': key,
+        'acd_size': st.st_size,
+        'acd_mtime_ns': st.st_mtime_ns,
+        'entries': new_entries,
+    }
+    try:
+        with open(acd_path + MANIFEST_SUFFIX, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+    except OSError as e:
+        # Only costs a full re-encrypt next time
+        print(f"Could not write pack manifest: {e}")
+
+    return stats
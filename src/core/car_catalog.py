@@ -0,0 +1,328 @@
+"""
+Persistent car catalog backed by SQLite.
+
+Caches, per car folder, what the main window needs to list and describe a
+car (ui_car.json name, brand, tags, description, author and specs, data/
+and data.acd presence, preview path and key physics numbers), so startup
+does not re-read every ui_car.json and re-probe every preview on each
+launch.
+
+A refresh lists the cars folder with os.scandir() and compares a cheap
+stat signature per car (mtimes of the car folder, data/, data.acd and
+ui/ui_car.json) with the stored one; only cars whose signature changed are
+re-read. Edits made through the editor should call invalidate()/refresh_car()
+since saving a file inside data/ does not change those mtimes.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Callable, Dict, List, Optional
+
+from core.car_file_manager import CarFileManager
+
+
+class CarCatalog:
+    """SQLite cache of car metadata with incremental mtime-based refresh"""
+
+    # Bump when columns change: the cars table is a cache and gets rebuilt
+    SCHEMA_VERSION = 2
+
+    _COLUMNS = (
+        'name', 'signature', 'display_name', 'brand', 'tags',
+        'description', 'author', 'specs',
+        'has_data', 'has_acd', 'preview_path',
+        'physics_source', 'total_mass', 'limiter',
+        'peak_torque', 'peak_torque_rpm', 'turbo', 'gears',
+    )
+
+    def __init__(self, db_path: str, cars_path: str):
+        """
+        Open (or create) the catalog database
+
+        Args:
+            db_path: Path to the SQLite file (':memory:' for a throwaway catalog)
+            cars_path: Path to AC cars folder
+        """
+        self.db_path = db_path
+        self.cars_path = cars_path
+        self.car_manager = CarFileManager(cars_path)
+        # Several installs can share one database; rows are keyed by root.
+        # Each thread must open its own CarCatalog (sqlite3 connections are
+        # bound to the thread that created them).
+        self.root = os.path.normcase(os.path.abspath(cars_path))
+
+        if db_path != ':memory:' and os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=10)
+        self.conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        """Create tables, rebuilding the cache on schema version change"""
+        cur = self.conn.cursor()
+        cur.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = cur.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is None or row['value'] != str(self.SCHEMA_VERSION):
+            cur.execute("DROP TABLE IF EXISTS cars")
+            cur.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                        (str(self.SCHEMA_VERSION),))
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS cars (
+                root TEXT NOT NULL,
+                name TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                display_name TEXT,
+                brand TEXT,
+                tags TEXT,
+                description TEXT,
+                author TEXT,
+                specs TEXT,
+                has_data INTEGER,
+                has_acd INTEGER,
+                preview_path TEXT,
+                physics_source TEXT,
+                total_mass REAL,
+                limiter INTEGER,
+                peak_torque REAL,
+                peak_torque_rpm REAL,
+                turbo INTEGER,
+                gears INTEGER,
+                PRIMARY KEY (root, name)
+            )
+        """)
+        self.conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    @staticmethod
+    def _mtime_ns(path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def _signature(self, car_path: str, dir_mtime_ns: int) -> str:
+        """Cheap change signature for one car folder (stats only, no reads)"""
+        acd_path = os.path.join(car_path, 'data.acd')
+        try:
+            acd_st = os.stat(acd_path)
+            acd_part = f"{acd_st.st_mtime_ns}/{acd_st.st_size}"
+        except OSError:
+            acd_part = "0"
+        return ':'.join((
+            str(dir_mtime_ns),
+            str(self._mtime_ns(os.path.join(car_path, 'data'))),
+            acd_part,
+            str(self._mtime_ns(os.path.join(car_path, 'ui', 'ui_car.json'))),
+        ))
+
+    def _read_car(self, name: str, signature: str) -> tuple:
+        """Read one car from disk into a row tuple (in _COLUMNS order)"""
+        info = self.car_manager.get_car_info(name)
+        physics = self.car_manager.get_physics_summary(name)
+        turbo = physics['turbo']
+        return (
+            name, signature, info['display_name'], info['brand'],
+            json.dumps(info['tags']),
+            info['description'], info['author'], json.dumps(info['specs']),
+            int(info['has_data_folder']), int(info['has_data_acd']),
+            self.car_manager.get_car_preview_path(name),
+            physics['source'], physics['total_mass'], physics['limiter'],
+            physics['peak_torque'], physics['peak_torque_rpm'],
+            None if turbo is None else int(turbo), physics['gears'],
+        )
+
+    def _store(self, rows: List[tuple]):
+        placeholders = ', '.join('?' * (len(self._COLUMNS) + 1))
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO cars (root, {', '.join(self._COLUMNS)}) VALUES ({placeholders})",
+            [(self.root,) + row for row in rows]
+        )
+
+    def refresh(self, progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None,
+                batch_callback: Optional[Callable[[List[str]], None]] = None,
+                batch_size: int = 200) -> Dict[str, int]:
+        """
+        Bring the catalog in sync with the cars folder
+
+        Args:
+            progress_callback: Called as (done, total, car_name) for each car
+                               that had to be re-read
+            is_cancelled: Polled while listing and between re-read cars; when it
+                          returns True the refresh stops (cars re-read so far are
+                          kept, nothing is removed)
+            batch_callback: Called with lists of car names as soon as their
+                            records are up to date in the database, so a caller
+                            can populate a list while the scan is running
+            batch_size: Maximum number of names per batch_callback call
+
+        Returns:
+            Dictionary with 'added', 'updated', 'removed' and 'unchanged' counts,
+            plus 'cancelled' (bool)
+        """
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0, 'cancelled': False}
+        known = {
+            row['name']: row['signature']
+            for row in self.conn.execute("SELECT name, signature FROM cars WHERE root = ?", (self.root,))
+        }
+
+        if not os.path.isdir(self.cars_path):
+            return stats
+
+        seen = set()
+        changed = []
+        pending = []
+        try:
+            with os.scandir(self.cars_path) as it:
+                for entry in it:
+                    if is_cancelled and is_cancelled():
+                        stats['cancelled'] = True
+                        break
+                    if not entry.is_dir():
+                        continue
+                    seen.add(entry.name)
+                    # DirEntry.stat() is served from the directory listing on Windows
+                    signature = self._signature(entry.path, entry.stat().st_mtime_ns)
+                    if known.get(entry.name) == signature:
+                        stats['unchanged'] += 1
+                        pending.append(entry.name)
+                        if batch_callback and len(pending) >= batch_size:
+                            batch_callback(pending)
+                            pending = []
+                    else:
+                        changed.append((entry.name, signature))
+        except OSError as e:
+            print(f"Error listing cars: {e}")
+            return stats
+
+        if batch_callback and pending:
+            batch_callback(pending)
+        if stats['cancelled']:
+            # A partial listing says nothing about which cars were removed
+            return stats
+
+        removed = [name for name in known if name not in seen]
+        if removed:
+            self.conn.executemany("DELETE FROM cars WHERE root = ? AND name = ?",
+                                  [(self.root, name) for name in removed])
+            stats['removed'] = len(removed)
+            self.conn.commit()
+
+        rows = []
+        for i, (name, signature) in enumerate(sorted(changed)):
+            if is_cancelled and is_cancelled():
+                stats['cancelled'] = True
+                break
+            rows.append(self._read_car(name, signature))
+            stats['updated' if name in known else 'added'] += 1
+            if progress_callback:
+                progress_callback(i + 1, len(changed), name)
+            if len(rows) >= batch_size:
+                self._flush(rows, batch_callback)
+                rows = []
+
+        self._flush(rows, batch_callback)
+        return stats
+
+    def _flush(self, rows: List[tuple], batch_callback: Optional[Callable[[List[str]], None]]):
+        """Commit re-read rows so other connections see them, then report them"""
+        if not rows:
+            return
+        self._store(rows)
+        self.conn.commit()
+        if batch_callback:
+            batch_callback([row[0] for row in rows])
+
+    def refresh_car(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Re-read one car now (e.g. after it was edited or unpacked)
+
+        Args:
+            name: Car folder name
+
+        Returns:
+            Updated car record, or None if the folder no longer exists
+        """
+        car_path = self.car_manager.get_car_path(name)
+        if not os.path.isdir(car_path):
+            self.conn.execute("DELETE FROM cars WHERE root = ? AND name = ?", (self.root, name))
+            self.conn.commit()
+            return None
+        signature = self._signature(car_path, self._mtime_ns(car_path))
+        self._store([self._read_car(name, signature)])
+        self.conn.commit()
+        return self.get_car(name)
+
+    def invalidate(self, name: str):
+        """Force a car to be re-read on the next refresh()"""
+        self.conn.execute("UPDATE cars SET signature = '' WHERE root = ? AND name = ?",
+                          (self.root, name))
+        self.conn.commit()
+
+    @staticmethod
+    def _row_to_record(row: sqlite3.Row) -> Dict[str, Any]:
+        """Shape a row like CarFileManager.get_car_info() + preview/physics"""
+        turbo = row['turbo']
+        return {
+            'name': row['name'],
+            'display_name': row['display_name'] or row['name'],
+            'brand': row['brand'] or '',
+            'tags': json.loads(row['tags'] or '[]'),
+            'description': row['description'] or '',
+            'author': row['author'] or '',
+            'specs': json.loads(row['specs'] or '{}'),
+            'has_data_folder': bool(row['has_data']),
+            'has_data_acd': bool(row['has_acd']),
+            'preview_path': row['preview_path'],
+            'physics': {
+                'source': row['physics_source'],
+                'total_mass': row['total_mass'],
+                'limiter': row['limiter'],
+                'peak_torque': row['peak_torque'],
+                'peak_torque_rpm': row['peak_torque_rpm'],
+                'turbo': None if turbo is None else bool(turbo),
+                'gears': row['gears'],
+            },
+        }
+
+    def get_car(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached record for one car
+
+        Args:
+            name: Car folder name
+
+        Returns:
+            Dictionary with the get_car_info() keys plus 'preview_path'
+            and 'physics', or None if not in the catalog
+        """
+        row = self.conn.execute("SELECT * FROM cars WHERE root = ? AND name = ?",
+                                (self.root, name)).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def get_cars(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Cached records for several cars at once (unknown names are skipped)"""
+        records = []
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT * FROM cars WHERE root = ? AND name IN ({', '.join('?' * len(chunk))})",
+                [self.root] + list(chunk)
+            )
+            records.extend(self._row_to_record(row) for row in rows)
+        return records
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """All cached car records, sorted by folder name"""
+        rows = self.conn.execute("SELECT * FROM cars WHERE root = ? ORDER BY name", (self.root,))
+        return [self._row_to_record(row) for row in rows]
+
+    def get_car_names(self) -> List[str]:
+        """All cached car folder names, sorted"""
+        rows = self.conn.execute("SELECT name FROM cars WHERE root = ? ORDER BY name", (self.root,))
+        return [row['name'] for row in rows]
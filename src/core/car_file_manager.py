@@ -5,11 +5,41 @@ Car File Manager for handling Assetto Corsa car files and folders
 import os
 import sys
 import shutil
-import subprocess
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable
 from datetime import datetime
 
+from core.acd_archive import AcdArchive, extract_acd, pack_acd
+from core.ini_parser import IniParser
+from core.lut_parser import LUTCurve
+
+
+def _bulk_unpack_worker(car_path: str, car_name: str, delete_acd: bool) -> int:
+    """
+    Unpack one car in a worker process (must be module-level to be picklable).
+
+    Raises on failure so the parent gets the error message from the future.
+
+    Returns:
+        Number of extracted files
+    """
+    acd_path = os.path.join(car_path, 'data.acd')
+    data_path = os.path.join(car_path, 'data')
+    bak_path = acd_path + '.bak'
+    # Never replace an earlier backup; fail before touching anything instead
+    if delete_acd and os.path.exists(bak_path):
+        raise FileExistsError(f"{bak_path} already exists")
+    extracted = extract_acd(acd_path, data_path, folder_name=car_name)
+    if not extracted:
+        raise ValueError("archive is empty")
+    # Overwriting files in place leaves the folder mtime alone; touch it so
+    # is_unpack_up_to_date() sees this unpack
+    os.utime(data_path)
+    if delete_acd:
+        os.rename(acd_path, bak_path)
+    return len(extracted)
+
 
 class CarFileManager:
     """Manages Assetto Corsa car files and folders"""
@@ -110,6 +140,10 @@ class CarFileManager:
             'has_data_acd': self.has_data_acd(car_name),
             'display_name': car_name,
             'brand': '',
+            'tags': [],
+            'description': '',
+            'author': '',
+            'specs': {},
         }
         
         # Try to get display name from ui_car.json
@@ -122,6 +156,13 @@ class CarFileManager:
                 ui_data = json.loads(content, strict=False)
                 info['display_name'] = ui_data.get('name', car_name)
                 info['brand'] = ui_data.get('brand', '')
+                tags = ui_data.get('tags', [])
+                info['tags'] = [str(t) for t in tags] if isinstance(tags, list) else []
+                info['description'] = str(ui_data.get('description', '') or '')
+                info['author'] = str(ui_data.get('author', '') or '')
+                specs = ui_data.get('specs', {})
+                if isinstance(specs, dict):
+                    info['specs'] = {str(k): str(v) for k, v in specs.items()}
             except Exception as e:
                 print(f"Error reading ui_car.json: {e}")
         
@@ -166,6 +207,98 @@ class CarFileManager:
 
         return None
     
+    def open_data_acd(self, car_name: str) -> Optional[AcdArchive]:
+        """
+        Open a car's data.acd for random-access reading (nothing is extracted)
+        
+        Args:
+            car_name: Car folder name
+            
+        Returns:
+            AcdArchive, or None if there is no readable data.acd
+        """
+        acd_path = os.path.join(self.get_car_path(car_name), 'data.acd')
+        if not os.path.exists(acd_path):
+            return None
+        try:
+            return AcdArchive(acd_path, folder_name=car_name)
+        except Exception as e:
+            print(f"Error reading data.acd for {car_name}: {e}")
+            return None
+    
+    def get_physics_summary(self, car_name: str) -> Dict[str, Any]:
+        """
+        Read key physics numbers for the info panel / catalog.
+        
+        Uses the unpacked data/ folder when present (that is what AC loads),
+        otherwise decodes only the needed entries from data.acd.
+        
+        Args:
+            car_name: Car folder name
+            
+        Returns:
+            Dictionary with 'source' ('data', 'acd' or None), 'total_mass',
+            'limiter', 'peak_torque', 'peak_torque_rpm', 'turbo', 'gears'.
+            Values that cannot be read are None.
+        """
+        summary = {
+            'source': None,
+            'total_mass': None,
+            'limiter': None,
+            'peak_torque': None,
+            'peak_torque_rpm': None,
+            'turbo': None,
+            'gears': None,
+        }
+        
+        if self.has_data_folder(car_name):
+            summary['source'] = 'data'
+            data_path = self.get_car_data_path(car_name)
+            
+            def get_ini(name):
+                path = os.path.join(data_path, name)
+                return IniParser(path) if os.path.exists(path) else None
+            
+            def get_lut(name):
+                path = os.path.join(data_path, name)
+                return LUTCurve(path) if os.path.exists(path) else None
+        else:
+            archive = self.open_data_acd(car_name)
+            if archive is None:
+                return summary
+            summary['source'] = 'acd'
+            get_ini = archive.get_ini
+            get_lut = archive.get_lut
+        
+        def as_number(parser, section, key, cast):
+            try:
+                value = parser.get_value(section, key) if parser else None
+                return cast(float(value)) if value else None
+            except (TypeError, ValueError):
+                return None
+        
+        try:
+            car_ini = get_ini('car.ini')
+            summary['total_mass'] = as_number(car_ini, 'BASIC', 'TOTALMASS', float)
+            
+            engine_ini = get_ini('engine.ini')
+            summary['limiter'] = as_number(engine_ini, 'ENGINE_DATA', 'LIMITER', int)
+            if engine_ini:
+                summary['turbo'] = engine_ini.has_section('TURBO_0')
+            
+            drivetrain_ini = get_ini('drivetrain.ini')
+            summary['gears'] = as_number(drivetrain_ini, 'GEARS', 'COUNT', int)
+            
+            power_lut = get_lut('power.lut')
+            if power_lut and len(power_lut):
+                rpm, torque = max(power_lut.get_points(), key=lambda p: p[1])
+                summary['peak_torque'] = torque
+                summary['peak_torque_rpm'] = rpm
+        except Exception as e:
+            print(f"Error reading physics summary for {car_name}: {e}")
+        
+        return summary
+    
     def create_backup(self, car_name: str, backup_dir: str = 'backups') -> Optional[str]:
         """
         Create backup of car data folder
@@ -369,7 +502,10 @@ class CarFileManager:
     
     def unpack_data_acd(self, car_name: str, delete_acd: bool = True) -> bool:
         """
-        Unpack data.acd file using quickBMS
+        Unpack data.acd file with the built-in decoder (see core.acd_archive).
+
+        The decryption key is derived from the car folder name, exactly as
+        tools/assetto_corsa_acd.bms does, so no external process is needed.
         
         Args:
             car_name: Car folder name
@@ -384,49 +520,178 @@ class CarFileManager:
             print(f"No data.acd file found for {car_name}")
             return False
         
-        # Find quickBMS executable
-        quickbms_exe = self._find_quickbms_path()
-        if not quickbms_exe:
-            print("Error: quickbms.exe not found in tools folder")
+        data_path = self.get_car_data_path(car_name)
+        
+        try:
+            extracted = extract_acd(acd_path, data_path, folder_name=car_name)
+        except Exception as e:
+            print(f"Error unpacking data.acd: {e}")
             return False
         
-        # Find quickBMS script
-        quickbms_script = self._find_quickbms_script()
-        if not quickbms_script:
-            print("Error: assetto_corsa_acd.bms script not found in tools folder")
+        if not extracted:
+            print(f"Error unpacking data.acd: archive for {car_name} is empty")
             return False
+        # Mark data/ as newer than data.acd (see is_unpack_up_to_date)
+        os.utime(data_path)
         
-        # Create data folder if it doesn't exist
-        data_path = self.get_car_data_path(car_name)
-        os.makedirs(data_path, exist_ok=True)
+        print(f"Successfully unpacked data.acd for {car_name} ({len(extracted)} files)")
+        
+        # Delete data.acd if requested
+        if delete_acd:
+            self.delete_data_acd(car_name)
         
+        return True
+
+    def pack_data_acd(self, car_name: str, incremental: bool = True) -> Optional[Dict[str, int]]:
+        """
+        Pack the car's data/ folder into a fresh data.acd (for distributing mods).
+
+        The key is derived from the car folder name. With incremental=True,
+        entries whose files did not change since the last pack are copied
+        verbatim from the existing data.acd instead of being re-encrypted.
+        The data/ folder is left in place (AC still prefers it over data.acd).
+
+        Args:
+            car_name: Car folder name
+            incremental: Re-encrypt only files changed since the last pack
+
+        Returns:
+            Dictionary with 'entries', 'encrypted' and 'copied' counts,
+            or None on error
+        """
+        if not self.has_data_folder(car_name):
+            print(f"Car {car_name} has no data folder to pack")
+            return None
+
+        acd_path = os.path.join(self.get_car_path(car_name), 'data.acd')
         try:
-            # Run quickBMS: quickbms.exe -o script.bms data.acd output_folder
-            # -o flag overwrites existing files
-            cmd = [quickbms_exe, '-o', quickbms_script, acd_path, data_path]
-            
-            # Run quickBMS and capture output
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(quickbms_exe)
-            )
-            
-            # Check if extraction was successful
-            if result.returncode == 0:
-                print(f"Successfully unpacked data.acd for {car_name}")
-                
-                # Delete data.acd if requested
-                if delete_acd:
-                    self.delete_data_acd(car_name)
-                
-                return True
-            else:
-                print(f"Error unpacking data.acd: {result.stderr}")
-                return False
-                
+            stats = pack_acd(self.get_car_data_path(car_name), acd_path,
+                             folder_name=car_name, incremental=incremental)
         except Exception as e:
-            print(f"Error running quickBMS: {e}")
+            print(f"Error packing data.acd: {e}")
+            return None
+
+        print(f"Packed data.acd for {car_name}: {stats['entries']} files "
+              f"({stats['encrypted']} encrypted, {stats['copied']} reused)")
+        return stats
+
+    def is_unpack_up_to_date(self, car_name: str) -> bool:
+        """
+        Check if the car's data/ folder is already newer than its data.acd
+
+        Unpacking touches data/ when it finishes, so its mtime marks the
+        last unpack even when only existing files were overwritten.
+
+        Args:
+            car_name: Car folder name
+
+        Returns:
+            True if data/ exists and its mtime is newer than data.acd
+        """
+        acd_path = os.path.join(self.get_car_path(car_name), 'data.acd')
+        data_path = self.get_car_data_path(car_name)
+        try:
+            return os.path.getmtime(data_path) > os.path.getmtime(acd_path)
+        except OSError:
             return False
+
+    def get_packed_cars(self, skip_up_to_date: bool = True) -> List[str]:
+        """
+        List cars that still ship a data.acd
+
+        Args:
+            skip_up_to_date: Leave out cars whose data/ is newer than data.acd
+
+        Returns:
+            Sorted list of car folder names
+        """
+        return [
+            car for car in self.get_car_list()
+            if self.has_data_acd(car)
+            and not (skip_up_to_date and self.is_unpack_up_to_date(car))
+        ]
+
+    def unpack_all(self, car_names: Optional[List[str]] = None,
+                   max_workers: Optional[int] = None,
+                   delete_acd: bool = False,
+                   skip_up_to_date: bool = True,
+                   progress_callback: Optional[Callable[[int, int, str, str], None]] = None,
+                   is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """
+        Unpack many cars in parallel on a process pool.
+
+        Args:
+            car_names: Cars to unpack (default: every car with a data.acd)
+            max_workers: Worker processes (default: CPU count)
+            delete_acd: Rename data.acd to data.acd.bak after each unpack
+            skip_up_to_date: Skip cars whose data/ is newer than data.acd
+            progress_callback: Called as (done, total, car_name, status) after
+                               each car; status is 'unpacked', 'skipped' or
+                               'failed'
+            is_cancelled: Polled while waiting; when it returns True, cars
+                          not yet started are cancelled (running ones finish)
+
+        Returns:
+            Dictionary with 'unpacked', 'skipped' and 'cancelled' lists and
+            'failed' mapping car name -> error message
+        """
+        if car_names is None:
+            car_names = self.get_packed_cars(skip_up_to_date=False)
+
+        results: Dict[str, Any] = {'unpacked': [], 'skipped': [], 'failed': {}, 'cancelled': []}
+        total = len(car_names)
+        done = 0
+
+        def report(car_name, status):
+            nonlocal done
+            done += 1
+            if progress_callback:
+                progress_callback(done, total, car_name, status)
+
+        to_unpack = []
+        for car in car_names:
+            if not self.has_data_acd(car):
+                results['failed'][car] = "no data.acd"
+                report(car, 'failed')
+            elif skip_up_to_date and self.is_unpack_up_to_date(car):
+                results['skipped'].append(car)
+                report(car, 'skipped')
+            else:
+                to_unpack.append(car)
+
+        if not to_unpack:
+            return results
+
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(to_unpack)))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending = {
+                executor.submit(_bulk_unpack_worker, self.get_car_path(car), car, delete_acd): car
+                for car in to_unpack
+            }
+            while pending:
+                if is_cancelled and is_cancelled():
+                    for future, car in pending.items():
+                        if future.cancel():
+                            results['cancelled'].append(car)
+                    pending = {f: c for f, c in pending.items() if not f.cancelled()}
+                    is_cancelled = None  # Already cancelled; just drain running jobs
+                    if not pending:
+                        break
+
+                finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    car = pending.pop(future)
+                    try:
+                        future.result()
+                        results['unpacked'].append(car)
+                        report(car, 'unpacked')
+                    except Exception as e:
+                        results['failed'][car] = str(e) or e.__class__.__name__
+                        report(car, 'failed')
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        print(f"Bulk unpack: {len(results['unpacked'])} unpacked, {len(results['skipped'])} skipped, "
+              f"{len(results['failed'])} failed, {len(results['cancelled'])} cancelled")
+        return results
@@ -0,0 +1,246 @@
+"""
+Ranked full-text search over car metadata.
+
+CarSearchIndex is an in-memory inverted index over the fields a user is
+likely to remember about a car: the folder name, and from ui_car.json the
+name, brand, tags, description, specs and author. Mod folders are often
+cryptic (audi_A5_teamsesh ships an RS5), so searching folder names alone
+is not enough.
+
+Each query term is matched against the index vocabulary as
+- an exact token,
+- a prefix of a token (bisect over the sorted vocabulary, so "porsc"
+  finds "porsche" while typing),
+- if neither matches anything, a fuzzy match via trigram overlap (Dice
+  coefficient), to survive typos such as "lamborgini".
+
+Every term must match (AND). Per term, a car gets its best match quality
+x field weight, so a hit in the display name outranks the same word
+buried in a description; terms are then weighted by IDF (rarer terms
+count more) and summed. Per-term results are cached until the index
+changes, so typing "porsche 9", "porsche 91", ... re-scores only the last
+term. The index is built once from catalog records and then updated per
+car with add()/remove().
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Weight of a token by the field it came from (max over fields is used)
+FIELD_WEIGHTS = {
+    'name': 3.0,          # folder name
+    'display_name': 3.0,
+    'brand': 2.0,
+    'tags': 1.5,
+    'author': 1.0,
+    'specs': 0.5,
+    'description': 0.5,
+}
+
+# Match quality per kind of term/token match
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.6     # plus up to 0.4 for how much of the token is covered
+FUZZY_MATCH = 0.5      # times the trigram Dice coefficient
+
+MIN_FUZZY_LENGTH = 3   # shorter terms only match exactly or as prefix
+MIN_FUZZY_SIMILARITY = 0.5
+MAX_PREFIX_EXPANSIONS = 200
+TERM_CACHE_SIZE = 256
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens (underscores, punctuation and HTML tags split)"""
+    return _TOKEN_RE.findall(_TAG_RE.sub(' ', text).lower())
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CarSearchIndex:
+    """In-memory inverted index with prefix and trigram fuzzy matching"""
+
+    def __init__(self):
+        self._postings = {}                 # token -> {car name: field weight}
+        self._doc_tokens = {}               # car name -> set of tokens (for removal)
+        self._vocabulary = []               # sorted tokens (prefix search)
+        self._trigram_tokens = defaultdict(set)  # trigram -> tokens containing it
+        self._term_cache = OrderedDict()    # term -> {car name: score}
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._doc_tokens
+
+    # -- building ------------------------------------------------------------
+
+    @staticmethod
+    def _fields(name: str, record: Dict[str, Any]) -> Iterable[Tuple[str, str]]:
+        yield 'name', name
+        yield 'display_name', record.get('display_name') or ''
+        yield 'brand', record.get('brand') or ''
+        yield 'tags', ' '.join(record.get('tags') or [])
+        yield 'author', record.get('author') or ''
+        specs = record.get('specs') or {}
+        yield 'specs', ' '.join(str(v) for v in specs.values())
+        yield 'description', record.get('description') or ''
+
+    def add(self, name: str, record: Dict[str, Any]):
+        """
+        Index (or re-index) one car
+
+        Args:
+            name: Car folder name
+            record: Catalog record (CarCatalog.get_car() / get_car_info() shape)
+        """
+        if name in self._doc_tokens:
+            self.remove(name)
+        self._term_cache.clear()
+
+        weights = {}
+        for field, text in self._fields(name, record):
+            field_weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                if weights.get(token, 0.0) < field_weight:
+                    weights[token] = field_weight
+
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                insort(self._vocabulary, token)
+                for gram in _trigrams(token):
+                    self._trigram_tokens[gram].add(token)
+            postings[name] = weight
+        self._doc_tokens[name] = set(weights)
+
+    def remove(self, name: str):
+        """Drop one car from the index (no-op if it is not indexed)"""
+        if name in self._doc_tokens:
+            self._term_cache.clear()
+        for token in self._doc_tokens.pop(name, ()):
+            postings = self._postings[token]
+            postings.pop(name, None)
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+                for gram in _trigrams(token):
+                    tokens = self._trigram_tokens[gram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._trigram_tokens[gram]
+
+    def build(self, records: Iterable[Dict[str, Any]]):
+        """Replace the index contents with the given catalog records"""
+        self.__init__()
+        for record in records:
+            self.add(record['name'], record)
+
+    def names(self) -> List[str]:
+        return list(self._doc_tokens)
+
+    # -- querying ------------------------------------------------------------
+
+    def _candidates(self, term: str) -> Dict[str, float]:
+        """Vocabulary tokens matching term, with their match quality"""
+        matches = {}
+        if term in self._postings:
+            matches[term] = EXACT_MATCH
+
+        start = bisect_left(self._vocabulary, term)
+        for token in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not token.startswith(term):
+                break
+            if token != term:
+                matches[token] = PREFIX_MATCH + (1.0 - PREFIX_MATCH) * len(term) / len(token)
+
+        if matches or len(term) < MIN_FUZZY_LENGTH:
+            return matches
+
+        # Nothing starts with term: probably a typo, fall back to trigrams
+        grams = _trigrams(term)
+        overlap = defaultdict(int)
+        for gram in grams:
+            for token in self._trigram_tokens.get(gram, ()):
+                overlap[token] += 1
+        for token, shared in overlap.items():
+            dice = 2.0 * shared / (len(grams) + len(token) + 1)
+            if dice >= MIN_FUZZY_SIMILARITY:
+                matches[token] = FUZZY_MATCH * dice
+        return matches
+
+    def _term_scores(self, term: str) -> Dict[str, float]:
+        """Best (match quality x field weight) per car for one term, cached"""
+        scores = self._term_cache.get(term)
+        if scores is not None:
+            self._term_cache.move_to_end(term)
+            return scores
+
+        candidates = self._candidates(term)
+        if len(candidates) == 1 and candidates.get(term) == EXACT_MATCH:
+            # Common case: one exact token, the postings already are the scores
+            scores = self._postings[term]
+        else:
+            scores = {}
+            for token, quality in candidates.items():
+                for name, weight in self._postings[token].items():
+                    score = quality * weight
+                    if score > scores.get(name, 0.0):
+                        scores[name] = score
+
+        self._term_cache[term] = scores
+        if len(self._term_cache) > TERM_CACHE_SIZE:
+            self._term_cache.popitem(last=False)
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Find cars matching every term of query
+
+        Args:
+            query: Free text (e.g. "rs5 teamsesh", "porsc 911", "lamborgini")
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            List of (car name, score), best first; ties are sorted by name
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        total_docs = len(self._doc_tokens)
+        # Start from the most selective term so the intersection stays small
+        per_term = sorted((self._term_scores(term) for term in terms), key=len)
+        if not per_term[0]:
+            return []
+
+        idf = [math.log(1.0 + total_docs / len(term_scores)) for term_scores in per_term]
+        if len(per_term) == 1:
+            # Scaling by a single IDF does not change the order: apply it at the end
+            ranked = [(-s, name) for name, s in per_term[0].items()]
+        else:
+            scores = {name: s * idf[0] for name, s in per_term[0].items()}
+            for term_scores, term_idf in zip(per_term[1:], idf[1:]):
+                scores = {name: s + term_scores[name] * term_idf
+                          for name, s in scores.items() if name in term_scores}
+                if not scores:
+                    return []
+            ranked = [(-s, name) for name, s in scores.items()]
+            idf = [1.0]
+
+        # (-score, name) tuples compare in C: best first, ties by name
+        if limit is not None and limit < len(ranked):
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+        return [(name, -neg * idf[0]) for neg, name in ranked]
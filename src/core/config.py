@@ -74,6 +74,14 @@ class ConfigManager:
         """Get backup folder path"""
         return self.config.get('backup_path', 'backups')
 
+    def get_catalog_path(self):
+        """Get path to the persistent car catalog database"""
+        return self.config.get('catalog_path', 'catalog.db')
+
+    def get_thumbnail_cache_path(self):
+        """Get folder for cached preview thumbnails"""
+        return self.config.get('thumbnail_cache_path', 'thumbnails')
+
     def get_show_disclaimer(self):
         """Whether to show the startup compatibility disclaimer"""
         return self.config.get('show_disclaimer', True)
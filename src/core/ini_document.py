@@ -0,0 +1,299 @@
+"""
+Lossless, format-preserving INI document for Assetto Corsa files.
+
+configparser rewrites the whole file on save: comments, blank lines,
+spacing, BOM and line endings were lost, and code that had to keep a
+file intact (the setup.ini update in the RTO manager) hand-rolled its own
+line patcher. IniDocument never rewrites the original text. Parsing only
+records, per section, the character span of every value; edits are kept
+as patches on top of the untouched buffer:
+
+- changing an existing value replaces just that span, so the spacing
+  around '=' and the inline comment on the line survive;
+- a new key is inserted after the last key of its section;
+- a new section is appended at the end of the file.
+
+to_text() copies the original buffer with only those spans replaced, so
+saving is O(changes) beyond the copy and diffs are minimal. Text without
+edits round-trips byte for byte.
+
+Reading follows the rules IniParser already applied for AC files:
+sections and keys are case-sensitive, a value ends at the first ';' or
+'#' and is stripped. Unlike configparser there is no interpolation, no
+DEFAULT section and no multi-line values; duplicate sections are merged,
+the last of duplicate keys wins (and is the one edited), and lines that
+are not a header, KEY=VALUE, comment or blank are kept as-is and listed
+in malformed.
+
+Since values are normalized once while parsing, get_typed() only has to
+cast; the cast value is cached per (section, key, type) until the key is
+set again, so a document shared through PARSE_CACHE converts each value
+once per session.
+
+Large files (skin and cosmetic configs such as digital_instruments.ini,
+lights.ini or extension/ext_config.ini can have thousands of sections)
+are indexed lazily: one regex pass records where each section starts and
+ends, and a section's lines are only parsed the first time it is read or
+edited. Files below LAZY_THRESHOLD are parsed up front, which keeps the
+malformed-line report complete for the small physics files; for lazy
+documents malformed only covers the sections parsed so far.
+"""
+
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_LINE_RE = re.compile(r'[^\n]*\n|[^\n]+')
+# Same rule as the line parser: first non-blank character '[', name up to the first ']'
+_HEADER_RE = re.compile(r'^[^\S\n]*\[([^\]\n]+)\][^\n]*\n?', re.MULTILINE)
+
+LAZY_THRESHOLD = 64 * 1024   # characters; larger documents parse sections on demand
+
+# Casts accepted by get_typed(); AC writes integers as "1.00", so int goes through float
+_CASTS = {
+    int: lambda value: int(float(value)),
+    float: float,
+    bool: lambda value: float(value) != 0.0,
+    str: str,
+}
+
+
+class IniDocument:
+    """Parsed view of INI text that records edits as span patches"""
+
+    def __init__(self, text: str = '', lazy: Optional[bool] = None):
+        """
+        Args:
+            text: INI file content (BOM already removed)
+            lazy: Parse sections on first access (default: only for text
+                  longer than LAZY_THRESHOLD)
+        """
+        self._text = text
+        newline_at = text.find('\n')
+        if newline_at == -1:
+            self.newline = os.linesep
+        else:
+            self.newline = '\r\n' if text[newline_at - 1:newline_at] == '\r' else '\n'
+        self.malformed: List[Tuple[int, str]] = []   # (line number, line) kept verbatim
+        # section -> [(body start, body end)], one per header occurrence
+        self._ranges: Dict[str, List[Tuple[int, int]]] = {}
+        self._order: List[str] = []             # section names, first appearance order
+        # Parsed sections: section -> key -> (value start, value end, value);
+        # start is None for added keys
+        self._sections: Dict[str, Dict[str, Tuple[Optional[int], Optional[int], str]]] = {}
+        self._anchors: Dict[str, int] = {}      # section -> offset after its last key line
+        self._patches: Dict[int, Tuple[int, str]] = {}  # value start -> (value end, new value)
+        self._added: Dict[str, Dict[str, str]] = {}     # section -> new keys, in order
+        self._typed: Dict[Tuple[str, str], Dict[type, Any]] = {}  # cast cache
+        if lazy is None:
+            lazy = len(text) > LAZY_THRESHOLD
+        if lazy:
+            self._index()
+        else:
+            self._parse_lines(0, len(text))
+
+    def _index(self):
+        """Record the body range of every section header (one regex pass)"""
+        text = self._text
+        ranges = self._ranges
+        previous = None
+        body_start = 0
+        for match in _HEADER_RE.finditer(text):
+            if previous is None:
+                self._parse_lines(0, match.start())   # keys before any header
+            else:
+                ranges[previous].append((body_start, match.start()))
+            previous = match.group(1)
+            if previous not in ranges:
+                ranges[previous] = []
+                self._order.append(previous)
+            body_start = match.end()
+        if previous is None:
+            self._parse_lines(0, len(text))
+        else:
+            ranges[previous].append((body_start, len(text)))
+
+    def _section(self, section: str):
+        """Entries of a section, parsing it on first access (None if missing)"""
+        entries = self._sections.get(section)
+        if entries is None and section in self._ranges:
+            entries = self._sections[section] = {}
+            for start, end in self._ranges[section]:
+                self._anchors[section] = start
+                self._parse_lines(start, end, section)
+        return entries
+
+    def _parse_lines(self, start: int, end: int, section: Optional[str] = None):
+        """Parse text[start:end] (headers, KEY=VALUE lines) into self._sections"""
+        text = self._text
+        entries = self._sections.get(section)
+        counted_to, number = 0, 1   # line numbers only needed for malformed lines
+        for match in _LINE_RE.finditer(text, start, end):
+            line = match.group()
+            stripped = line.strip()
+            if not stripped or stripped[0] in ';#':
+                continue
+            line_start = match.start()
+
+            if stripped[0] == '[':
+                close = stripped.find(']')
+                if close > 1:
+                    section = stripped[1:close]
+                    entries = self._sections.get(section)
+                    if entries is None:
+                        entries = self._sections[section] = {}
+                        self._order.append(section)
+                    self._anchors[section] = match.end()
+                    continue
+
+            eq = line.find('=')
+            key = line[:eq].strip() if eq != -1 else ''
+            if entries is None or not key:
+                number += text.count('\n', counted_to, line_start)
+                counted_to = line_start
+                self.malformed.append((number, line.rstrip('\r\n')))
+                continue
+
+            value_start = eq + 1
+            while value_start < len(line) and line[value_start] in ' \t':
+                value_start += 1
+            value_end = len(line)
+            for prefix in (';', '#'):
+                idx = line.find(prefix, value_start)
+                if idx != -1 and idx < value_end:
+                    value_end = idx
+            while value_end > value_start and line[value_end - 1] in ' \t\r\n':
+                value_end -= 1
+
+            entries[key] = (line_start + value_start, line_start + value_end,
+                            line[value_start:value_end])
+            self._anchors[section] = match.end()
+
+    def copy(self) -> 'IniDocument':
+        """Independent copy (the original text is shared, edits are not)"""
+        other = IniDocument.__new__(IniDocument)
+        other._text = self._text
+        other.newline = self.newline
+        other.malformed = list(self.malformed)
+        other._ranges = self._ranges
+        other._order = list(self._order)
+        other._sections = {name: dict(entries) for name, entries in self._sections.items()}
+        other._anchors = dict(self._anchors)
+        other._patches = dict(self._patches)
+        other._added = {name: dict(keys) for name, keys in self._added.items()}
+        other._typed = {key: dict(casts) for key, casts in self._typed.items()}
+        return other
+
+    # -- reading -------------------------------------------------------------
+
+    def sections(self) -> List[str]:
+        return list(self._order)
+
+    def has_section(self, section: str) -> bool:
+        return section in self._ranges or section in self._sections
+
+    def get(self, section: str, key: str) -> Optional[str]:
+        """Value with inline comment removed, or None if missing"""
+        entry = (self._section(section) or {}).get(key)
+        return None if entry is None else entry[2]
+
+    def items(self, section: str) -> Dict[str, str]:
+        """All key/value pairs of a section ({} if missing)"""
+        return {key: entry[2] for key, entry in (self._section(section) or {}).items()}
+
+    def get_typed(self, section: str, key: str, kind: type) -> Any:
+        """
+        Value cast to kind, cached until the key is set again
+
+        Args:
+            section: Section name
+            key: Key name
+            kind: int (accepts "1.00"), float, bool (numeric, non-zero) or str
+
+        Returns:
+            Cast value, or None if the key is missing or not castable
+        """
+        casts = self._typed.get((section, key))
+        if casts is None:
+            casts = self._typed[(section, key)] = {}
+        elif kind in casts:
+            return casts[kind]
+
+        entry = (self._section(section) or {}).get(key)
+        value = None
+        if entry is not None:
+            try:
+                value = _CASTS[kind](entry[2])
+            except (ValueError, OverflowError):
+                pass
+        casts[kind] = value
+        return value
+
+    # -- editing -------------------------------------------------------------
+
+    def set(self, section: str, key: str, value: str):
+        """
+        Set a value, adding the key or section if needed
+
+        Args:
+            section: Section name
+            key: Key name
+            value: New value (written verbatim)
+        """
+        entries = self._section(section)
+        if entries is None:
+            entries = self._sections[section] = {}
+            self._order.append(section)
+        entry = entries.get(key)
+        if entry is not None and entry[2] == value:
+            return
+        self._typed.pop((section, key), None)
+        if entry is not None and entry[0] is not None:
+            start, end, _old = entry
+            self._patches[start] = (end, value)
+            entries[key] = (start, end, value)
+        else:
+            self._added.setdefault(section, {})[key] = value
+            entries[key] = (None, None, value)
+
+    def is_modified(self) -> bool:
+        return bool(self._patches or self._added)
+
+    def to_text(self) -> str:
+        """Original text with the edited spans replaced and new keys inserted"""
+        if not self._patches and not self._added:
+            return self._text
+
+        text = self._text
+        nl = self.newline
+        # (offset, order, end, replacement): order puts a value patch before
+        # an insertion at the same offset (empty value on an unterminated last line)
+        ops = [(start, 0, end, value) for start, (end, value) in self._patches.items()]
+        tail = []
+        for section, keys in self._added.items():
+            lines = ''.join(f"{key}={value}{nl}" for key, value in keys.items())
+            anchor = self._anchors.get(section)
+            if anchor is None:
+                tail.append(f"[{section}]{nl}{lines}")
+                continue
+            if anchor > 0 and text[anchor - 1] != '\n':
+                lines = nl + lines
+            ops.append((anchor, 1, anchor, lines))
+        ops.sort()
+
+        pieces = []
+        pos = 0
+        for start, _order, end, replacement in ops:
+            pieces.append(text[pos:start])
+            pieces.append(replacement)
+            pos = end
+        pieces.append(text[pos:])
+        result = ''.join(pieces)
+
+        for block in tail:
+            if result:
+                if not result.endswith('\n'):
+                    result += nl
+                result += nl   # blank line before a new section
+            result += block
+        return result
@@ -2,51 +2,130 @@
 INI File Parser for Assetto Corsa car configuration files
 """
 
-import configparser
+import codecs
 import os
 from typing import Dict, Any, Optional
 
+from core.ini_document import IniDocument
+from core.parse_cache import PARSE_CACHE
+
 
 class IniParser:
     """Parser for Assetto Corsa .ini configuration files"""
-    
+
     def __init__(self, file_path: str):
         """
         Initialize INI parser
-        
+
         Args:
             file_path: Path to the .ini file
         """
         self.file_path = file_path
-        self.config = configparser.ConfigParser(inline_comment_prefixes=(';', '#'))
-        self.config.optionxform = str  # Preserve case sensitivity
+        self.document = IniDocument()
+        self._bom = False     # file started with a UTF-8 BOM (written back on save)
         self._dirty = False  # True only after set_value() is called
-        
+        self._shared = False  # True while self.document is the PARSE_CACHE copy
+
         if os.path.exists(file_path):
             self.load()
-    
+
     def load(self):
         """Load INI file"""
         try:
-            self.config.read(self.file_path, encoding='utf-8-sig')
-        except configparser.ParsingError as e:
-            print(f"Error loading INI file {self.file_path}: {e}")
-            print(f"Warning: INI file contains parsing errors. The file may have malformed lines.")
-            print(f"The editor will open but this tab may not function correctly.")
-            # Don't raise - allow the application to continue with empty config
+            with open(self.file_path, 'rb') as f:
+                data = f.read()
         except Exception as e:
             print(f"Error loading INI file {self.file_path}: {e}")
             raise
-    
+        self._bom = data.startswith(codecs.BOM_UTF8)
+        if self._bom:
+            data = data[len(codecs.BOM_UTF8):]
+        # surrogateescape keeps non-UTF-8 bytes (e.g. Latin-1 comments) intact on save
+        self._set_document(IniDocument(data.decode('utf-8', 'surrogateescape')))
+
+    def load_string(self, text: str):
+        """
+        Load INI content from a string (e.g. an entry decoded from data.acd)
+
+        Args:
+            text: INI file content
+        """
+        self._set_document(IniDocument(text))
+
+    def _set_document(self, document: IniDocument):
+        self.document = document
+        self._shared = False
+        self._dirty = False
+        if document.malformed:
+            number, line = document.malformed[0]
+            print(f"Warning: INI file {self.file_path or '<string>'} has "
+                  f"{len(document.malformed)} malformed line(s), kept as-is "
+                  f"(first at line {number}: {line!r})")
+
+    @classmethod
+    def from_string(cls, text: str, file_path: str = '') -> 'IniParser':
+        """
+        Create a parser from in-memory INI content
+
+        Args:
+            text: INI file content
+            file_path: Path used for messages and by save() (optional)
+
+        Returns:
+            IniParser with the content loaded
+        """
+        parser = cls('')
+        parser.file_path = file_path
+        parser.load_string(text)
+        return parser
+
+    @classmethod
+    def cached(cls, file_path: str) -> 'IniParser':
+        """
+        Parser sharing the process-wide parsed copy of file_path
+
+        The file is only parsed if it is not in PARSE_CACHE or changed on
+        disk. The parsed content is shared until the first set_value(),
+        which gives this parser a private copy (copy-on-write), so the
+        result can be edited and saved like a parser from IniParser(path).
+
+        Args:
+            file_path: Path to the .ini file
+
+        Returns:
+            IniParser (empty if the file does not exist)
+        """
+        source = PARSE_CACHE.get(file_path, 'ini', lambda: cls(file_path))
+        parser = cls.__new__(cls)  # skip __init__: nothing to parse
+        parser.file_path = file_path
+        parser.document = source.document
+        parser._bom = source._bom
+        parser._dirty = False
+        parser._shared = True
+        return parser
+
+    def _detach(self):
+        """Replace the shared cached document with a private copy before a change"""
+        if self._shared:
+            self.document = self.document.copy()
+            self._shared = False
+
     def save(self, backup=True):
         """
         Save INI file. Does nothing if no values were changed via set_value().
 
+        Only the edited values, added keys and added sections differ from
+        the file as it was loaded; comments, spacing, line endings and the
+        BOM are kept.
+
         Args:
             backup: Create backup before saving
+
+        Returns:
+            True if the file was written, False if there was nothing to save
         """
         if not self._dirty:
-            return
+            return False
 
         if backup and os.path.exists(self.file_path):
             backup_path = self.file_path + '.bak'
@@ -55,48 +134,72 @@ class IniParser:
                 shutil.copy2(self.file_path, backup_path)
             except Exception as e:
                 print(f"Error creating backup: {e}")
-        
+
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                # space_around_delimiters=False writes KEY=VALUE (no spaces).
-                # AC requires this exact format; KEY = VALUE causes crashes.
-                self.config.write(f, space_around_delimiters=False)
+            # New keys are written as KEY=VALUE (no spaces).
+            # AC requires this exact format; KEY = VALUE causes crashes.
+            data = self.document.to_text().encode('utf-8', 'surrogateescape')
+            if self._bom:
+                data = codecs.BOM_UTF8 + data
+            with open(self.file_path, 'wb') as f:
+                f.write(data)
             self._dirty = False
+            PARSE_CACHE.invalidate(self.file_path)
+            return True
         except Exception as e:
             print(f"Error saving INI file {self.file_path}: {e}")
             raise
-    
+
     def get_value(self, section: str, key: str, default: Any = None) -> Optional[str]:
         """
         Get value from INI file
-        
+
+        AC INI files often use inline comments without preceding whitespace
+        (e.g. "LAG_UP=0.9965; some comment"); the value ends at the first
+        ';' or '#' and is stripped.
+
         Args:
             section: Section name
             key: Key name
             default: Default value if not found
-            
+
         Returns:
             Value as string or default
         """
-        try:
-            value = self.config.get(section, key)
-            if value:
-                value = value.strip()
-                # AC INI files often use inline comments without preceding whitespace
-                # (e.g. "LAG_UP=0.9965; some comment"), which configparser's
-                # inline_comment_prefixes doesn't handle. Strip them manually.
-                for prefix in (';', '#'):
-                    idx = value.find(prefix)
-                    if idx != -1:
-                        value = value[:idx].strip()
-            return value if value else value
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            return default
-    
+        value = self.document.get(section, key)
+        return default if value is None else value
+
+    def get_many(self, section: str, types: Dict[str, type],
+                 defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Get several typed values of one section at once
+
+        Values are normalized (comments stripped) when the file is parsed
+        and each cast is cached, so re-reading a value (e.g. reloading the
+        editor from a cached parser) costs a dict lookup.
+
+        Args:
+            section: Section name
+            types: {key: int | float | bool | str}; int accepts "1.00" like
+                   int(float(...)), bool is a non-zero number
+            defaults: {key: value} for missing or unparsable keys (None otherwise)
+
+        Returns:
+            {key: typed value} for every key in types
+        """
+        defaults = defaults or {}
+        get_typed = self.document.get_typed
+        result = {}
+        for key, kind in types.items():
+            value = get_typed(section, key, kind)
+            result[key] = defaults.get(key) if value is None else value
+        return result
+
     def set_value(self, section: str, key: str, value: Any):
         """
         Set value in INI file. Marks the parser dirty only if the value
-        actually differs from what is currently stored.
+        actually differs from what is currently stored; numerically equal
+        values (e.g. "0.15" vs "0.1500") leave the file untouched.
 
         Args:
             section: Section name
@@ -104,42 +207,36 @@ class IniParser:
             value: Value to set
         """
         new_str = str(value)
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-            self._dirty = True
-        else:
-            try:
-                current = self.config.get(section, key)
-            except configparser.NoOptionError:
-                current = None
-            if current != new_str:
-                # Avoid false-dirty from format differences (e.g. "0.15" vs "0.1500").
-                # If both values are numeric, compare them as floats.
-                try:
-                    if abs(float(current) - float(new_str)) > 1e-9:
-                        self._dirty = True
-                except (TypeError, ValueError):
-                    self._dirty = True
-        self.config.set(section, key, new_str)
-    
+        current = self.document.get(section, key)
+        if current == new_str:
+            return
+        # Avoid false-dirty from format differences (e.g. "0.15" vs "0.1500").
+        # If both values are numeric, compare them as floats.
+        try:
+            if abs(float(current) - float(new_str)) <= 1e-9:
+                return
+        except (TypeError, ValueError):
+            pass
+        self._detach()
+        self.document.set(section, key, new_str)
+        self._dirty = True
+
     def get_section(self, section: str) -> Dict[str, str]:
         """
         Get all key-value pairs from a section
-        
+
         Args:
             section: Section name
-            
+
         Returns:
-            Dictionary of key-value pairs
+            Dictionary of key-value pairs (inline comments removed)
         """
-        if self.config.has_section(section):
-            return dict(self.config.items(section))
-        return {}
-    
+        return self.document.items(section)
+
     def get_sections(self):
         """Get all section names"""
-        return self.config.sections()
-    
+        return self.document.sections()
+
     def has_section(self, section: str) -> bool:
         """Check if section exists"""
-        return self.config.has_section(section)
+        return self.document.has_section(section)
@@ -1,10 +1,32 @@
 """
 LUT (Lookup Table) File Parser for Assetto Corsa
 Handles .lut files containing X|Y value pairs
+
+Points are stored as two contiguous float64 NumPy arrays (x and y, in
+file order). Lookups go through a sorted view of those arrays that is
+built once after each change: interpolate() bisects it for a single
+value and interpolate_many() evaluates a whole array of x values with
+np.interp, so sampling a curve for a chart or a simulation costs one
+vectorized call instead of a Python loop of linear scans.
+
+Whether the arrays are sorted is remembered between edits, so inserting
+(add_point()) or moving (move_point()) a point on a sorted curve is a
+binary search plus a shift of the points in between, not a re-sort.
 """
 
 import os
-from typing import List, Tuple, Optional
+from bisect import bisect_left
+from typing import Iterable, List, Tuple, Optional
+
+import numpy as np
+
+from core.parse_cache import PARSE_CACHE
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
 
 
 class LUTCurve:
@@ -18,45 +40,157 @@ class LUTCurve:
             file_path: Path to .lut file (optional)
         """
         self.file_path = file_path
-        self.points: List[Tuple[float, float]] = []
+        self._x = np.empty(0, dtype=np.float64)
+        self._y = np.empty(0, dtype=np.float64)
+        # (x array, y array, x list, y list) sorted by x; None after a change
+        self._lookup = None
+        self._sorted = None  # x known to be sorted (None: not checked since the arrays changed)
         
         if file_path and os.path.exists(file_path):
             self.load()
+
+    @property
+    def points(self) -> List[Tuple[float, float]]:
+        """
+        Points as a new list of (x, y) tuples
+
+        Editing the returned list does not change the curve; assign a
+        list to points (or use update_point()) instead.
+        """
+        return list(zip(self._x.tolist(), self._y.tolist()))
+
+    @points.setter
+    def points(self, points: Iterable[Tuple[float, float]]):
+        array = np.array(list(points), dtype=np.float64).reshape(-1, 2)
+        self._x = np.ascontiguousarray(array[:, 0])
+        self._y = np.ascontiguousarray(array[:, 1])
+        self._lookup = None
+        self._sorted = None
+
+    @property
+    def x(self) -> np.ndarray:
+        """X values in file order (read-only float64 array)"""
+        return _readonly(self._x)
+
+    @property
+    def y(self) -> np.ndarray:
+        """Y values in file order (read-only float64 array)"""
+        return _readonly(self._y)
     
     def load(self):
         """Load LUT file"""
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
-            
-            self.points = []
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#') or line.startswith(';'):
-                    continue
-                
-                # Strip inline comments (; or #)
-                for comment_char in (';', '#'):
-                    comment_idx = line.find(comment_char)
-                    if comment_idx >= 0:
-                        line = line[:comment_idx].strip()
-                if not line:
-                    continue
-
-                # Parse X|Y format
-                if '|' in line:
-                    parts = line.split('|')
-                    if len(parts) == 2:
-                        try:
-                            x = float(parts[0].strip())
-                            y = float(parts[1].strip())
-                            self.points.append((x, y))
-                        except ValueError:
-                            print(f"Warning: Invalid line in LUT file: {line}")
-        
+            self._parse_lines(lines)
         except Exception as e:
             print(f"Error loading LUT file {self.file_path}: {e}")
             raise
+
+    def load_string(self, text: str):
+        """
+        Load LUT content from a string (e.g. an entry decoded from data.acd)
+
+        Args:
+            text: LUT file content
+        """
+        self._parse_lines(text.splitlines())
+
+    @classmethod
+    def from_string(cls, text: str, file_path: Optional[str] = None) -> 'LUTCurve':
+        """
+        Create a curve from in-memory LUT content
+
+        Args:
+            text: LUT file content
+            file_path: Path used by save() (optional)
+
+        Returns:
+            LUTCurve with the points loaded
+        """
+        curve = cls()
+        curve.file_path = file_path
+        curve.load_string(text)
+        return curve
+
+    @classmethod
+    def from_points(cls, points: Iterable[Tuple[float, float]],
+                    file_path: Optional[str] = None) -> 'LUTCurve':
+        """
+        Create a curve from (x, y) pairs
+
+        Args:
+            points: (x, y) pairs, kept in the given order
+            file_path: Path used by save() (optional)
+
+        Returns:
+            LUTCurve with the points set
+        """
+        curve = cls()
+        curve.file_path = file_path
+        curve.points = points
+        return curve
+
+    @classmethod
+    def cached(cls, file_path: str) -> 'LUTCurve':
+        """
+        Curve loaded through the process-wide PARSE_CACHE
+
+        The file is only parsed if it is not cached or changed on disk;
+        the returned curve has its own copy of the points, so it can be
+        edited and saved freely.
+
+        Args:
+            file_path: Path to .lut file
+
+        Returns:
+            LUTCurve (empty if the file does not exist)
+        """
+        def load():
+            source = cls(file_path)
+            return _readonly(source._x), _readonly(source._y)
+
+        x, y = PARSE_CACHE.get(file_path, 'lut', load)
+        curve = cls()
+        curve.file_path = file_path
+        curve._x = x.copy()
+        curve._y = y.copy()
+        curve._sorted = None
+        return curve
+
+    def _parse_lines(self, lines):
+        """Parse X|Y lines into the point arrays"""
+        xs = []
+        ys = []
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#') or line.startswith(';'):
+                continue
+            
+            # Strip inline comments (; or #)
+            for comment_char in (';', '#'):
+                comment_idx = line.find(comment_char)
+                if comment_idx >= 0:
+                    line = line[:comment_idx].strip()
+            if not line:
+                continue
+
+            # Parse X|Y format
+            if '|' in line:
+                parts = line.split('|')
+                if len(parts) == 2:
+                    try:
+                        x = float(parts[0].strip())
+                        y = float(parts[1].strip())
+                    except ValueError:
+                        print(f"Warning: Invalid line in LUT file: {line}")
+                        continue
+                    xs.append(x)
+                    ys.append(y)
+        self._x = np.array(xs, dtype=np.float64)
+        self._y = np.array(ys, dtype=np.float64)
+        self._lookup = None
+        self._sorted = None
     
     def save(self, file_path: Optional[str] = None, backup=True):
         """
@@ -80,8 +214,9 @@ class LUTCurve:
         
         try:
             with open(save_path, 'w', encoding='utf-8') as f:
-                for x, y in self.points:
+                for x, y in zip(self._x.tolist(), self._y.tolist()):
                     f.write(f"{x}|{y}\n")
+            PARSE_CACHE.invalidate(save_path)
         except Exception as e:
             print(f"Error saving LUT file {save_path}: {e}")
             raise
@@ -94,8 +229,16 @@ class LUTCurve:
             x: X value
             y: Y value
         """
-        self.points.append((x, y))
-        self.sort_points()
+        if self._is_sorted():
+            # After existing points with the same x, like append + stable sort
+            index = int(np.searchsorted(self._x, x, side='right'))
+            self._x = np.insert(self._x, index, x)
+            self._y = np.insert(self._y, index, y)
+            self._lookup = None
+        else:
+            self._x = np.append(self._x, x)
+            self._y = np.append(self._y, y)
+            self.sort_points()
     
     def remove_point(self, index: int):
         """
@@ -104,8 +247,10 @@ class LUTCurve:
         Args:
             index: Index of point to remove
         """
-        if 0 <= index < len(self.points):
-            self.points.pop(index)
+        if 0 <= index < len(self._x):
+            self._x = np.delete(self._x, index)
+            self._y = np.delete(self._y, index)
+            self._lookup = None
     
     def update_point(self, index: int, x: float, y: float):
         """
@@ -116,17 +261,79 @@ class LUTCurve:
             x: New X value
             y: New Y value
         """
-        if 0 <= index < len(self.points):
-            self.points[index] = (x, y)
-            self.sort_points()
+        self.move_point(index, x, y)
+
+    def move_point(self, index: int, x: float, y: float) -> Optional[int]:
+        """
+        Move a point and keep the curve sorted without a full re-sort
+
+        The new slot is found with a binary search among the other
+        points, and only the points between the old and the new slot are
+        shifted by one. The result is the same as update_point() followed
+        by a stable sort: a point moved onto equal X values stays on the
+        side it came from.
+
+        Args:
+            index: Index of point to move
+            x: New X value
+            y: New Y value
+
+        Returns:
+            New index of the point, or None if index is out of range
+        """
+        xs, ys = self._x, self._y
+        if not 0 <= index < len(xs):
+            return None
+        self._lookup = None
+        if not self._is_sorted():
+            xs[index] = x
+            ys[index] = y
+            order = np.argsort(xs, kind='stable')
+            self._x, self._y = xs[order], ys[order]
+            self._sorted = True
+            return int(np.flatnonzero(order == index)[0])
+
+        if x >= xs[index]:
+            # Right: after the following points with a smaller X
+            new = index + int(np.searchsorted(xs[index + 1:], x, side='left'))
+            xs[index:new] = xs[index + 1:new + 1]
+            ys[index:new] = ys[index + 1:new + 1]
+        else:
+            # Left: before the preceding points with a larger X
+            new = int(np.searchsorted(xs[:index], x, side='right'))
+            xs[new + 1:index + 1] = xs[new:index]
+            ys[new + 1:index + 1] = ys[new:index]
+        xs[new] = x
+        ys[new] = y
+        return new
     
     def sort_points(self):
-        """Sort points by X value"""
-        self.points.sort(key=lambda p: p[0])
+        """Sort points by X value (stable: equal X keep their order)"""
+        if not self._is_sorted():
+            order = np.argsort(self._x, kind='stable')
+            self._x = self._x[order]
+            self._y = self._y[order]
+            self._sorted = True
+        self._lookup = None
+
+    def _is_sorted(self) -> bool:
+        if self._sorted is None:
+            self._sorted = len(self._x) < 2 or not (self._x[1:] < self._x[:-1]).any()
+        return self._sorted
+
+    def _sorted_lookup(self):
+        """Arrays and lists sorted by x, rebuilt only after a change"""
+        if self._lookup is None:
+            x, y = self._x, self._y
+            if not self._is_sorted():
+                order = np.argsort(x, kind='stable')
+                x, y = x[order], y[order]
+            self._lookup = (x, y, x.tolist(), y.tolist())
+        return self._lookup
     
     def get_points(self) -> List[Tuple[float, float]]:
         """Get all points"""
-        return self.points.copy()
+        return self.points
     
     def interpolate(self, x: float) -> float:
         """
@@ -136,30 +343,46 @@ class LUTCurve:
             x: X value
             
         Returns:
-            Interpolated Y value
+            Interpolated Y value (first/last Y outside the curve)
         """
-        if not self.points:
+        _x, _y, xs, ys = self._sorted_lookup()
+        if not xs:
             return 0.0
         
         # If x is before first point, return first Y
-        if x <= self.points[0][0]:
-            return self.points[0][1]
+        if x <= xs[0]:
+            return ys[0]
         
         # If x is after last point, return last Y
-        if x >= self.points[-1][0]:
-            return self.points[-1][1]
-        
-        # Find surrounding points and interpolate
-        for i in range(len(self.points) - 1):
-            x1, y1 = self.points[i]
-            x2, y2 = self.points[i + 1]
-            
-            if x1 <= x <= x2:
-                # Linear interpolation
-                t = (x - x1) / (x2 - x1)
-                return y1 + t * (y2 - y1)
+        if x >= xs[-1]:
+            return ys[-1]
         
-        return 0.0
+        # Bisect for the surrounding points and interpolate
+        i = bisect_left(xs, x)
+        if xs[i] == x:
+            return ys[i]
+        x1, y1 = xs[i - 1], ys[i - 1]
+        x2, y2 = xs[i], ys[i]
+        return y1 + (x - x1) / (x2 - x1) * (y2 - y1)
+
+    def interpolate_many(self, xs) -> np.ndarray:
+        """
+        Interpolate Y values for an array of X values in one call
+
+        Same result as calling interpolate() for each value, but
+        vectorized (np.interp does a binary search per value in C).
+
+        Args:
+            xs: X values (sequence or array, any shape)
+
+        Returns:
+            float64 array of interpolated Y values, shaped like xs
+        """
+        x, y, _xs, _ys = self._sorted_lookup()
+        xs = np.asarray(xs, dtype=np.float64)
+        if not len(x):
+            return np.zeros(xs.shape)
+        return np.interp(xs, x, y)
     
     def clear(self):
         """Clear all points"""
@@ -167,8 +390,8 @@ class LUTCurve:
     
     def __len__(self):
         """Return number of points"""
-        return len(self.points)
+        return len(self._x)
     
     def __repr__(self):
         """String representation"""
-        return f"LUTCurve(points={len(self.points)})"
+        return f"LUTCurve(points={len(self._x)})"
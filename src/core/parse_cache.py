@@ -0,0 +1,110 @@
+"""
+Process-wide cache of parsed car data files.
+
+The same engine.ini, tyres.ini or power.lut is parsed by the car editor,
+the gear speed calculator (on every gear change), the stage tuner, the RTO
+manager and the setup manager. PARSE_CACHE keeps one parsed copy per
+(path, kind), validated by the file's size and mtime_ns on each lookup
+(one os.stat), so a file changed on disk - by this program or another -
+is re-parsed automatically. Writers additionally call invalidate() after
+saving, so a rewrite within the filesystem's mtime granularity is not
+missed.
+
+Cached values are shared between callers and must be treated as
+read-only; the parser classmethods built on top of this
+(IniParser.cached(), LUTCurve.cached(), RTOParser.cached()) hand out
+copy-on-write or copied views. This module imports no parsers, so the
+parsers can import it.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+
+class ParseCache:
+    """LRU of parsed files, keyed by (path, kind) and validated by (size, mtime_ns)"""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Number of parsed files kept (least recently used dropped)
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # (path, kind) -> (size, mtime_ns, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(self, path: str, kind: str, loader: Callable[[], Any]) -> Any:
+        """
+        Parsed content of path, parsing it only if not cached or changed
+
+        Args:
+            path: File path
+            kind: Parser kind ('ini', 'lut', 'rto', ...), so one file can be
+                  cached by several parsers
+            loader: Called to parse the file on a miss; its result is cached
+
+        Returns:
+            The (shared) parsed value; a missing file is never cached
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return loader()
+
+        key = (self._normalize(path), kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (st.st_size, st.st_mtime_ns, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, path: str):
+        """Forget every parsed copy of path (call after writing the file)"""
+        path = self._normalize(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self):
+        """Forget everything and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/invalidation counters and the number of cached files"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+PARSE_CACHE = ParseCache()
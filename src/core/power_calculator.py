@@ -11,11 +11,28 @@ Physics (from AC documentation §4.2):
     Turbo engines: Final_Torque = LUT_value × (1 + Boost_Pressure)
     Power (HP) = Torque(Nm) × RPM × 2π / (60 × 745.7)
     Boost at RPM = MAX_BOOST × clamp((RPM / REFERENCE_RPM), 0, 1) ^ GAMMA
+
+compute_curves() evaluates the whole RPM grid with NumPy (np.interp for
+the LUT, one array expression per turbo, argmax for the peaks) and is
+memoized on the torque points, turbo configs and RPM step, so reopening
+the calculator for an unchanged car returns (a copy of) the previous
+result.
+
+The pieces are cached separately for live editing of turbo parameters:
+the base torque/HP arrays per (LUT, step), and per turbo the normalized
+boost shape clamp(RPM / REFERENCE_RPM, 0, 1) ^ GAMMA together with the
+torque and HP it adds at 1 bar, per (LUT, step, REFERENCE_RPM, GAMMA).
+Since Final_Torque = LUT × (1 + Σ MAX_BOOST_i × shape_i), changing only
+MAX_BOOST costs one multiply-add per curve.
 """
 
 import math
+from bisect import bisect_left
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict
 
+import numpy as np
+
 
 class PowerTorqueCalculator:
     """Calculate power and torque curves from LUT data and turbo config."""
@@ -31,6 +48,7 @@ class PowerTorqueCalculator:
                            max_boost, wastegate, reference_rpm, gamma
         """
         self.torque_points = sorted(torque_points, key=lambda p: p[0])
+        self._rpms = [p[0] for p in self.torque_points]   # bisect keys
         self.turbo_configs = turbo_configs or []
 
     @staticmethod
@@ -52,13 +70,13 @@ class PowerTorqueCalculator:
             return pts[0][1]
         if rpm >= pts[-1][0]:
             return pts[-1][1]
-        for i in range(len(pts) - 1):
-            x1, y1 = pts[i]
-            x2, y2 = pts[i + 1]
-            if x1 <= rpm <= x2:
-                t = (rpm - x1) / (x2 - x1)
-                return y1 + t * (y2 - y1)
-        return 0.0
+        i = bisect_left(self._rpms, rpm)
+        x2, y2 = pts[i]
+        if x2 == rpm:
+            return y2
+        x1, y1 = pts[i - 1]
+        t = (rpm - x1) / (x2 - x1)
+        return y1 + t * (y2 - y1)
 
     def boost_at_rpm(self, rpm: float) -> float:
         """Total boost pressure (bar) from all turbo units at a given RPM.
@@ -88,6 +106,13 @@ class PowerTorqueCalculator:
     def compute_curves(self, rpm_step: float = 100.0) -> Dict:
         """Compute full power and torque curves.
 
+        The curves are memoized on (torque points, turbo configs, rpm_step);
+        each call returns its own copy of the lists, so a caller editing
+        them does not change the cached result.
+
+        Args:
+            rpm_step: RPM between samples (the last LUT RPM is always included)
+
         Returns:
             dict with keys:
               rpm_values       – list of RPM sample points
@@ -101,65 +126,12 @@ class PowerTorqueCalculator:
               peak_eff_torque  – (rpm, Nm)
               peak_eff_hp      – (rpm, hp)
         """
-        if not self.torque_points:
-            return self._empty_result()
-
-        min_rpm = self.torque_points[0][0]
-        max_rpm = self.torque_points[-1][0]
-
-        rpm_values = []
-        r = min_rpm
-        while r <= max_rpm:
-            rpm_values.append(r)
-            r += rpm_step
-        if rpm_values and rpm_values[-1] < max_rpm:
-            rpm_values.append(max_rpm)
-
-        base_hp = []
-        base_torque = []
-        eff_hp = []
-        eff_torque = []
-        boost_curve = []
-
-        peak_bhp = (0, 0.0)
-        peak_btq = (0, 0.0)
-        peak_ehp = (0, 0.0)
-        peak_etq = (0, 0.0)
-
-        for rpm in rpm_values:
-            bt = self.interpolate_torque(rpm)
-            bh = self.torque_to_hp(bt, rpm)
-            et = self.effective_torque(rpm)
-            eh = self.torque_to_hp(et, rpm)
-            b = self.boost_at_rpm(rpm)
-
-            base_torque.append(bt)
-            base_hp.append(bh)
-            eff_torque.append(et)
-            eff_hp.append(eh)
-            boost_curve.append(b)
-
-            if bt > peak_btq[1]:
-                peak_btq = (rpm, bt)
-            if bh > peak_bhp[1]:
-                peak_bhp = (rpm, bh)
-            if et > peak_etq[1]:
-                peak_etq = (rpm, et)
-            if eh > peak_ehp[1]:
-                peak_ehp = (rpm, eh)
-
-        return {
-            'rpm_values': rpm_values,
-            'base_torque': base_torque,
-            'base_hp': base_hp,
-            'effective_torque': eff_torque,
-            'effective_hp': eff_hp,
-            'boost_curve': boost_curve,
-            'peak_base_torque': peak_btq,
-            'peak_base_hp': peak_bhp,
-            'peak_eff_torque': peak_etq,
-            'peak_eff_hp': peak_ehp,
-        }
+        key = (tuple((float(x), float(y)) for x, y in self.torque_points),
+               tuple(tuple(sorted(tc.items())) for tc in self.turbo_configs),
+               float(rpm_step))
+        # Peaks are tuples already; only the curve lists need copying
+        return {name: list(value) if isinstance(value, list) else value
+                for name, value in _compute_curves(*key).items()}
 
     @staticmethod
     def _empty_result() -> Dict:
@@ -171,3 +143,82 @@ class PowerTorqueCalculator:
             'peak_base_torque': (0, 0.0), 'peak_base_hp': (0, 0.0),
             'peak_eff_torque': (0, 0.0), 'peak_eff_hp': (0, 0.0),
         }
+
+
+def _peak(rpm: np.ndarray, values: np.ndarray) -> Tuple[float, float]:
+    """(rpm, value) of the first maximum, or (0, 0.0) if nothing is positive"""
+    i = int(np.argmax(values))
+    if values[i] <= 0.0:
+        return (0, 0.0)
+    return (float(rpm[i]), float(values[i]))
+
+
+def _readonly(*arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=16)
+def _base_curves(points: Tuple[Tuple[float, float], ...],
+                 rpm_step: float) -> Tuple[np.ndarray, ...]:
+    """RPM grid, HP-per-Nm factor, base torque and base HP for a LUT (read-only)"""
+    lut = np.array(points, dtype=np.float64)
+    min_rpm, max_rpm = lut[0, 0], lut[-1, 0]
+    count = int((max_rpm - min_rpm) // rpm_step) + 1
+    rpm = np.minimum(min_rpm + rpm_step * np.arange(count), max_rpm)
+    if rpm[-1] < max_rpm:
+        rpm = np.append(rpm, max_rpm)
+
+    to_hp = np.where(rpm > 0, rpm * (2.0 * math.pi / (60.0 * PowerTorqueCalculator.HP_TO_WATTS)), 0.0)
+    base_torque = np.interp(rpm, lut[:, 0], lut[:, 1])
+    return _readonly(rpm, to_hp, base_torque, base_torque * to_hp)
+
+
+@lru_cache(maxsize=64)
+def _turbo_gain(points: Tuple[Tuple[float, float], ...], rpm_step: float,
+                reference_rpm: float, gamma: float) -> Tuple[np.ndarray, ...]:
+    """Boost shape of one turbo at 1 bar MAX_BOOST and the torque/HP it adds (read-only)"""
+    rpm, _to_hp, base_torque, base_hp = _base_curves(points, rpm_step)
+    shape = np.clip(rpm / reference_rpm, 0.0, 1.0) ** gamma
+    return _readonly(shape, base_torque * shape, base_hp * shape)
+
+
+@lru_cache(maxsize=64)
+def _compute_curves(points: Tuple[Tuple[float, float], ...],
+                    turbo_configs: Tuple[Tuple[Tuple[str, float], ...], ...],
+                    rpm_step: float) -> Dict:
+    """Vectorized body of PowerTorqueCalculator.compute_curves() (hashable arguments)"""
+    if not points:
+        return PowerTorqueCalculator._empty_result()
+    if rpm_step <= 0:
+        raise ValueError(f"rpm_step must be positive, got {rpm_step}")
+
+    rpm, _to_hp, base_torque, base_hp = _base_curves(points, rpm_step)
+    boost = np.zeros_like(rpm)
+    eff_torque = base_torque.copy()
+    eff_hp = base_hp.copy()
+    for tc in turbo_configs:
+        tc = dict(tc)
+        ref_rpm = tc.get('reference_rpm', 3000)
+        if ref_rpm <= 0:
+            continue
+        max_boost = tc.get('max_boost', 0.0)
+        shape, torque_gain, hp_gain = _turbo_gain(points, rpm_step, float(ref_rpm),
+                                                  float(tc.get('gamma', 2.5)))
+        boost += max_boost * shape
+        eff_torque += max_boost * torque_gain
+        eff_hp += max_boost * hp_gain
+
+    return {
+        'rpm_values': rpm.tolist(),
+        'base_torque': base_torque.tolist(),
+        'base_hp': base_hp.tolist(),
+        'effective_torque': eff_torque.tolist(),
+        'effective_hp': eff_hp.tolist(),
+        'boost_curve': boost.tolist(),
+        'peak_base_torque': _peak(rpm, base_torque),
+        'peak_base_hp': _peak(rpm, base_hp),
+        'peak_eff_torque': _peak(rpm, eff_torque),
+        'peak_eff_hp': _peak(rpm, eff_hp),
+    }
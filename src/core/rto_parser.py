@@ -19,6 +19,8 @@ decimal value after the last '|' is used.
 import os
 from typing import List, Optional
 
+from core.parse_cache import PARSE_CACHE
+
 
 class RTOParser:
     """Parser for Assetto Corsa .rto (ratio) files"""
@@ -41,35 +43,85 @@ class RTOParser:
         self.ratios = []
         try:
             with open(self.file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    # Skip empty lines
-                    if not line:
-                        continue
-                    
-                    # Skip comments (lines starting with ; or #)
-                    if line.startswith(';') or line.startswith('#'):
-                        continue
-                    
-                    # Parse VALUE|VALUE or LABEL|VALUE format
-                    if '|' in line:
-                        parts = line.split('|')
-                        if len(parts) >= 2:
-                            # Try the first part first (standard format: VALUE|VALUE).
-                            # Fall back to the last part for label formats like "80//31|3.88".
-                            raw = parts[0].strip()
-                            try:
-                                value = float(raw)
-                            except ValueError:
-                                try:
-                                    value = float(parts[-1].strip())
-                                except ValueError:
-                                    print(f"Warning: Could not parse ratio value: {line}")
-                                    continue
-                            self.ratios.append(value)
+                self._parse_lines(f)
         except Exception as e:
             print(f"Error loading RTO file {self.file_path}: {e}")
+
+    def load_string(self, text: str):
+        """
+        Load ratios from a string (e.g. an entry decoded from data.acd)
+
+        Args:
+            text: RTO file content
+        """
+        self.ratios = []
+        self._parse_lines(text.splitlines())
+
+    @classmethod
+    def from_string(cls, text: str, file_path: str = '') -> 'RTOParser':
+        """
+        Create a parser from in-memory RTO content
+
+        Args:
+            text: RTO file content
+            file_path: Path used by save() (optional)
+
+        Returns:
+            RTOParser with the ratios loaded
+        """
+        parser = cls(file_path)
+        parser.load_string(text)
+        return parser
+
+    @classmethod
+    def cached(cls, file_path: str) -> 'RTOParser':
+        """
+        Parser loaded through the process-wide PARSE_CACHE
+
+        The file is only parsed if it is not cached or changed on disk;
+        the returned parser has its own copy of the ratios.
+
+        Args:
+            file_path: Path to the .rto file
+
+        Returns:
+            RTOParser (empty if the file does not exist)
+        """
+        ratios = PARSE_CACHE.get(file_path, 'rto', lambda: tuple(cls(file_path).ratios))
+        parser = cls('')
+        parser.file_path = file_path
+        parser.ratios = list(ratios)
+        return parser
+
+    def _parse_lines(self, lines):
+        """Parse VALUE|VALUE or LABEL|VALUE lines into self.ratios"""
+        for line in lines:
+            line = line.strip()
+            
+            # Skip empty lines
+            if not line:
+                continue
+            
+            # Skip comments (lines starting with ; or #)
+            if line.startswith(';') or line.startswith('#'):
+                continue
+            
+            # Parse VALUE|VALUE or LABEL|VALUE format
+            if '|' in line:
+                parts = line.split('|')
+                if len(parts) >= 2:
+                    # Try the first part first (standard format: VALUE|VALUE).
+                    # Fall back to the last part for label formats like "80//31|3.88".
+                    raw = parts[0].strip()
+                    try:
+                        value = float(raw)
+                    except ValueError:
+                        try:
+                            value = float(parts[-1].strip())
+                        except ValueError:
+                            print(f"Warning: Could not parse ratio value: {line}")
+                            continue
+                    self.ratios.append(value)
     
     def save(self, backup: bool = True):
         """
@@ -91,6 +143,7 @@ class RTOParser:
                 for ratio in self.ratios:
                     # Format with 2 decimal places, write VALUE|VALUE
                     f.write(f"{ratio:.2f}|{ratio:.2f}\n")
+            PARSE_CACHE.invalidate(self.file_path)
         except Exception as e:
             print(f"Error saving RTO file {self.file_path}: {e}")
             raise
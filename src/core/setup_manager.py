@@ -36,7 +36,7 @@ class SetupManager:
         self.parameters = []
 
         if os.path.exists(self.setup_ini_path):
-            self.setup_ini = IniParser(self.setup_ini_path)
+            self.setup_ini = IniParser.cached(self.setup_ini_path)
             self._parse_parameters()
 
     def _parse_parameters(self):
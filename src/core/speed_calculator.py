@@ -6,15 +6,25 @@ Calculates maximum speed for each gear based on:
 - Final drive ratio
 - Engine max RPM
 - Tire radius/diameter
+
+calculate_power_limited_speeds() additionally checks whether each gear's
+rev-limited speed can be reached against aero drag and rolling
+resistance: it looks for the speed where the power at the wheels equals
+the resistance power, for all gears at once on an RPM grid, and refines
+the crossing linearly.
 """
 
 import math
 import os
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 class SpeedCalculator:
     """Calculate maximum speed for gears"""
+
+    AIR_DENSITY = 1.225  # kg/m³
     
     @staticmethod
     def calculate_max_speed(gear_ratio: float, final_ratio: float, 
@@ -50,6 +60,65 @@ class SpeedCalculator:
         
         return speed_kmh
     
+    @staticmethod
+    def calculate_power_limited_speeds(torque_points: Sequence[Tuple[float, float]],
+                                       gear_ratios: Sequence[float], final_ratio: float,
+                                       max_rpm: float, tire_radius: float, drag_area: float,
+                                       rolling_resistance: Tuple[float, float] = (0.0, 0.0),
+                                       samples: int = 512) -> List[float]:
+        """
+        Calculate the top speed of each gear against drag and rolling resistance.
+
+        In a gear the car stops accelerating where wheel power equals
+        resistance power, i.e. where T(rpm) × gear × final / radius =
+        rr0 + (½ρ·CdA + rr1) × v². The net force is evaluated for every
+        gear on one RPM grid up to max_rpm, and the last positive-to-
+        negative crossing is interpolated linearly.
+
+        Args:
+            torque_points: (RPM, Nm) torque at the engine, boost included
+            gear_ratios: Gear ratios
+            final_ratio: Final drive ratio
+            max_rpm: Maximum engine RPM (limiter)
+            tire_radius: Driven tyre radius in meters
+            drag_area: CD × area in m²
+            rolling_resistance: (N, N per (m/s)²) summed over the four tyres
+            samples: RPM grid size
+
+        Returns:
+            Speed in km/h per gear: the power-limited speed, the rev-limited
+            speed if the limiter is reached first, or 0.0 if the gear
+            cannot accelerate the car at all
+        """
+        ratios = np.abs(np.asarray(gear_ratios, dtype=np.float64))
+        lut = np.asarray(torque_points, dtype=np.float64).reshape(-1, 2)
+        if not len(ratios) or not len(lut) or final_ratio <= 0 or max_rpm <= 0 or tire_radius <= 0:
+            return [0.0] * len(ratios)
+
+        usable = ratios > 0
+        ratios = np.where(usable, ratios, 1.0)
+        rpm = np.linspace(max_rpm / samples, max_rpm, samples)
+        ms_per_rpm = 2.0 * math.pi * tire_radius / (60.0 * ratios * final_ratio)   # (gears,)
+        speed = rpm * ms_per_rpm[:, None]                                          # (gears, samples)
+        drive = np.interp(rpm, lut[:, 0], lut[:, 1]) * (ratios * final_ratio / tire_radius)[:, None]
+        rr0, rr1 = rolling_resistance
+        net = drive - (rr0 + (0.5 * SpeedCalculator.AIR_DENSITY * drag_area + rr1) * speed ** 2)
+
+        positive = net > 0
+        crossing = positive[:, :-1] & ~positive[:, 1:]
+        # Last crossing: the car enters a high gear from below already at speed,
+        # so a dip low in the rev range (e.g. before boost) does not limit it
+        last = crossing.shape[1] - 1 - np.argmax(crossing[:, ::-1], axis=1)
+        rows = np.arange(len(ratios))
+        n0, n1 = net[rows, last], net[rows, last + 1]
+        s0, s1 = speed[rows, last], speed[rows, last + 1]
+        # n0 > 0 >= n1 on a crossing; other rows are discarded below
+        root = s0 + (s1 - s0) * n0 / np.where(n0 > n1, n0 - n1, 1.0)
+
+        top = np.where(positive[:, -1], speed[:, -1],
+                       np.where(crossing.any(axis=1), root, 0.0))
+        return (np.where(usable, top, 0.0) * 3.6).tolist()
+
     @staticmethod
     def get_tire_radius_from_ini(tyres_ini_path: str, compound_index: int = 0) -> Optional[float]:
         """
@@ -67,21 +136,21 @@ class SpeedCalculator:
         
         try:
             from core.ini_parser import IniParser
-            parser = IniParser(tyres_ini_path)
+            parser = IniParser.cached(tyres_ini_path)
             
             # Try FRONT section first (compound 0), then FRONT_N
             section = 'FRONT' if compound_index == 0 else f'FRONT_{compound_index}'
             
             if parser.has_section(section):
-                radius_str = parser.get_value(section, 'RADIUS', None)
-                if radius_str:
-                    return float(radius_str)
+                radius = parser.get_many(section, {'RADIUS': float})['RADIUS']
+                if radius:
+                    return radius
             
             # Fallback to FRONT if specific compound not found
             if compound_index > 0 and parser.has_section('FRONT'):
-                radius_str = parser.get_value('FRONT', 'RADIUS', None)
-                if radius_str:
-                    return float(radius_str)
+                radius = parser.get_many('FRONT', {'RADIUS': float})['RADIUS']
+                if radius:
+                    return radius
                     
         except Exception as e:
             print(f"Error reading tire radius: {e}")
@@ -104,12 +173,12 @@ class SpeedCalculator:
         
         try:
             from core.ini_parser import IniParser
-            parser = IniParser(engine_ini_path)
+            parser = IniParser.cached(engine_ini_path)
             
             if parser.has_section('ENGINE_DATA'):
-                limiter_str = parser.get_value('ENGINE_DATA', 'LIMITER', None)
-                if limiter_str:
-                    return int(float(limiter_str))
+                limiter = parser.get_many('ENGINE_DATA', {'LIMITER': int})['LIMITER']
+                if limiter:
+                    return limiter
                     
         except Exception as e:
             print(f"Error reading max RPM: {e}")
@@ -41,7 +41,7 @@ class StageTuner:
             path = os.path.join(self.car_data_path, filename)
             if os.path.exists(path):
                 try:
-                    setattr(self, attr, IniParser(path))
+                    setattr(self, attr, IniParser.cached(path))
                 except Exception as e:
                     print(f"Failed to load {filename}: {e}")
     
@@ -140,10 +140,8 @@ class StageTuner:
         # Increase power curve
         power_lut_path = os.path.join(self.car_data_path, 'power.lut')
         if os.path.exists(power_lut_path):
-            curve = LUTCurve(power_lut_path)
-            for i in range(len(curve.points)):
-                rpm, torque = curve.points[i]
-                curve.points[i] = (rpm, torque * 1.08)
+            curve = LUTCurve.cached(power_lut_path)
+            curve.points = [(rpm, torque * 1.08) for rpm, torque in curve.points]
             curve.save(backup=True)
         
         # Mark stage
@@ -189,10 +187,8 @@ class StageTuner:
         # Increase power curve slightly (5% to account for turbo)
         power_lut_path = os.path.join(self.car_data_path, 'power.lut')
         if os.path.exists(power_lut_path):
-            curve = LUTCurve(power_lut_path)
-            for i in range(len(curve.points)):
-                rpm, torque = curve.points[i]
-                curve.points[i] = (rpm, torque * 1.05)
+            curve = LUTCurve.cached(power_lut_path)
+            curve.points = [(rpm, torque * 1.05) for rpm, torque in curve.points]
             curve.save(backup=True)
         
         # Mark stage
@@ -261,10 +257,8 @@ class StageTuner:
         # Increase power curve
         power_lut_path = os.path.join(self.car_data_path, 'power.lut')
         if os.path.exists(power_lut_path):
-            curve = LUTCurve(power_lut_path)
-            for i in range(len(curve.points)):
-                rpm, torque = curve.points[i]
-                curve.points[i] = (rpm, torque * 1.12)
+            curve = LUTCurve.cached(power_lut_path)
+            curve.points = [(rpm, torque * 1.12) for rpm, torque in curve.points]
             curve.save(backup=True)
         
         # Mark stage
@@ -323,10 +317,8 @@ class StageTuner:
         # Increase power curve
         power_lut_path = os.path.join(self.car_data_path, 'power.lut')
         if os.path.exists(power_lut_path):
-            curve = LUTCurve(power_lut_path)
-            for i in range(len(curve.points)):
-                rpm, torque = curve.points[i]
-                curve.points[i] = (rpm, torque * 1.10)
+            curve = LUTCurve.cached(power_lut_path)
+            curve.points = [(rpm, torque * 1.10) for rpm, torque in curve.points]
             curve.save(backup=True)
         
         # Mark stage
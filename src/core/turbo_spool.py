@@ -0,0 +1,193 @@
+"""
+Transient turbo spool simulator for Assetto Corsa cars.
+
+PowerTorqueCalculator models steady-state boost only. In the game each
+TURBO_n section also has LAG_UP / LAG_DN (how much of the previous boost
+is kept per physics step while boost rises / falls) and WASTEGATE (the
+pressure at which the wastegate caps boost). Per turbo and physics step:
+
+    target = MAX_BOOST × throttle × clamp(RPM / REFERENCE_RPM, 0, 1) ^ GAMMA
+    lag    = LAG_UP if target > boost else LAG_DN
+    boost  = min(boost × lag + target × (1 - lag), WASTEGATE)
+
+    Final_Torque = throttle × LUT(RPM) × (1 + Σ boost_i)
+
+The lag factors are per AC physics step (PHYSICS_HZ); for another
+timestep they are rescaled to lag ^ (dt × PHYSICS_HZ), so the spool time
+does not depend on dt. A WASTEGATE of 0 means no cap.
+
+The recursion is sequential in time, but everything else is vectorized:
+targets and base torque are computed for the whole trace up front, and
+the time loop updates every trace and every turbo at once, so the Python
+overhead is paid once per step, not once per trace and step
+(tests/benchmark_turbo.py).
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+PHYSICS_HZ = 333.0   # AC physics rate; LAG_UP / LAG_DN are per step at this rate
+
+# Values assumed for keys missing from a TURBO_n section of engine.ini
+# (shared with the car editor's turbo controls)
+TURBO_DEFAULTS = {
+    'MAX_BOOST': 0.0,
+    'WASTEGATE': 0.0,
+    'REFERENCE_RPM': 3000,
+    'GAMMA': 2.5,
+    'LAG_UP': 0.990,
+    'LAG_DN': 0.985,
+}
+
+# engine.ini key -> (config key, default)
+_TURBO_KEYS = {key: (key.lower(), float(default)) for key, default in TURBO_DEFAULTS.items()}
+
+
+def read_turbo_configs(engine_ini) -> List[Dict]:
+    """
+    Turbo configs from the TURBO_0, TURBO_1, ... sections of engine.ini
+
+    Args:
+        engine_ini: IniParser of engine.ini
+
+    Returns:
+        One dict per turbo with max_boost, wastegate, reference_rpm, gamma,
+        lag_up and lag_dn ([] for an NA engine)
+    """
+    types = {key: float for key in _TURBO_KEYS}
+    defaults = {key: default for key, (_name, default) in _TURBO_KEYS.items()}
+    configs = []
+    i = 0
+    while engine_ini.has_section(f'TURBO_{i}'):
+        values = engine_ini.get_many(f'TURBO_{i}', types, defaults)
+        configs.append({name: values[key] for key, (name, _default) in _TURBO_KEYS.items()})
+        i += 1
+    return configs
+
+
+class TurboSpoolSimulator:
+    """Integrate boost build-up and decay of every turbo over RPM/throttle traces"""
+
+    def __init__(self, torque_points: List[Tuple[float, float]], turbo_configs: List[Dict]):
+        """
+        Args:
+            torque_points: List of (RPM, Nm) tuples from power.lut
+            turbo_configs: One dict per turbo with max_boost, wastegate,
+                           reference_rpm, gamma, lag_up, lag_dn (missing
+                           keys use the defaults of read_turbo_configs())
+        """
+        lut = np.array(sorted(torque_points, key=lambda p: p[0]), dtype=np.float64).reshape(-1, 2)
+        self._lut_rpm = lut[:, 0]
+        self._lut_torque = lut[:, 1]
+
+        def column(name: str, default: float) -> np.ndarray:
+            return np.array([tc.get(name, default) for tc in turbo_configs], dtype=np.float64)
+
+        defaults = dict(_TURBO_KEYS.values())
+        self.max_boost = column('max_boost', defaults['max_boost'])
+        reference_rpm = column('reference_rpm', defaults['reference_rpm'])
+        # REFERENCE_RPM <= 0 disables the turbo, as in PowerTorqueCalculator
+        self._reference_rpm = np.where(reference_rpm > 0, reference_rpm, np.inf)
+        self.gamma = column('gamma', defaults['gamma'])
+        self.lag_up = np.clip(column('lag_up', defaults['lag_up']), 0.0, 1.0)
+        self.lag_dn = np.clip(column('lag_dn', defaults['lag_dn']), 0.0, 1.0)
+        wastegate = column('wastegate', defaults['wastegate'])
+        self._cap = np.where(wastegate > 0, wastegate, np.inf)
+
+    def target_boost(self, rpm, throttle=1.0) -> np.ndarray:
+        """
+        Steady-state boost of each turbo (bar)
+
+        Args:
+            rpm: Engine RPM (array, any shape)
+            throttle: Throttle 0..1, broadcast against rpm
+
+        Returns:
+            Array shaped like rpm × throttle with one trailing entry per turbo
+        """
+        rpm = np.asarray(rpm, dtype=np.float64)[..., None]
+        throttle = np.clip(np.asarray(throttle, dtype=np.float64), 0.0, 1.0)[..., None]
+        shape = np.clip(rpm / self._reference_rpm, 0.0, 1.0) ** self.gamma
+        return throttle * self.max_boost * shape
+
+    def simulate(self, rpm, throttle=1.0, dt: float = 1.0 / PHYSICS_HZ,
+                 initial_boost: float = 0.0) -> Dict[str, np.ndarray]:
+        """
+        Integrate boost over time at a fixed timestep
+
+        Args:
+            rpm: RPM trace, shape (steps,) or (traces, steps)
+            throttle: Throttle trace(s) 0..1, broadcast against rpm
+            dt: Timestep in seconds (default: one AC physics step)
+            initial_boost: Boost of every turbo at t=0 (bar)
+
+        Returns:
+            dict with keys (the traces axis is dropped for 1-D input):
+              time        – (steps,) seconds
+              turbo_boost – (traces, steps, turbos) boost of each turbo (bar)
+              boost       – (traces, steps) total boost (bar)
+              torque      – (traces, steps) throttle × LUT torque × (1 + boost) (Nm)
+        """
+        rpm, throttle = np.broadcast_arrays(np.asarray(rpm, dtype=np.float64),
+                                            np.asarray(throttle, dtype=np.float64))
+        single = rpm.ndim == 1
+        rpm = np.atleast_2d(rpm)
+        throttle = np.clip(np.atleast_2d(throttle), 0.0, 1.0)
+        traces, steps = rpm.shape
+        turbos = len(self.max_boost)
+
+        # Fraction of the gap to the target closed per step, rescaled to dt
+        exponent = dt * PHYSICS_HZ
+        gain_up = 1.0 - self.lag_up ** exponent
+        gain_dn = 1.0 - self.lag_dn ** exponent
+
+        # Time-major so each step reads one contiguous (traces, turbos) block
+        target = np.ascontiguousarray(self.target_boost(rpm, throttle).transpose(1, 0, 2))
+        boost = np.empty_like(target)
+        state = np.full((traces, turbos), float(initial_boost))
+        np.minimum(state, self._cap, out=state)
+        gap = np.empty_like(state)
+        for t in range(steps):
+            np.subtract(target[t], state, out=gap)
+            gap *= np.where(gap > 0.0, gain_up, gain_dn)
+            state += gap
+            np.minimum(state, self._cap, out=state)
+            boost[t] = state
+        turbo_boost = boost.transpose(1, 0, 2)
+
+        total = turbo_boost.sum(axis=2)
+        if len(self._lut_rpm):
+            base_torque = np.interp(rpm, self._lut_rpm, self._lut_torque)
+        else:
+            base_torque = np.zeros_like(rpm)
+        torque = throttle * base_torque * (1.0 + total)
+
+        result = {
+            'time': np.arange(steps) * dt,
+            'turbo_boost': turbo_boost,
+            'boost': total,
+            'torque': torque,
+        }
+        if single:
+            for key in ('turbo_boost', 'boost', 'torque'):
+                result[key] = result[key][0]
+        return result
+
+    def time_to_boost(self, result: Dict[str, np.ndarray], fraction: float = 0.9) -> np.ndarray:
+        """
+        Time until total boost first reaches fraction of the summed MAX_BOOST
+
+        Args:
+            result: Output of simulate()
+            fraction: Fraction of full boost (0..1)
+
+        Returns:
+            Seconds per trace (NaN where it is never reached); a scalar
+            array for a single trace
+        """
+        threshold = fraction * self.max_boost.sum()
+        reached = result['boost'] >= threshold
+        first = np.argmax(reached, axis=-1)
+        times = result['time'][first]
+        return np.where(reached.any(axis=-1), times, np.nan)
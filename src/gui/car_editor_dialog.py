@@ -22,6 +22,7 @@ from core.ini_parser import IniParser
 from core.lut_parser import LUTCurve
 from core.power_calculator import PowerTorqueCalculator
 from core.car_file_manager import CarFileManager
+from core.turbo_spool import TURBO_DEFAULTS
 from gui.curve_editor_dialog import CurveEditorDialog
 from gui.component_selector_dialog import ComponentSelectorDialog
 from gui.stage_tuning_dialog import StageTuningDialog
@@ -131,7 +132,7 @@ class CarEditorDialog(QDialog):
             path = os.path.join(self.car_data_path, filename)
             if os.path.exists(path):
                 try:
-                    setattr(self, attr, IniParser(path))
+                    setattr(self, attr, IniParser.cached(path))
                 except Exception as e:
                     print(f"Failed to load {filename}: {e}")
 
@@ -730,6 +731,7 @@ class CarEditorDialog(QDialog):
         self.gear_count = _tip(QSpinBox(), "Number of forward gears.  (GEARS > COUNT)")
         self.gear_count.setRange(1, 10)
         self.gear_count.valueChanged.connect(self._update_gear_ratio_visibility)
+        self.gear_count.valueChanged.connect(self._update_acceleration_estimate)
         gbox_form.addRow("Gear Count:", self._spin_widget(self.gear_count))
 
         self.final_ratio = _tip(QDoubleSpinBox(),
@@ -744,6 +746,7 @@ class CarEditorDialog(QDialog):
                                     "0 = instantaneous (sequential gearbox).\n"
                                     "H-pattern manual: 200–400 ms  (GEARBOX > CHANGE_UP_TIME)")
         self.gearbox_up_time.setRange(0, 1000); self.gearbox_up_time.setSuffix(" ms")
+        self.gearbox_up_time.valueChanged.connect(self._update_acceleration_estimate)
         gbox_form.addRow("Upshift Time:", self._spin_widget(self.gearbox_up_time))
 
         self.gearbox_dn_time = _tip(QSpinBox(),
@@ -762,6 +765,13 @@ class CarEditorDialog(QDialog):
         self.edit_gear_ratios_btn.clicked.connect(self._toggle_gear_ratios)
         gbox_form.addRow(self.edit_gear_ratios_btn)
 
+        self.accel_label = _tip(QLabel("N/A"),
+                                "Estimated full-throttle standing start with the gear ratios,\n"
+                                "final ratio and upshift time above and the saved engine, car,\n"
+                                "tyre and aero data (flat road, no wheelspin modelling).")
+        self.accel_label.setStyleSheet(muted_text())
+        gbox_form.addRow("Acceleration:", self.accel_label)
+
         grp_inner = gbox_form.done()
         inner_layout = QVBoxLayout()
         inner_layout.setContentsMargins(0, 0, 0, 0)
@@ -1292,12 +1302,14 @@ class CarEditorDialog(QDialog):
             return
 
         if self.engine_ini.has_section('ENGINE_DATA'):
-            minimum  = int(self.engine_ini.get_value('ENGINE_DATA', 'MINIMUM',  '800'))
-            limiter  = int(self.engine_ini.get_value('ENGINE_DATA', 'LIMITER',  '7000'))
-            lim_hz   = int(float(self.engine_ini.get_value('ENGINE_DATA', 'LIMITER_HZ', '30')))
-            inertia  = float(self.engine_ini.get_value('ENGINE_DATA', 'INERTIA',  '0.15'))
-            alt_sens = float(self.engine_ini.get_value('ENGINE_DATA', 'ALTITUDE_SENSITIVITY', '0.1'))
-            turbo_adj = float(self.engine_ini.get_value('ENGINE_DATA', 'DEFAULT_TURBO_ADJUSTMENT', '0.7'))
+            data = self.engine_ini.get_many('ENGINE_DATA', {
+                'MINIMUM': int, 'LIMITER': int, 'LIMITER_HZ': int, 'INERTIA': float,
+                'ALTITUDE_SENSITIVITY': float, 'DEFAULT_TURBO_ADJUSTMENT': float,
+            }, {'MINIMUM': 800, 'LIMITER': 7000, 'LIMITER_HZ': 30, 'INERTIA': 0.15,
+                'ALTITUDE_SENSITIVITY': 0.1, 'DEFAULT_TURBO_ADJUSTMENT': 0.7})
+            minimum, limiter, lim_hz = data['MINIMUM'], data['LIMITER'], data['LIMITER_HZ']
+            inertia, alt_sens = data['INERTIA'], data['ALTITUDE_SENSITIVITY']
+            turbo_adj = data['DEFAULT_TURBO_ADJUSTMENT']
 
             self.minimum_rpm.setValue(minimum)
             self.limiter_rpm.setValue(limiter)
@@ -1310,9 +1322,10 @@ class CarEditorDialog(QDialog):
                                          'default_turbo_adj': turbo_adj})
 
         if self.engine_ini.has_section('COAST_REF'):
-            c_rpm = int(self.engine_ini.get_value('COAST_REF', 'RPM',            '5000'))
-            c_trq = float(self.engine_ini.get_value('COAST_REF', 'TORQUE',        '50'))
-            c_nl  = float(self.engine_ini.get_value('COAST_REF', 'NON_LINEARITY', '0'))
+            coast = self.engine_ini.get_many('COAST_REF', {
+                'RPM': int, 'TORQUE': float, 'NON_LINEARITY': float,
+            }, {'RPM': 5000, 'TORQUE': 50.0, 'NON_LINEARITY': 0.0})
+            c_rpm, c_trq, c_nl = coast['RPM'], coast['TORQUE'], coast['NON_LINEARITY']
             self.coast_ref_rpm.setValue(c_rpm)
             self.coast_ref_torque.setValue(c_trq)
             self.coast_non_linearity.setValue(c_nl)
@@ -1332,14 +1345,15 @@ class CarEditorDialog(QDialog):
             sec = f'TURBO_{i}'
             if not self.engine_ini.has_section(sec):
                 continue
-            mb   = float(self.engine_ini.get_value(sec, 'MAX_BOOST',       '0.0'))
-            wg   = float(self.engine_ini.get_value(sec, 'WASTEGATE',        '0.0'))
-            dmb  = float(self.engine_ini.get_value(sec, 'DISPLAY_MAX_BOOST', str(mb)))
-            lu   = float(self.engine_ini.get_value(sec, 'LAG_UP',           '0.990'))
-            ld   = float(self.engine_ini.get_value(sec, 'LAG_DN',           '0.985'))
-            rrpm = int(self.engine_ini.get_value(sec, 'REFERENCE_RPM',     '3000'))
-            gam  = float(self.engine_ini.get_value(sec, 'GAMMA',            '2.5'))
-            ca   = int(float(self.engine_ini.get_value(sec, 'COCKPIT_ADJUSTABLE', '0')))
+            turbo = self.engine_ini.get_many(sec, {
+                'MAX_BOOST': float, 'WASTEGATE': float, 'DISPLAY_MAX_BOOST': float,
+                'LAG_UP': float, 'LAG_DN': float, 'REFERENCE_RPM': int, 'GAMMA': float,
+                'COCKPIT_ADJUSTABLE': int,
+            }, dict(TURBO_DEFAULTS, COCKPIT_ADJUSTABLE=0))
+            mb, wg = turbo['MAX_BOOST'], turbo['WASTEGATE']
+            dmb = turbo['DISPLAY_MAX_BOOST'] if turbo['DISPLAY_MAX_BOOST'] is not None else mb
+            lu, ld = turbo['LAG_UP'], turbo['LAG_DN']
+            rrpm, gam, ca = turbo['REFERENCE_RPM'], turbo['GAMMA'], turbo['COCKPIT_ADJUSTABLE']
 
             getattr(self, f'turbo_{i}_max_boost').setValue(mb)
             getattr(self, f'turbo_{i}_wastegate').setValue(wg)
@@ -1361,10 +1375,13 @@ class CarEditorDialog(QDialog):
 
         # Engine damage section
         if self.engine_ini.has_section('DAMAGE'):
-            tbt = float(self.engine_ini.get_value('DAMAGE', 'TURBO_BOOST_THRESHOLD', '1.5'))
-            tdk = float(self.engine_ini.get_value('DAMAGE', 'TURBO_DAMAGE_K', '5'))
-            rth = int(float(self.engine_ini.get_value('DAMAGE', 'RPM_THRESHOLD', '8000')))
-            rdk = float(self.engine_ini.get_value('DAMAGE', 'RPM_DAMAGE_K', '1'))
+            damage = self.engine_ini.get_many('DAMAGE', {
+                'TURBO_BOOST_THRESHOLD': float, 'TURBO_DAMAGE_K': float,
+                'RPM_THRESHOLD': int, 'RPM_DAMAGE_K': float,
+            }, {'TURBO_BOOST_THRESHOLD': 1.5, 'TURBO_DAMAGE_K': 5.0,
+                'RPM_THRESHOLD': 8000, 'RPM_DAMAGE_K': 1.0})
+            tbt, tdk = damage['TURBO_BOOST_THRESHOLD'], damage['TURBO_DAMAGE_K']
+            rth, rdk = damage['RPM_THRESHOLD'], damage['RPM_DAMAGE_K']
             self.turbo_boost_threshold.setValue(tbt)
             self.turbo_damage_k.setValue(tdk)
             self.rpm_threshold.setValue(rth)
@@ -1377,8 +1394,9 @@ class CarEditorDialog(QDialog):
             return
 
         if self.suspension_ini.has_section('ARB'):
-            af = float(self.suspension_ini.get_value('ARB', 'FRONT', '20000'))
-            ar = float(self.suspension_ini.get_value('ARB', 'REAR',  '10000'))
+            arb = self.suspension_ini.get_many('ARB', {'FRONT': float, 'REAR': float},
+                                               {'FRONT': 20000.0, 'REAR': 10000.0})
+            af, ar = arb['FRONT'], arb['REAR']
             self.arb_front.setValue(af)
             self.arb_rear.setValue(ar)
             self.original_values.update({'arb_front': af, 'arb_rear': ar})
@@ -1386,15 +1404,15 @@ class CarEditorDialog(QDialog):
         for axle, prefix in [('FRONT', 'front'), ('REAR', 'rear')]:
             if not self.suspension_ini.has_section(axle):
                 continue
-            spring   = float(self.suspension_ini.get_value(axle, 'SPRING_RATE',            '40000'))
-            prog     = float(self.suspension_ini.get_value(axle, 'PROGRESSIVE_SPRING_RATE', '0'))
-            db       = float(self.suspension_ini.get_value(axle, 'DAMP_BUMP',               '2500'))
-            dfb      = float(self.suspension_ini.get_value(axle, 'DAMP_FAST_BUMP',          '3500'))
-            dr       = float(self.suspension_ini.get_value(axle, 'DAMP_REBOUND',            '4000'))
-            dfr      = float(self.suspension_ini.get_value(axle, 'DAMP_FAST_REBOUND',       '5500'))
-            rod      = float(self.suspension_ini.get_value(axle, 'ROD_LENGTH',              '0.08'))
-            camber   = float(self.suspension_ini.get_value(axle, 'STATIC_CAMBER',           '-1.5'))
-            toe      = float(self.suspension_ini.get_value(axle, 'TOE_OUT',                 '0.0'))
+            defaults = {'SPRING_RATE': 40000.0, 'PROGRESSIVE_SPRING_RATE': 0.0,
+                        'DAMP_BUMP': 2500.0, 'DAMP_FAST_BUMP': 3500.0,
+                        'DAMP_REBOUND': 4000.0, 'DAMP_FAST_REBOUND': 5500.0,
+                        'ROD_LENGTH': 0.08, 'STATIC_CAMBER': -1.5, 'TOE_OUT': 0.0}
+            susp = self.suspension_ini.get_many(axle, dict.fromkeys(defaults, float), defaults)
+            spring, prog = susp['SPRING_RATE'], susp['PROGRESSIVE_SPRING_RATE']
+            db, dfb = susp['DAMP_BUMP'], susp['DAMP_FAST_BUMP']
+            dr, dfr = susp['DAMP_REBOUND'], susp['DAMP_FAST_REBOUND']
+            rod, camber, toe = susp['ROD_LENGTH'], susp['STATIC_CAMBER'], susp['TOE_OUT']
 
             getattr(self, f'{prefix}_spring_rate').setValue(spring)
             getattr(self, f'{prefix}_progressive_spring').setValue(prog)
@@ -1425,39 +1443,40 @@ class CarEditorDialog(QDialog):
             self.original_values['traction_type'] = tt
 
         if self.drivetrain_ini.has_section('DIFFERENTIAL'):
-            dp  = float(self.drivetrain_ini.get_value('DIFFERENTIAL', 'POWER',   '0.1'))
-            dc  = float(self.drivetrain_ini.get_value('DIFFERENTIAL', 'COAST',   '0.1'))
-            dpl = float(self.drivetrain_ini.get_value('DIFFERENTIAL', 'PRELOAD', '2'))
+            diff = self.drivetrain_ini.get_many('DIFFERENTIAL', {
+                'POWER': float, 'COAST': float, 'PRELOAD': float,
+            }, {'POWER': 0.1, 'COAST': 0.1, 'PRELOAD': 2.0})
+            dp, dc, dpl = diff['POWER'], diff['COAST'], diff['PRELOAD']
             self.diff_power.setValue(dp)
             self.diff_coast.setValue(dc)
             self.diff_preload.setValue(dpl)
             self.original_values.update({'diff_power': dp, 'diff_coast': dc, 'diff_preload': dpl})
 
         if self.drivetrain_ini.has_section('GEARS'):
-            gc    = int(self.drivetrain_ini.get_value('GEARS', 'COUNT', '6'))
-            final = float(self.drivetrain_ini.get_value('GEARS', 'FINAL', '4.0'))
+            gear_keys = [f'GEAR_{i}' for i in range(1, 11)]
+            gears = self.drivetrain_ini.get_many('GEARS', {
+                'COUNT': int, 'FINAL': float, 'GEAR_R': float, **dict.fromkeys(gear_keys, float),
+            }, {'COUNT': 6, 'FINAL': 4.0, 'GEAR_R': -3.5})
+            gc, final = gears['COUNT'], gears['FINAL']
             self.gear_count.setValue(gc)
             self.final_ratio.setValue(final)
             self.original_values.update({'gear_count': gc, 'final_ratio': final})
             
             # Load individual gear ratios
-            gear_r = self.drivetrain_ini.get_value('GEARS', 'GEAR_R', '-3.5')
-            if gear_r:
-                self.gear_ratios['GEAR_R'].setValue(float(gear_r))
-                self.original_values['gear_r'] = float(gear_r)
+            self.gear_ratios['GEAR_R'].setValue(gears['GEAR_R'])
+            self.original_values['gear_r'] = gears['GEAR_R']
             
-            for i in range(1, 11):
-                gear_key = f'GEAR_{i}'
-                ratio_str = self.drivetrain_ini.get_value('GEARS', gear_key, None)
-                if ratio_str:
-                    ratio = float(ratio_str)
+            for i, gear_key in enumerate(gear_keys, 1):
+                ratio = gears[gear_key]
+                if ratio is not None:
                     self.gear_ratios[gear_key].setValue(ratio)
                     self.original_values[f'gear_{i}'] = ratio
 
         if self.drivetrain_ini.has_section('GEARBOX'):
-            up   = int(self.drivetrain_ini.get_value('GEARBOX', 'CHANGE_UP_TIME', '250'))
-            dn   = int(self.drivetrain_ini.get_value('GEARBOX', 'CHANGE_DN_TIME', '300'))
-            gbi  = float(self.drivetrain_ini.get_value('GEARBOX', 'INERTIA',        '0.02'))
+            gearbox = self.drivetrain_ini.get_many('GEARBOX', {
+                'CHANGE_UP_TIME': int, 'CHANGE_DN_TIME': int, 'INERTIA': float,
+            }, {'CHANGE_UP_TIME': 250, 'CHANGE_DN_TIME': 300, 'INERTIA': 0.02})
+            up, dn, gbi = gearbox['CHANGE_UP_TIME'], gearbox['CHANGE_DN_TIME'], gearbox['INERTIA']
             self.gearbox_up_time.setValue(up)
             self.gearbox_dn_time.setValue(dn)
             self.gearbox_inertia.setValue(gbi)
@@ -1465,14 +1484,16 @@ class CarEditorDialog(QDialog):
                                          'gearbox_inertia': gbi})
 
         if self.drivetrain_ini.has_section('CLUTCH'):
-            ct = float(self.drivetrain_ini.get_value('CLUTCH', 'MAX_TORQUE', '400'))
+            ct = self.drivetrain_ini.get_many('CLUTCH', {'MAX_TORQUE': float},
+                                              {'MAX_TORQUE': 400.0})['MAX_TORQUE']
             self.clutch_max_torque.setValue(ct)
             self.original_values['clutch_max_torque'] = ct
 
     def _load_weight_data(self):
         if self.car_ini:
             if self.car_ini.has_section('BASIC'):
-                mass = float(self.car_ini.get_value('BASIC', 'TOTALMASS', '1350'))
+                mass = self.car_ini.get_many('BASIC', {'TOTALMASS': float},
+                                             {'TOTALMASS': 1350.0})['TOTALMASS']
                 self.total_mass.setValue(mass)
                 self.original_values['total_mass'] = mass
                 inertia_str = self.car_ini.get_value('BASIC', 'INERTIA', '1.5,1.2,4.0')
@@ -1489,16 +1510,19 @@ class CarEditorDialog(QDialog):
                     pass
 
             if self.car_ini.has_section('CONTROLS'):
-                sl = float(self.car_ini.get_value('CONTROLS', 'STEER_LOCK',  '450'))
-                sr = float(self.car_ini.get_value('CONTROLS', 'STEER_RATIO', '15.9'))
+                controls = self.car_ini.get_many('CONTROLS', {
+                    'STEER_LOCK': float, 'STEER_RATIO': float,
+                }, {'STEER_LOCK': 450.0, 'STEER_RATIO': 15.9})
+                sl, sr = controls['STEER_LOCK'], controls['STEER_RATIO']
                 self.steer_lock.setValue(sl)
                 self.steer_ratio.setValue(sr)
                 self.original_values.update({'steer_lock': sl, 'steer_ratio': sr})
 
             if self.car_ini.has_section('FUEL'):
-                f   = float(self.car_ini.get_value('FUEL', 'FUEL',        '30'))
-                mf  = float(self.car_ini.get_value('FUEL', 'MAX_FUEL',    '60'))
-                con = float(self.car_ini.get_value('FUEL', 'CONSUMPTION', '0.003'))
+                fuel = self.car_ini.get_many('FUEL', {
+                    'FUEL': float, 'MAX_FUEL': float, 'CONSUMPTION': float,
+                }, {'FUEL': 30.0, 'MAX_FUEL': 60.0, 'CONSUMPTION': 0.003})
+                f, mf, con = fuel['FUEL'], fuel['MAX_FUEL'], fuel['CONSUMPTION']
                 self.fuel_start.setValue(f)
                 self.fuel_max.setValue(mf)
                 self.fuel_consumption.setValue(con)
@@ -1507,8 +1531,10 @@ class CarEditorDialog(QDialog):
 
         # CG_LOCATION and WHEELBASE live in suspensions.ini [BASIC]
         if self.suspension_ini and self.suspension_ini.has_section('BASIC'):
-            cg = float(self.suspension_ini.get_value('BASIC', 'CG_LOCATION', '0.5'))
-            wb = float(self.suspension_ini.get_value('BASIC', 'WHEELBASE',   '2.5'))
+            basic = self.suspension_ini.get_many('BASIC', {
+                'CG_LOCATION': float, 'WHEELBASE': float,
+            }, {'CG_LOCATION': 0.5, 'WHEELBASE': 2.5})
+            cg, wb = basic['CG_LOCATION'], basic['WHEELBASE']
             self.cg_location.setValue(cg)
             self.wheelbase.setValue(wb)
             self.original_values.update({'cg_location': cg, 'wheelbase': wb})
@@ -1518,9 +1544,9 @@ class CarEditorDialog(QDialog):
             return
         for i in range(self.wing_count):
             sec = f'WING_{i}'
-            cd    = float(self.aero_ini.get_value(sec, 'CD',    '0.5'))
-            cl    = float(self.aero_ini.get_value(sec, 'CL',    '0.0'))
-            angle = float(self.aero_ini.get_value(sec, 'ANGLE', '0.0'))
+            wing = self.aero_ini.get_many(sec, {'CD': float, 'CL': float, 'ANGLE': float},
+                                          {'CD': 0.5, 'CL': 0.0, 'ANGLE': 0.0})
+            cd, cl, angle = wing['CD'], wing['CL'], wing['ANGLE']
             getattr(self, f'wing_{i}_cd').setValue(cd)
             getattr(self, f'wing_{i}_cl').setValue(cl)
             getattr(self, f'wing_{i}_angle').setValue(angle)
@@ -1531,11 +1557,13 @@ class CarEditorDialog(QDialog):
         if not self.brakes_ini:
             return
         if self.brakes_ini.has_section('DATA'):
-            mt  = float(self.brakes_ini.get_value('DATA', 'MAX_TORQUE',        '2000'))
-            fs  = float(self.brakes_ini.get_value('DATA', 'FRONT_SHARE',       '0.60'))
-            hb  = float(self.brakes_ini.get_value('DATA', 'HANDBRAKE_TORQUE',  '2500'))
-            ca  = int(float(self.brakes_ini.get_value('DATA', 'COCKPIT_ADJUSTABLE', '0')))
-            adj = float(self.brakes_ini.get_value('DATA', 'ADJUST_STEP',       '0.5'))
+            brakes = self.brakes_ini.get_many('DATA', {
+                'MAX_TORQUE': float, 'FRONT_SHARE': float, 'HANDBRAKE_TORQUE': float,
+                'COCKPIT_ADJUSTABLE': int, 'ADJUST_STEP': float,
+            }, {'MAX_TORQUE': 2000.0, 'FRONT_SHARE': 0.60, 'HANDBRAKE_TORQUE': 2500.0,
+                'COCKPIT_ADJUSTABLE': 0, 'ADJUST_STEP': 0.5})
+            mt, fs, hb = brakes['MAX_TORQUE'], brakes['FRONT_SHARE'], brakes['HANDBRAKE_TORQUE']
+            ca, adj = brakes['COCKPIT_ADJUSTABLE'], brakes['ADJUST_STEP']
             self.brake_max_torque.setValue(mt)
             self.brake_front_share.setValue(fs)
             self.brake_handbrake.setValue(hb)
@@ -1578,6 +1606,11 @@ class CarEditorDialog(QDialog):
         if compound_idx is not None:
             self._load_compound_data(compound_idx)
     
+    _TYRE_TYPES = {'NAME': str, 'WIDTH': float, 'RADIUS': float, 'RIM_RADIUS': float,
+                   'DX0': float, 'DY0': float, 'PRESSURE_IDEAL': int}
+    _TYRE_DEFAULTS = {'NAME': 'Unknown', 'WIDTH': 0.225, 'RADIUS': 0.3, 'RIM_RADIUS': 0.24,
+                      'DX0': 1.0, 'DY0': 1.0, 'PRESSURE_IDEAL': 35}
+
     def _load_compound_data(self, compound_idx):
         """Load tyre data for a specific compound index."""
         if not self.tyres_ini:
@@ -1589,13 +1622,10 @@ class CarEditorDialog(QDialog):
         
         # Load FRONT data
         if self.tyres_ini.has_section(front_section):
-            name = self.tyres_ini.get_value(front_section, 'NAME', 'Unknown')
-            width = float(self.tyres_ini.get_value(front_section, 'WIDTH', '0.225'))
-            radius = float(self.tyres_ini.get_value(front_section, 'RADIUS', '0.3'))
-            rim_radius = float(self.tyres_ini.get_value(front_section, 'RIM_RADIUS', '0.24'))
-            dx0 = float(self.tyres_ini.get_value(front_section, 'DX0', '1.0'))
-            dy0 = float(self.tyres_ini.get_value(front_section, 'DY0', '1.0'))
-            pressure_ideal = int(float(self.tyres_ini.get_value(front_section, 'PRESSURE_IDEAL', '35')))
+            tyre = self.tyres_ini.get_many(front_section, self._TYRE_TYPES, self._TYRE_DEFAULTS)
+            name, width, radius = tyre['NAME'], tyre['WIDTH'], tyre['RADIUS']
+            rim_radius, dx0, dy0 = tyre['RIM_RADIUS'], tyre['DX0'], tyre['DY0']
+            pressure_ideal = tyre['PRESSURE_IDEAL']
             
             self.front_name.setText(name)
             self.front_width.setValue(width)
@@ -1607,13 +1637,10 @@ class CarEditorDialog(QDialog):
         
         # Load REAR data
         if self.tyres_ini.has_section(rear_section):
-            name = self.tyres_ini.get_value(rear_section, 'NAME', 'Unknown')
-            width = float(self.tyres_ini.get_value(rear_section, 'WIDTH', '0.225'))
-            radius = float(self.tyres_ini.get_value(rear_section, 'RADIUS', '0.3'))
-            rim_radius = float(self.tyres_ini.get_value(rear_section, 'RIM_RADIUS', '0.24'))
-            dx0 = float(self.tyres_ini.get_value(rear_section, 'DX0', '1.0'))
-            dy0 = float(self.tyres_ini.get_value(rear_section, 'DY0', '1.0'))
-            pressure_ideal = int(float(self.tyres_ini.get_value(rear_section, 'PRESSURE_IDEAL', '35')))
+            tyre = self.tyres_ini.get_many(rear_section, self._TYRE_TYPES, self._TYRE_DEFAULTS)
+            name, width, radius = tyre['NAME'], tyre['WIDTH'], tyre['RADIUS']
+            rim_radius, dx0, dy0 = tyre['RIM_RADIUS'], tyre['DX0'], tyre['DY0']
+            pressure_ideal = tyre['PRESSURE_IDEAL']
             
             self.rear_name.setText(name)
             self.rear_width.setValue(width)
@@ -1652,7 +1679,7 @@ class CarEditorDialog(QDialog):
             QMessageBox.warning(self, "Missing File",
                                 "power.lut not found. Cannot compute power/torque curves.")
             return
-        lut = LUTCurve(path)
+        lut = LUTCurve.cached(path)
         torque_points = lut.get_points()
 
         turbo_configs = []
@@ -1721,8 +1748,17 @@ class CarEditorDialog(QDialog):
         
         from core.speed_calculator import SpeedCalculator
         
-        # Get required data
-        tire_radius = SpeedCalculator.get_tire_radius_from_ini(
+        # One simulator for the labels and the acceleration estimate.
+        # top_speeds(): speed where wheel power = drag + rolling resistance
+        # power, per gear in use (None if the car data lacks a torque curve,
+        # radius or limiter)
+        sim = self._acceleration_sim()
+        top_speeds = sim.top_speeds()
+        forward_keys = [f'GEAR_{i}' for i in range(1, len(sim.gear_ratios) + 1)]
+        power_limited = dict(zip(forward_keys, top_speeds)) if top_speeds is not None else {}
+
+        # Get required data; both numbers use the driven tyre the simulator uses
+        tire_radius = sim.tyre_radius or SpeedCalculator.get_tire_radius_from_ini(
             os.path.join(self.car_data_path, 'tyres.ini')
         )
         max_rpm = SpeedCalculator.get_max_rpm_from_ini(
@@ -1733,6 +1769,7 @@ class CarEditorDialog(QDialog):
         if not tire_radius or not max_rpm:
             for label in self.gear_speed_labels.values():
                 label.setText("(speed: N/A)")
+            self._show_acceleration_estimate(sim, top_speeds)
             return
         
         final_ratio = self.final_ratio.value()
@@ -1745,10 +1782,54 @@ class CarEditorDialog(QDialog):
                 speed = SpeedCalculator.calculate_max_speed(
                     gear_ratio, final_ratio, max_rpm, tire_radius
                 )
-                speed_label.setText(f"(~{speed:.0f} km/h)")
+                if gear_key in power_limited:
+                    top = min(power_limited[gear_key], speed)
+                    speed_label.setText(f"(~{speed:.0f} km/h at limiter · ~{top:.0f} km/h vs drag)")
+                else:
+                    speed_label.setText(f"(~{speed:.0f} km/h)")
             else:
                 speed_label.setText("(speed: N/A)")
 
+        self._show_acceleration_estimate(sim, top_speeds)
+
+    def _acceleration_sim(self):
+        """AccelerationSimulator for the saved car data with the gearbox controls applied."""
+        from core.acceleration_sim import AccelerationSimulator
+
+        sim = AccelerationSimulator.from_car_data(self.car_data_path)
+        sim.gear_ratios = [self.gear_ratios[f'GEAR_{i}'].value()
+                           for i in range(1, self.gear_count.value() + 1)]
+        sim.final_ratio = self.final_ratio.value()
+        sim.shift_time = self.gearbox_up_time.value() / 1000.0
+        return sim
+
+    def _update_acceleration_estimate(self):
+        """Update the 0-100 / 0-200 / quarter-mile estimate from the gearbox controls."""
+        if not hasattr(self, 'accel_label') or not hasattr(self, 'gear_ratios'):
+            return
+
+        sim = self._acceleration_sim()
+        self._show_acceleration_estimate(sim, sim.top_speeds())
+
+    def _show_acceleration_estimate(self, sim, top_speeds):
+        """Show the estimate of sim (top_speeds as returned by sim.top_speeds())."""
+        if not hasattr(self, 'accel_label'):
+            return
+
+        result = sim.run()
+
+        def seconds(value):
+            return "–" if value is None else f"{value:.1f} s"
+
+        if result['quarter_mile'] is None or not top_speeds:
+            self.accel_label.setText("N/A")
+            return
+        self.accel_label.setText(
+            f"0–100 km/h {seconds(result['zero_to_100'])}  ·  "
+            f"0–200 km/h {seconds(result['zero_to_200'])}  ·  "
+            f"¼ mile {seconds(result['quarter_mile'])} @ {result['trap_speed']:.0f} km/h  ·  "
+            f"top ~{max(top_speeds):.0f} km/h")
+
     def _toggle_gear_ratios(self):
         """Toggle visibility of gear ratios section."""
         visible = not self.gear_ratios_grp.isVisible()
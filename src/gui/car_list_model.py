@@ -0,0 +1,222 @@
+"""
+Model/view car list for the main window.
+
+CarListModel holds the car folder names (appended in batches while the
+catalog scan runs) and CarFilterProxyModel presents them either sorted
+and substring-filtered, or in the order given by a ranked search
+(set_ranked_names()).
+
+The proxy is deliberately a QAbstractListModel rather than a
+QSortFilterProxyModel/QAbstractProxyModel: those call back into Python
+(filterAcceptsRow()/lessThan(), or index() twice per row on every
+QListView relayout), which with ~10k cars costs far more than a frame per
+keystroke. Here index() stays in C++, the full sort order is kept up to
+date with bisect as rows arrive, and a filter change is one pass of
+str.__contains__ over pre-lowercased names plus a model reset.
+"""
+
+from bisect import bisect_left
+from typing import List, Optional
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class CarListModel(QAbstractListModel):
+    """Flat list of car folder names, in arrival order"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._lower = []
+        self._row_of = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return self._names[index.row()]
+
+    def set_names(self, names: List[str]):
+        """Replace the whole list"""
+        self.beginResetModel()
+        self._names = list(names)
+        self._lower = [n.lower() for n in self._names]
+        self._row_of = {n: i for i, n in enumerate(self._names)}
+        self.endResetModel()
+
+    def append_names(self, names: List[str]):
+        """Append a batch of names (names already in the list are skipped)"""
+        names = [n for n in dict.fromkeys(names) if n not in self._row_of]
+        if not names:
+            return
+        first = len(self._names)
+        self.beginInsertRows(QModelIndex(), first, first + len(names) - 1)
+        for i, name in enumerate(names, first):
+            self._names.append(name)
+            self._lower.append(name.lower())
+            self._row_of[name] = i
+        self.endInsertRows()
+
+    def clear(self):
+        self.set_names([])
+
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def name_at(self, row: int) -> str:
+        return self._names[row]
+
+    def lower_at(self, row: int) -> str:
+        return self._lower[row]
+
+    def row_of(self, name: str) -> Optional[int]:
+        return self._row_of.get(name)
+
+
+class CarFilterProxyModel(QAbstractListModel):
+    """Sorted/filtered (or search-ranked) view of a CarListModel"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = None
+        self._filter = ''
+        self._all_rows = []   # every source row, in display (sorted) order
+        self._all_keys = []   # sort key of each entry in _all_rows (for bisect)
+        self._rows = []       # source rows passing the filter, in display order
+        self._keys = []
+        self._ranked = None   # source rows of ranked search results, or None
+        self._ranked_pos = {}
+
+    # -- setup -------------------------------------------------------------
+
+    def setSourceModel(self, model: CarListModel):
+        if self._source is not None:
+            self._source.rowsInserted.disconnect(self._on_rows_inserted)
+            self._source.modelReset.disconnect(self._on_source_reset)
+        self._source = model
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.modelReset.connect(self._on_source_reset)
+        self._on_source_reset()
+
+    def sourceModel(self) -> Optional[CarListModel]:
+        return self._source
+
+    def set_filter_text(self, text: str):
+        """Show only names containing text (case-insensitive)"""
+        text = text.lower()
+        if text == self._filter and self._ranked is None:
+            return
+        self._filter = text
+        self._ranked = None
+        self.beginResetModel()
+        self._apply_filter()
+        self.endResetModel()
+
+    def filter_text(self) -> str:
+        return self._filter
+
+    def set_ranked_names(self, names: Optional[List[str]]):
+        """
+        Show exactly these names, in this order (e.g. search results)
+
+        Args:
+            names: Car names best first (unknown names are skipped), or None
+                   to go back to the sorted, substring-filtered list
+        """
+        self.beginResetModel()
+        if names is None:
+            self._ranked = None
+        else:
+            rows = (self._source.row_of(name) for name in names)
+            self._ranked = [row for row in rows if row is not None]
+        self._apply_filter()
+        self.endResetModel()
+
+    def is_ranked(self) -> bool:
+        return self._ranked is not None
+
+    def _apply_filter(self):
+        if self._ranked is not None:
+            self._rows = list(self._ranked)
+            self._ranked_pos = {row: i for i, row in enumerate(self._rows)}
+            return
+        needle = self._filter
+        if not needle:
+            self._rows = list(self._all_rows)
+            self._keys = list(self._all_keys)
+            return
+        pairs = [(r, k) for r, k in zip(self._all_rows, self._all_keys) if needle in k[0]]
+        self._rows = [r for r, _k in pairs]
+        self._keys = [k for _r, k in pairs]
+
+    def _on_source_reset(self):
+        self.beginResetModel()
+        lower = self._source._lower
+        self._all_keys = sorted((name, row) for row, name in enumerate(lower))
+        self._all_rows = [row for _name, row in self._all_keys]
+        self._apply_filter()
+        self.endResetModel()
+
+    def _on_rows_inserted(self, parent, first, last):
+        # CarListModel only appends, so existing source rows never shift
+        lower = self._source._lower
+        needle = self._filter
+        for row in range(first, last + 1):
+            key = (lower[row], row)
+            pos = bisect_left(self._all_keys, key)
+            self._all_keys.insert(pos, key)
+            self._all_rows.insert(pos, row)
+            if self._ranked is not None:
+                continue  # the owner re-ranks when it wants new rows shown
+            if needle and needle not in key[0]:
+                continue
+            pos = bisect_left(self._keys, key)
+            self.beginInsertRows(QModelIndex(), pos, pos)
+            self._rows.insert(pos, row)
+            self._keys.insert(pos, key)
+            self.endInsertRows()
+
+    # -- model -------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        return self._source.data(self._source.index(self._rows[index.row()], 0), role)
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self._source.index(self._rows[proxy_index.row()], 0)
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._ranked is not None:
+            pos = self._ranked_pos.get(row)
+            return QModelIndex() if pos is None else self.index(pos, 0)
+        key = (self._source.lower_at(row), row)
+        pos = bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            return self.index(pos, 0)
+        return QModelIndex()
+
+    # -- helpers -----------------------------------------------------------
+
+    def name_at(self, row: int) -> Optional[str]:
+        """Car name at a proxy row, or None if out of range"""
+        if 0 <= row < len(self._rows):
+            return self._source.name_at(self._rows[row])
+        return None
+
+    def index_of(self, name: str) -> QModelIndex:
+        """Proxy index of a car name (invalid if unknown or filtered out)"""
+        row = self._source.row_of(name)
+        if row is None:
+            return QModelIndex()
+        return self.mapFromSource(self._source.index(row, 0))
@@ -2,6 +2,24 @@
 Curve Editor Widget for editing LUT files visually.
 
 This widget provides an interactive matplotlib-based editor for .lut files.
+
+The curve, the point markers and the selection marker are persistent
+Line2D artists whose data is replaced in place. While a point is dragged
+they are animated: the static part of the axes (grid, ticks, labels) is
+cached by the first full draw after the press and every mouse-move only
+restores that background, redraws the three artists and blits the axes area. The full
+draw with tight_layout() runs when the drag ends. frame_timer records how
+long each drag step takes (shown next to the Remove Point button).
+
+Nothing draws synchronously in an event handler: presses, drag steps,
+zoom and table edits update the data right away and ask the RedrawScheduler for a
+blit or a full redraw, so a burst of mouse-move or wheel events renders
+at most one frame per refresh interval.
+
+Points are hit-tested in display space by a PointHitIndex, which keeps
+the pixel positions of all points in one array and only recomputes them
+after a data or view change. Dragging from empty space draws a selection
+box; dragging any point of a multi-point selection moves the whole group.
 """
 
 import os
@@ -9,14 +27,20 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                              QTableWidget, QTableWidgetItem, QSplitter,
+                              QTableView, QSplitter,
                               QLabel, QSpinBox, QDoubleSpinBox, QMessageBox)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QItemSelection, QItemSelectionModel
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+import numpy as np
 
 from core.lut_parser import LUTCurve
+from gui.frame_timer import FrameTimer
+from gui.lut_table_model import LUTTableModel
+from gui.point_hit_index import PointHitIndex
+from gui.redraw_scheduler import RedrawScheduler
 
 
 class CustomNavigationToolbar(NavigationToolbar):
@@ -37,9 +61,15 @@ class CurveEditorWidget(QWidget):
         super().__init__(parent)
         self.curve = LUTCurve()
         self.selected_point_index = None
+        self.selected_indices = np.empty(0, dtype=int)  # All selected points (group moves)
         self.dragging = False
+        self.pick_radius = 10  # Pixels
+        self._group_origin = None  # (press x, press y, x array, y array) of a group move
+        self._box_start = None  # Display position where a selection box started
         self.zoom_factor = 1.1  # Zoom factor for mouse wheel
         self.drag_axis_limits = None  # Store axis limits during drag to prevent auto-scaling
+        self._background = None  # Axes without the animated artists, cached for blitting
+        self.frame_timer = FrameTimer()  # Duration of each drag step
         
         # Axis labels (can be customized)
         self.x_label = "X"
@@ -62,6 +92,8 @@ class CurveEditorWidget(QWidget):
         self.figure = Figure(figsize=(8, 6))
         self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111)
+        self._create_artists()
+        self.redraw = RedrawScheduler(self.canvas, parent=self)
         
         # Add custom navigation toolbar (without zoom/pan/configure buttons)
         self.toolbar = CustomNavigationToolbar(self.canvas, self)
@@ -78,6 +110,9 @@ class CurveEditorWidget(QWidget):
         button_layout.addWidget(self.remove_point_btn)
         
         button_layout.addStretch()
+        
+        self.frame_label = QLabel()
+        button_layout.addWidget(self.frame_label)
         graph_layout.addLayout(button_layout)
         
         splitter.addWidget(graph_widget)
@@ -88,11 +123,12 @@ class CurveEditorWidget(QWidget):
         
         table_layout.addWidget(QLabel("Data Points:"))
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["X", "Y"])
-        self.table.itemSelectionChanged.connect(self.on_table_selection_changed)
-        self.table.itemChanged.connect(self.on_table_item_changed)
+        self.table_model = LUTTableModel(self)
+        self.table_model.value_edited.connect(self.on_table_value_edited)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.selectionModel().selectionChanged.connect(
+            lambda *_: self.on_table_selection_changed())
         table_layout.addWidget(self.table)
         
         # Add point form (changed to integer spinboxes)
@@ -125,6 +161,7 @@ class CurveEditorWidget(QWidget):
         self.canvas.mpl_connect('button_release_event', self.on_mouse_release)
         self.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
         self.canvas.mpl_connect('scroll_event', self.on_scroll)  # Mouse wheel zoom
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
         # Connect key events for deletion and zoom
         self.canvas.setFocusPolicy(Qt.StrongFocus)
@@ -139,8 +176,8 @@ class CurveEditorWidget(QWidget):
     def load_curve(self, lut_curve):
         """Load a LUT curve into the editor."""
         self.curve = lut_curve
-        self.selected_point_index = None
-        self.update_table()
+        self._set_selection([])
+        self.table_model.set_curve(lut_curve)
         self.plot_curve()
         
     def get_curve(self):
@@ -148,60 +185,137 @@ class CurveEditorWidget(QWidget):
         return self.curve
         
     def update_table(self):
-        """Update the table with current curve points."""
-        self.table.itemChanged.disconnect(self.on_table_item_changed)
-        
-        points = self.curve.get_points()
-        self.table.setRowCount(len(points))
-        
-        for i, (x, y) in enumerate(points):
-            # Round to integers for display
-            self.table.setItem(i, 0, QTableWidgetItem(str(int(round(x)))))
-            self.table.setItem(i, 1, QTableWidgetItem(str(int(round(y)))))
-            
-        self.table.itemChanged.connect(self.on_table_item_changed)
+        """Update the table rows whose points changed."""
+        if self.table_model.rowCount() != len(self.curve):
+            # Added or removed points reset the model; restore the row selection
+            self.table_model.sync()
+            self._select_table_rows(self.selected_indices)
+        else:
+            self.table_model.sync()
+        
+    def _create_artists(self):
+        """Create the persistent curve, point and selection artists."""
+        self._line, = self.ax.plot([], [], 'b-', linewidth=2)
+        self._markers, = self.ax.plot([], [], 'go', markersize=8)
+        self._selected_marker, = self.ax.plot([], [], 'ro', markersize=10)
+        self._box = self.ax.add_patch(Rectangle((0, 0), 0, 0, facecolor='tab:blue',
+                                                edgecolor='tab:blue', alpha=0.2,
+                                                visible=False))
+        self._artists = (self._line, self._markers, self._selected_marker, self._box)
+        self.ax.grid(True, alpha=0.3)
+        self.hit_index = PointHitIndex(self.ax)
+        
+    def _update_artists(self):
+        """Copy the curve points and the selection into the artists."""
+        x, y = self.curve.x, self.curve.y
+        self._line.set_data(x, y)
+        self._markers.set_data(x, y)
+        self.hit_index.set_data(x, y)
+        
+        selected = self.selected_indices
+        if not len(selected) and self.selected_point_index is not None:
+            selected = np.array([self.selected_point_index])
+        selected = selected[(selected >= 0) & (selected < len(x))]
+        self._selected_marker.set_data(x[selected], y[selected])
+        self._selected_marker.set_visible(len(selected) > 0)
+        
+    def _set_selection(self, indices, primary=None):
+        """
+        Set the selected points.
+        
+        Args:
+            indices: Indices of all selected points
+            primary: Point shown in the table and removed by Delete when a
+                     single point is selected (default: the first index)
+        """
+        self.selected_indices = np.unique(np.asarray(indices, dtype=int))
+        if primary is None and len(self.selected_indices):
+            primary = int(self.selected_indices[0])
+        self.selected_point_index = primary
+        self.remove_point_btn.setEnabled(primary is not None)
+        
+    def _select_table_rows(self, rows):
+        """Select rows in the table without re-entering on_table_selection_changed."""
+        selection = QItemSelection()
+        model = self.table_model
+        for row in rows:
+            selection.select(model.index(row, 0), model.index(row, 1))
+        selection_model = self.table.selectionModel()
+        selection_model.blockSignals(True)
+        selection_model.select(selection, QItemSelectionModel.ClearAndSelect)
+        selection_model.blockSignals(False)
+        self.table.viewport().update()
         
     def plot_curve(self):
-        """Plot the curve on the matplotlib canvas."""
-        self.ax.clear()
-        
-        points = self.curve.get_points()
-        if not points:
-            self.ax.set_xlabel(self.x_label)
-            self.ax.set_ylabel(self.y_label)
-            self.ax.grid(True, alpha=0.3)
-            self.canvas.draw()
-            return
-            
-        x_vals = [p[0] for p in points]
-        y_vals = [p[1] for p in points]
-        
-        # Plot the curve (removed label - no legend)
-        self.ax.plot(x_vals, y_vals, 'b-', linewidth=2)
-        
-        # Plot the points
-        if self.selected_point_index is not None:
-            # Highlight selected point (removed labels)
-            for i, (x, y) in enumerate(points):
-                if i == self.selected_point_index:
-                    self.ax.plot(x, y, 'ro', markersize=10)
-                else:
-                    self.ax.plot(x, y, 'go', markersize=8)
-        else:
-            self.ax.plot(x_vals, y_vals, 'go', markersize=8)
-            
+        """Plot the curve on the matplotlib canvas (full draw and layout)."""
+        self._update_artists()
         self.ax.set_xlabel(self.x_label)
         self.ax.set_ylabel(self.y_label)
-        self.ax.grid(True, alpha=0.3)
-        # Removed legend as requested
         
         # Restore axis limits if dragging to prevent auto-scaling
         if self.drag_axis_limits is not None:
             self.ax.set_xlim(self.drag_axis_limits['xlim'])
             self.ax.set_ylim(self.drag_axis_limits['ylim'])
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
+        elif len(self.curve):
+            self.ax.relim(visible_only=True)
+            self.ax.autoscale_view()
+        else:
+            self.ax.set_xlim(0, 1)
+            self.ax.set_ylim(0, 1)
+        
+        self._request_full_draw()
+        
+    def _request_full_draw(self):
+        """Relayout and redraw the whole figure in the next frame."""
+        self.redraw.request(self.figure.tight_layout)
+        self.redraw.request_draw()
+        
+    def _update_frame_label(self):
+        if self.frame_timer.count:
+            self.frame_label.setText(f"{self.frame_timer.summary()} · "
+                                     f"{self.redraw.merged} merged, {self.redraw.dropped} dropped")
+        
+    def _begin_drag(self):
+        """Animate the curve artists; the next full draw caches the background."""
+        self.redraw.flush()
+        self.frame_timer.reset()
+        self.redraw.reset_stats()
+        for artist in self._artists:
+            artist.set_animated(True)
+        self._update_artists()
+        # No draw in the press handler: _on_draw captures the background when
+        # the scheduled frame draws, and _blit() asks for a draw until then
+        self._background = None
+        self.redraw.request_draw()
+        
+    def _end_drag(self):
+        """Stop blitting and do the full draw with layout."""
+        self.redraw.flush()  # Render the last drag step
+        for artist in self._artists:
+            artist.set_animated(False)
+        self._background = None
+        self._request_full_draw()
+        self._update_frame_label()
+        
+    def _on_draw(self, event):
+        """Re-capture the blit background after every full draw during a drag."""
+        if self.dragging or self._box_start is not None:
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+            self._draw_animated()
+        
+    def _draw_animated(self):
+        for artist in self._artists:
+            self.ax.draw_artist(artist)
+        
+    def _blit(self):
+        """Redraw only the animated artists over the cached background."""
+        if self._background is None:
+            self.redraw.request_draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._update_artists()
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
         
     def on_mouse_press(self, event):
         """Handle mouse press event."""
@@ -209,77 +323,121 @@ class CurveEditorWidget(QWidget):
             return
             
         # Check if clicking on a point
-        points = self.curve.get_points()
-        if not points:
+        if not len(self.curve):
             return
             
-        # Find nearest point
-        min_dist = float('inf')
-        nearest_idx = None
-        
-        for i, (x, y) in enumerate(points):
-            # Transform to display coordinates for accurate distance
-            display_point = self.ax.transData.transform((x, y))
-            display_click = self.ax.transData.transform((event.xdata, event.ydata))
-            dist = ((display_point[0] - display_click[0])**2 + 
-                   (display_point[1] - display_click[1])**2)**0.5
-            
-            if dist < min_dist:
-                min_dist = dist
-                nearest_idx = i
-                
-        # Select point if close enough (within 10 pixels)
-        if min_dist < 10:
-            self.selected_point_index = nearest_idx
-            self.dragging = True
-            self.remove_point_btn.setEnabled(True)
-            
-            # Store current axis limits to prevent auto-scaling during drag
-            self.drag_axis_limits = {
-                'xlim': self.ax.get_xlim(),
-                'ylim': self.ax.get_ylim()
-            }
+        # Disable toolbar navigation to prevent graph panning during drag
+        if hasattr(self.toolbar, 'mode') and self.toolbar.mode:
+            self.toolbar.mode = ''
             
-            # Disable toolbar navigation to prevent graph panning during drag
-            if hasattr(self.toolbar, 'mode') and self.toolbar.mode:
-                self.toolbar.mode = ''
+        nearest_idx = self.hit_index.nearest(event.x, event.y, self.pick_radius)
+        if nearest_idx is None:
+            # Empty space: start a selection box
+            self._box_start = (event.x, event.y, event.xdata, event.ydata)
+            self._box.set_bounds(event.xdata, event.ydata, 0, 0)
+            self._box.set_visible(True)
+            self._begin_drag()
+            return
             
+        if len(self.selected_indices) > 1 and nearest_idx in self.selected_indices:
+            # Move the whole selection
+            self.selected_point_index = nearest_idx
+            self._group_origin = (event.xdata, event.ydata,
+                                  self.curve.x.copy(), self.curve.y.copy())
+        else:
+            self._set_selection([nearest_idx])
             # Update table selection
             self.table.selectRow(nearest_idx)
-            
-            self.plot_curve()
+        self.dragging = True
+        
+        # Store current axis limits to prevent auto-scaling during drag
+        self.drag_axis_limits = {
+            'xlim': self.ax.get_xlim(),
+            'ylim': self.ax.get_ylim()
+        }
+        
+        self._begin_drag()
             
     def on_mouse_release(self, event):
         """Handle mouse release event."""
-        if self.dragging:
+        if self._box_start is not None:
+            self._finish_box_selection(event)
+        elif self.dragging:
             self.dragging = False
+            self._group_origin = None
+            self._end_drag()
             self.drag_axis_limits = None  # Clear stored limits after drag completes
             self.curve_changed.emit()
             
+    def _finish_box_selection(self, event):
+        """Select the points inside the box (a click without a box keeps the selection)."""
+        x0, y0 = self._box_start[:2]
+        x1 = event.x if event.x is not None else x0
+        y1 = event.y if event.y is not None else y0
+        self._box_start = None
+        self._box.set_visible(False)
+        if abs(x1 - x0) >= 3 or abs(y1 - y0) >= 3:
+            indices = self.hit_index.in_box(x0, y0, x1, y1)
+            self._set_selection(indices)
+            self._select_table_rows(indices)
+            self._update_artists()
+        self._end_drag()
+            
     def on_mouse_move(self, event):
         """Handle mouse move event for dragging."""
+        if self._box_start is not None:
+            if event.inaxes == self.ax:
+                x0, y0 = self._box_start[2:]
+                self._box.set_bounds(x0, y0, event.xdata - x0, event.ydata - y0)
+                self.redraw.request(self._blit)
+            return
+            
         if not self.dragging or self.selected_point_index is None:
             return
             
         if event.inaxes != self.ax:
             return
             
-        # Update point position (round to integer)
-        new_x = round(event.xdata)
-        new_y = round(event.ydata)
-        
-        self.curve.update_point(self.selected_point_index, new_x, new_y)
-        self.curve.sort_points()
-        
-        # Find new index after sorting
-        points = self.curve.get_points()
-        for i, (x, y) in enumerate(points):
-            if abs(x - new_x) < 0.5 and abs(y - new_y) < 0.5:
-                self.selected_point_index = i
-                break
-                
-        self.update_table()
-        self.plot_curve()
+        if self._group_origin is not None:
+            self._move_group(event.xdata, event.ydata)
+        else:
+            # Update point position (round to integer)
+            new_x = round(event.xdata)
+            new_y = round(event.ydata)
+            
+            self.selected_point_index = self.curve.move_point(
+                self.selected_point_index, new_x, new_y)
+            self.selected_indices = np.array([self.selected_point_index])
+            
+        # Table and plot follow once per frame, however many moves arrive
+        self.redraw.request(self._render_drag)
+        
+    def _render_drag(self):
+        """Show the current drag state: table rows and a blitted frame."""
+        with self.frame_timer.frame():
+            self.update_table()
+            self._blit()
+        self._update_frame_label()
+        
+    def _move_group(self, xdata, ydata):
+        """Offset every selected point by the mouse movement since the press."""
+        press_x, press_y, x, y = self._group_origin
+        selected = self.selected_indices
+        x = x.copy()
+        y = y.copy()
+        x[selected] = np.round(x[selected] + (xdata - press_x))
+        y[selected] = np.round(y[selected] + (ydata - press_y))
+        
+        # Re-sort and follow the selected points to their new rows
+        order = np.argsort(x, kind='stable')
+        self.curve.points = np.column_stack((x[order], y[order]))
+        new_index = np.empty_like(order)
+        new_index[order] = np.arange(len(order))
+        self.selected_point_index = int(new_index[self.selected_point_index])
+        self.selected_indices = np.sort(new_index[selected])
+        # Keep the origin in the new order so the next move starts from it
+        self._group_origin = (press_x, press_y,
+                              self._group_origin[2][order], self._group_origin[3][order])
         
     def on_key_press(self, event):
         """Handle key press events."""
@@ -323,7 +481,7 @@ class CurveEditorWidget(QWidget):
         self.ax.set_xlim([xdata - new_width * (1 - relx), xdata + new_width * relx])
         self.ax.set_ylim([ydata - new_height * (1 - rely), ydata + new_height * rely])
         
-        self.canvas.draw()
+        self.redraw.request_draw()
     
     def zoom(self, scale_factor):
         """Zoom in or out by scale_factor."""
@@ -341,7 +499,7 @@ class CurveEditorWidget(QWidget):
         self.ax.set_xlim([xcenter - new_width / 2, xcenter + new_width / 2])
         self.ax.set_ylim([ycenter - new_height / 2, ycenter + new_height / 2])
         
-        self.canvas.draw()
+        self.redraw.request_draw()
             
     def add_point_from_form(self):
         """Add a point from the form inputs."""
@@ -349,26 +507,25 @@ class CurveEditorWidget(QWidget):
         y = int(self.y_input.value())
         
         self.curve.add_point(x, y)
-        self.curve.sort_points()
         
         self.update_table()
         self.plot_curve()
         self.curve_changed.emit()
         
     def remove_selected_point(self):
-        """Remove the currently selected point."""
+        """Remove the currently selected point(s)."""
         if self.selected_point_index is None:
             return
             
-        points = self.curve.get_points()
-        if len(points) <= 1:
+        selected = self.selected_indices if len(self.selected_indices) else [self.selected_point_index]
+        if len(self.curve) - len(selected) < 1:
             QMessageBox.warning(self, "Cannot Remove", 
                               "Cannot remove the last point. A curve must have at least one point.")
             return
             
-        self.curve.remove_point(self.selected_point_index)
-        self.selected_point_index = None
-        self.remove_point_btn.setEnabled(False)
+        for index in sorted(selected, reverse=True):
+            self.curve.remove_point(int(index))
+        self._set_selection([])
         
         self.update_table()
         self.plot_curve()
@@ -378,34 +535,21 @@ class CurveEditorWidget(QWidget):
         """Handle table selection changes."""
         selected_rows = self.table.selectionModel().selectedRows()
         if selected_rows:
-            self.selected_point_index = selected_rows[0].row()
-            self.remove_point_btn.setEnabled(True)
+            rows = sorted(index.row() for index in selected_rows)
+            self._set_selection(rows, primary=selected_rows[0].row())
             self.plot_curve()
         else:
-            self.selected_point_index = None
-            self.remove_point_btn.setEnabled(False)
-            
-    def on_table_item_changed(self, item):
-        """Handle manual table edits."""
-        row = item.row()
-        col = item.column()
-        
-        try:
-            value = int(item.text())  # Parse as integer
+            self._set_selection([])
             
-            points = self.curve.get_points()
-            if row < len(points):
-                x, y = points[row]
-                if col == 0:  # X value changed
-                    self.curve.update_point(row, value, y)
-                else:  # Y value changed
-                    self.curve.update_point(row, x, value)
-                    
-                self.curve.sort_points()
-                self.update_table()
-                self.plot_curve()
-                self.curve_changed.emit()
+    def on_table_value_edited(self, row, col, value):
+        """Handle manual table edits (the model rejects non-integer text)."""
+        if row < len(self.curve):
+            x, y = self.curve.x[row], self.curve.y[row]
+            if col == 0:  # X value changed
+                self.curve.move_point(row, value, y)
+            else:  # Y value changed
+                self.curve.move_point(row, x, value)
                 
-        except ValueError:
-            # Invalid number, revert
             self.update_table()
+            self.plot_curve()
+            self.curve_changed.emit()
@@ -0,0 +1,65 @@
+"""
+Frame-time counter for interactive matplotlib views.
+
+Wraps the work done for one frame (e.g. one mouse-move during a drag)
+and keeps a rolling window of durations, so a view can show how long
+its frames take and which frame rate that allows.
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class FrameTimer:
+    """Rolling statistics of frame durations"""
+
+    def __init__(self, window: int = 120):
+        """
+        Args:
+            window: Number of recent frames the statistics cover
+        """
+        self._times = deque(maxlen=window)
+        self.count = 0   # frames since the last reset(), not limited to the window
+
+    @contextmanager
+    def frame(self):
+        """Time the enclosed block as one frame"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - start)
+
+    def record(self, seconds: float):
+        """Add one frame duration (seconds)"""
+        self._times.append(seconds)
+        self.count += 1
+
+    def reset(self):
+        self._times.clear()
+        self.count = 0
+
+    @property
+    def last_ms(self) -> float:
+        return self._times[-1] * 1000 if self._times else 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return sum(self._times) / len(self._times) * 1000 if self._times else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return max(self._times) * 1000 if self._times else 0.0
+
+    @property
+    def fps(self) -> float:
+        """Frame rate the mean frame time allows (0.0 without frames)"""
+        mean = self.mean_ms
+        return 1000.0 / mean if mean > 0 else 0.0
+
+    def summary(self) -> str:
+        """Short text for a status label, e.g. '2.1 ms/frame (max 4.0) · 476 fps'"""
+        if not self._times:
+            return ''
+        return f"{self.mean_ms:.1f} ms/frame (max {self.max_ms:.1f}) · {self.fps:.0f} fps"
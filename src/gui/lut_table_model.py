@@ -0,0 +1,110 @@
+"""
+Table model for the points of a LUTCurve.
+
+The curve editor used a QTableWidget and rebuilt every item on each
+change, including every mouse-move of a drag. LUTTableModel instead
+presents the curve's point arrays directly. It keeps a snapshot of the
+values it last reported (rounded, as displayed), and sync() compares the
+curve against that snapshot in one vectorized step and emits dataChanged
+only for the runs of rows whose value or order changed. Moving one point
+is then one dataChanged for one row (or for the rows it passed),
+whatever the length of the curve. Adding or removing points resets the
+model.
+
+Edits made in the view are not applied to the curve here; they are
+forwarded as value_edited(row, column, value) so the editor can update,
+re-sort and redraw the curve in one place.
+"""
+
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+from core.lut_parser import LUTCurve
+
+
+class LUTTableModel(QAbstractTableModel):
+    """Two-column (X, Y) table over the points of a LUTCurve"""
+
+    # row, column (0 = X, 1 = Y), new integer value entered in the view
+    value_edited = pyqtSignal(int, int, int)
+
+    HEADERS = ("X", "Y")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._curve = LUTCurve()
+        self._x = np.empty(0)   # values as last reported to the view (rounded)
+        self._y = np.empty(0)
+
+    def set_curve(self, curve: LUTCurve):
+        """Show another curve (model reset)"""
+        self._curve = curve
+        self.beginResetModel()
+        self._snapshot()
+        self.endResetModel()
+
+    def _snapshot(self):
+        self._x = np.round(self._curve.x)
+        self._y = np.round(self._curve.y)
+
+    def sync(self):
+        """
+        Report changes of the curve since the last call
+
+        Returns:
+            Number of rows reported as changed (all rows after a reset)
+        """
+        x = np.round(self._curve.x)
+        y = np.round(self._curve.y)
+        if len(x) != len(self._x):
+            self.beginResetModel()
+            self._snapshot()
+            self.endResetModel()
+            return len(x)
+
+        changed = np.flatnonzero((x != self._x) | (y != self._y))
+        if not len(changed):
+            return 0
+        self._x, self._y = x, y
+        # One dataChanged per run of consecutive rows
+        breaks = np.flatnonzero(np.diff(changed) > 1)
+        starts = np.concatenate(([changed[0]], changed[breaks + 1]))
+        ends = np.concatenate((changed[breaks], [changed[-1]]))
+        for first, last in zip(starts.tolist(), ends.tolist()):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 1))
+        return len(changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._x)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        values = self._x if index.column() == 0 else self._y
+        return str(int(values[index.row()]))
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Forward a valid integer edit as value_edited (invalid text is rejected)"""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            return False
+        self.value_edited.emit(index.row(), index.column(), number)
+        return True
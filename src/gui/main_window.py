@@ -6,11 +6,12 @@ import sys
 import os
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QListWidget, QLabel, QPushButton, QStatusBar,
+    QListView, QLabel, QPushButton, QStatusBar,
     QMenuBar, QAction, QFileDialog, QMessageBox,
-    QSplitter, QGroupBox, QTextEdit, QDialog, QLineEdit, QCheckBox
+    QSplitter, QGroupBox, QTextEdit, QDialog, QLineEdit, QCheckBox,
+    QProgressDialog
 )
-from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtCore import Qt, QSize, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QIcon, QPixmap
 
 # Add parent directory to path
@@ -18,12 +19,74 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from core.config import ConfigManager
 from core.car_file_manager import CarFileManager
+from core.car_catalog import CarCatalog
+from core.car_search import CarSearchIndex
 from core.component_library import ComponentLibrary
 from gui.car_editor_dialog import CarEditorDialog
 from gui.component_library_dialog import ComponentLibraryDialog
 from gui.ui_editor_dialog import UIEditorDialog
 from gui.theme import COLORS, btn_primary, btn_outline, section_title, card_style, muted_text
 from gui.toast import show_toast
+from gui.thumbnail_cache import ThumbnailCache, ThumbnailLoader
+from gui.car_list_model import CarListModel, CarFilterProxyModel
+
+
+class BulkUnpackThread(QThread):
+    """Runs CarFileManager.unpack_all off the GUI thread"""
+
+    progress = pyqtSignal(int, int, str, str)  # done, total, car_name, status
+    finished_with = pyqtSignal(dict)
+
+    def __init__(self, car_manager, car_names, delete_acd, parent=None):
+        super().__init__(parent)
+        self.car_manager = car_manager
+        self.car_names = car_names
+        self.delete_acd = delete_acd
+        self._cancel = False
+
+    def cancel(self):
+        """Request cancellation (cars already being unpacked will finish)"""
+        self._cancel = True
+
+    def run(self):
+        results = self.car_manager.unpack_all(
+            self.car_names,
+            delete_acd=self.delete_acd,
+            progress_callback=self.progress.emit,
+            is_cancelled=lambda: self._cancel,
+        )
+        self.finished_with.emit(results)
+
+
+class CatalogScanThread(QThread):
+    """Refreshes the car catalog off the GUI thread, streaming names in batches"""
+
+    batch = pyqtSignal(list)                 # car names whose records are ready
+    progress = pyqtSignal(int, int, str)     # done, total, car_name (re-read cars)
+    finished_with = pyqtSignal(dict)
+
+    def __init__(self, db_path, cars_path, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.cars_path = cars_path
+        self._cancel = False
+
+    def cancel(self):
+        """Request cancellation (checked between directory entries and cars)"""
+        self._cancel = True
+
+    def run(self):
+        # sqlite3 connections are per thread: open a catalog just for the scan
+        catalog = CarCatalog(self.db_path, self.cars_path)
+        try:
+            stats = catalog.refresh(
+                progress_callback=self.progress.emit,
+                is_cancelled=lambda: self._cancel,
+                batch_callback=self.batch.emit,
+            )
+        finally:
+            catalog.close()
+        self.finished_with.emit(stats)
 
 
 class MainWindow(QMainWindow):
@@ -36,13 +99,27 @@ class MainWindow(QMainWindow):
         # Initialize managers
         self.config_manager = ConfigManager()
         self.car_manager = None
+        self.catalog = None
+        self._scan_thread = None
+        self._bulk_unpack_thread = None
         self.component_library = ComponentLibrary()
+
+        # Preview thumbnails are decoded off the GUI thread and cached on disk
+        self.thumbnail_cache = ThumbnailCache(self.config_manager.get_thumbnail_cache_path())
+        self.thumbnail_cache.prune()
+        self.thumbnail_loader = ThumbnailLoader(self.thumbnail_cache, parent=self)
+        self.thumbnail_loader.ready.connect(self._on_thumbnail_ready)
+        self._preview_path = None
         
         # Current car
         self.current_car = None
         
-        # Full car list for filtering
-        self.all_cars = []
+        # Full car list (model) and the sorted/filtered view of it (proxy)
+        self.car_model = CarListModel(self)
+        self.car_proxy = CarFilterProxyModel(self)
+        self.car_proxy.setSourceModel(self.car_model)
+        # Ranked search over catalog metadata, fed as scan batches arrive
+        self.search_index = CarSearchIndex()
         
         self.init_ui()
         self.load_cars()
@@ -115,6 +192,19 @@ class MainWindow(QMainWindow):
         library_action = QAction("Component Library...", self)
         library_action.triggered.connect(self.open_component_library)
         tools_menu.addAction(library_action)
+
+        tools_menu.addSeparator()
+
+        # Pack data/ into data.acd for distribution
+        pack_action = QAction("📦  Pack data.acd (Selected Car)", self)
+        pack_action.setToolTip("Pack the selected car's data/ folder into data.acd")
+        pack_action.triggered.connect(self.pack_car_acd)
+        tools_menu.addAction(pack_action)
+
+        unpack_all_action = QAction("📂  Unpack All Packed Cars...", self)
+        unpack_all_action.setToolTip("Unpack data.acd for every car in parallel")
+        unpack_all_action.triggered.connect(self.unpack_all_cars)
+        tools_menu.addAction(unpack_all_action)
         
         # Help menu
         help_menu = menubar.addMenu("&Help")
@@ -132,8 +222,13 @@ class MainWindow(QMainWindow):
         search_layout = QHBoxLayout()
         search_label = QLabel("Search:")
         self.search_box = QLineEdit()
-        self.search_box.setPlaceholderText("Filter cars...")
-        self.search_box.textChanged.connect(self.filter_cars)
+        self.search_box.setPlaceholderText("Search name, brand, tags, author...")
+        # Debounce typing: filter once the user pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self.filter_cars(self.search_box.text()))
+        self.search_box.textChanged.connect(self._filter_timer.start)
         
         clear_btn = QPushButton("✕")
         clear_btn.setMaximumWidth(30)
@@ -146,8 +241,15 @@ class MainWindow(QMainWindow):
         layout.addLayout(search_layout)
         
         # Car list
-        self.car_list = QListWidget()
-        self.car_list.currentItemChanged.connect(self.on_car_selected)
+        self.car_list = QListView()
+        self.car_list.setModel(self.car_proxy)
+        # All rows have the same height: lets the view skip per-row size queries
+        self.car_list.setUniformItemSizes(True)
+        # Lay out rows in chunks across event loop passes instead of all at once
+        self.car_list.setLayoutMode(QListView.Batched)
+        self.car_list.setBatchSize(500)
+        self.car_list.setEditTriggers(QListView.NoEditTriggers)
+        self.car_list.selectionModel().currentChanged.connect(self.on_car_selected)
         layout.addWidget(self.car_list)
         
         # Refresh button
@@ -274,10 +376,13 @@ class MainWindow(QMainWindow):
             self.config_manager.set_show_disclaimer(False)
 
     def load_cars(self):
-        """Load list of cars from AC directory"""
+        """Load list of cars from AC directory (scanned in the background)"""
         ac_path = self.config_manager.get_ac_path()
         cars_path = self.config_manager.get_cars_path()
         
+        # A new scan (e.g. after set_ac_path) supersedes any running one
+        self._cancel_scan()
+
         if not os.path.exists(cars_path):
             self.statusBar.showMessage(f"AC cars path not found: {cars_path}")
             QMessageBox.warning(
@@ -289,53 +394,119 @@ class MainWindow(QMainWindow):
             return
         
         self.car_manager = CarFileManager(cars_path)
-        self.all_cars = self.car_manager.get_car_list()
+        if self.catalog:
+            self.catalog.close()
+        db_path = self.config_manager.get_catalog_path()
+        self.catalog = CarCatalog(db_path, cars_path)
         
-        # Clear search box and display all cars
+        # Clear search box and list; the scan fills it batch by batch
         self.search_box.clear()
-        self.car_list.clear()
-        self.car_list.addItems(self.all_cars)
-        
-        self.statusBar.showMessage(f"Loaded {len(self.all_cars)} cars from {cars_path}")
+        self._filter_timer.stop()
+        self.car_proxy.set_filter_text('')
+        self.car_model.clear()
+        self.search_index = CarSearchIndex()
+        self.statusBar.showMessage(f"Scanning {cars_path}...")
+
+        thread = CatalogScanThread(db_path, cars_path, self)
+        self._scan_thread = thread
+        thread.batch.connect(lambda names, t=thread: self._on_scan_batch(t, names))
+        thread.progress.connect(lambda done, total, name, t=thread: self._on_scan_progress(t, done, total, name))
+        thread.finished_with.connect(lambda stats, t=thread: self._on_scan_finished(t, cars_path, stats))
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+
+    def _cancel_scan(self):
+        """Cancel the running catalog scan, if any (it finishes on its own)"""
+        if self._scan_thread is not None:
+            self._scan_thread.cancel()
+            self._scan_thread = None
+
+    def _on_scan_batch(self, thread, names):
+        """Append a batch of scanned cars to the list"""
+        if thread is not self._scan_thread:
+            return
+        for record in self.catalog.get_cars(names):
+            self.search_index.add(record['name'], record)
+        self.car_model.append_names(names)
+        if self.car_proxy.is_ranked():
+            self.filter_cars(self.search_box.text())
+        self.statusBar.showMessage(f"Scanning cars... {self.car_model.rowCount()} found")
+
+    def _on_scan_progress(self, thread, done, total, car_name):
+        if thread is not self._scan_thread:
+            return
+        self.statusBar.showMessage(
+            f"Reading car details {done}/{total}: {car_name} ({self.car_model.rowCount()} listed)"
+        )
+
+    def _on_scan_finished(self, thread, cars_path, stats):
+        if thread is not self._scan_thread:
+            return
+        self._scan_thread = None
+        # Cars removed from disk since the last scan were never listed
+        for name in set(self.search_index.names()) - set(self.car_model.names()):
+            self.search_index.remove(name)
+        if stats['cancelled']:
+            self.statusBar.showMessage(f"Scan cancelled ({self.car_model.rowCount()} cars listed)")
+            return
+        self.statusBar.showMessage(
+            f"Loaded {self.car_model.rowCount()} cars from {cars_path} "
+            f"({stats['added'] + stats['updated']} re-read, {stats['unchanged']} cached)"
+        )
+
+    def closeEvent(self, event):
+        """Stop background scan/unpack/decode work before the window goes away"""
+        self._cancel_scan()
+        # Scans superseded by a reload may still be winding down too. Wait
+        # without a timeout: destroying a running QThread aborts the process,
+        # and a cancelled scan stops at its next directory entry or car.
+        for thread in self.findChildren(CatalogScanThread):
+            thread.cancel()
+            thread.wait()
+        # Same for Unpack All: cars not yet started are cancelled, running ones finish
+        if self._bulk_unpack_thread is not None:
+            # No results dialog for a window that is going away
+            self._bulk_unpack_thread.finished_with.disconnect()
+            self._bulk_unpack_thread.cancel()
+            self._bulk_unpack_thread.wait()
+            self._bulk_unpack_thread = None
+        self.thumbnail_loader.shutdown()
+        super().closeEvent(event)
         
     def on_car_selected(self, current, previous):
         """Handle car selection"""
-        if current is None:
+        if current is None or not current.isValid():
             return
         
-        car_name = current.text()
+        car_name = current.data()
         self.current_car = car_name
 
         # Hide disclaimer when a car is selected
         self.disclaimer_label.setVisible(False)
         
-        # Get car info
-        car_info = self.car_manager.get_car_info(car_name)
+        # Get car info from the catalog (re-read the car if it is missing)
+        car_info = self.catalog.get_car(car_name) or self._refresh_car(car_name)
+        if car_info is None:
+            self.statusBar.showMessage(f"Car '{car_name}' no longer exists")
+            return
         
         # Update UI
         self.car_name_label.setText(car_info.get('display_name', car_name))
         
-        # Load and display preview image
-        preview_path = self.car_manager.get_car_preview_path(car_name)
-        if preview_path:
-            pixmap = QPixmap(preview_path)
-            if not pixmap.isNull():
-                # Scale to fit while maintaining aspect ratio
-                # Use fallback dimensions if the label hasn't been laid out yet
-                label_w = max(self.preview_label.width() - 10, 300)
-                label_h = max(self.preview_label.height() - 10, 150)
-                scaled_pixmap = pixmap.scaled(
-                    label_w,
-                    label_h,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.preview_label.setPixmap(scaled_pixmap)
+        # Show preview thumbnail (decoded in the background unless cached)
+        self._preview_path = car_info['preview_path']
+        self.thumbnail_loader.clear_pending()
+        if self._preview_path:
+            image = self.thumbnail_loader.request(self._preview_path, self._preview_size(), priority=1)
+            if image is not None:
+                self.preview_label.setPixmap(QPixmap.fromImage(image))
             else:
-                self.preview_label.setText("Failed to load preview image")
+                self.preview_label.clear()
+                self.preview_label.setText("Loading preview...")
         else:
             self.preview_label.clear()
             self.preview_label.setText("No preview image")
+        self._prefetch_neighbour_previews()
         
         # Build details text
         details = []
@@ -344,7 +515,29 @@ class MainWindow(QMainWindow):
             details.append(f"Brand: {car_info['brand']}")
         details.append(f"Has data folder: {'Yes' if car_info['has_data_folder'] else 'No'}")
         details.append(f"Has data.acd: {'Yes' if car_info['has_data_acd'] else 'No'}")
-        
+
+        # Physics stats (decoded straight from data.acd for packed cars)
+        physics = car_info['physics']
+        if physics['source']:
+            details.append("")
+            if physics['source'] == 'acd':
+                details.append("Physics (read from data.acd):")
+            else:
+                details.append("Physics:")
+            if physics['total_mass'] is not None:
+                details.append(f"  Total mass: {physics['total_mass']:.0f} kg")
+            if physics['limiter'] is not None:
+                details.append(f"  Limiter: {physics['limiter']} RPM")
+            if physics['peak_torque'] is not None:
+                details.append(
+                    f"  Peak torque (LUT): {physics['peak_torque']:.0f} Nm "
+                    f"@ {physics['peak_torque_rpm']:.0f} RPM"
+                )
+            if physics['turbo'] is not None:
+                details.append(f"  Turbo: {'Yes' if physics['turbo'] else 'No'}")
+            if physics['gears'] is not None:
+                details.append(f"  Gears: {physics['gears']}")
+
         self.car_details.setPlainText('\n'.join(details))
         
         # Enable edit button if car has data folder OR data.acd
@@ -368,28 +561,74 @@ class MainWindow(QMainWindow):
                 status_msg += " (will need unpacking)"
             self.statusBar.showMessage(status_msg)
     
-    def filter_cars(self, text):
-        """Filter car list based on search text"""
-        if not text:
-            # Show all cars if search is empty
-            self.car_list.clear()
-            self.car_list.addItems(self.all_cars)
+    def _refresh_car(self, car_name):
+        """Re-read one car into the catalog and the search index"""
+        record = self.catalog.refresh_car(car_name)
+        if record is None:
+            self.search_index.remove(car_name)
+        else:
+            self.search_index.add(car_name, record)
+        return record
+
+    def _preview_size(self):
+        """Thumbnail bounding box for the preview label"""
+        # Use fallback dimensions if the label hasn't been laid out yet
+        return QSize(max(self.preview_label.width() - 10, 300),
+                     max(self.preview_label.height() - 10, 150))
+
+    def _on_thumbnail_ready(self, path, size, image):
+        """Show a decoded thumbnail if it is still the one being waited for"""
+        if path != self._preview_path or size != self._preview_size():
+            return  # prefetched neighbour or outdated request
+        if image.isNull():
+            self.preview_label.setText("Failed to load preview image")
+        else:
+            self.preview_label.setPixmap(QPixmap.fromImage(image))
+
+    def _prefetch_neighbour_previews(self, radius=2):
+        """Decode previews of the cars around the selection ahead of time"""
+        row = self.car_list.currentIndex().row()
+        if row < 0 or not self.catalog:
             return
-        
-        # Filter cars that match the search text (case-insensitive)
-        search_lower = text.lower()
-        filtered_cars = [car for car in self.all_cars if search_lower in car.lower()]
-        
-        # Update list
-        self.car_list.clear()
-        self.car_list.addItems(filtered_cars)
-        
+        size = self._preview_size()
+        for offset in [d for r in range(1, radius + 1) for d in (r, -r)]:
+            name = self.car_proxy.name_at(row + offset)
+            if name is None:
+                continue
+            car = self.catalog.get_car(name)
+            if car and car['preview_path']:
+                self.thumbnail_loader.prefetch(car['preview_path'], size)
+
+    def filter_cars(self, text):
+        """Show cars matching the search text, best match first"""
+        if text.strip():
+            results = self.search_index.search(text)
+            self.car_proxy.set_ranked_names([name for name, _score in results])
+        else:
+            self.car_proxy.set_ranked_names(None)
+
+        # The proxy is reset by a new filter; keep the selected car selected
+        if self.current_car:
+            index = self.car_proxy.index_of(self.current_car)
+            if index.isValid():
+                self.car_list.setCurrentIndex(index)
+                if not self.car_proxy.is_ranked():
+                    self.car_list.scrollTo(index)
+        if self.car_proxy.is_ranked():
+            self.car_list.scrollToTop()  # best matches first
+
         # Update status bar
-        self.statusBar.showMessage(f"Showing {len(filtered_cars)} of {len(self.all_cars)} cars")
+        total = self.car_model.rowCount()
+        if text:
+            self.statusBar.showMessage(f"Showing {self.car_proxy.rowCount()} of {total} cars")
+        else:
+            self.statusBar.showMessage(f"Showing all {total} cars")
     
     def clear_filter(self):
         """Clear the search filter"""
         self.search_box.clear()
+        self._filter_timer.stop()
+        self.filter_cars('')
         
     def set_ac_path(self):
         """Set Assetto Corsa installation path"""
@@ -504,10 +743,12 @@ class MainWindow(QMainWindow):
                         self,
                         "Unpacking Failed",
                         "Failed to unpack data.acd file.\n"
-                        "Make sure quickBMS is installed in the tools folder."
+                        "The archive may be encrypted or the car folder may have been renamed "
+                        "(the folder name is the decryption key)."
                     )
                     return
                 
+                self._refresh_car(self.current_car)
                 self.statusBar.showMessage("data.acd unpacked successfully")
             else:
                 return
@@ -526,6 +767,8 @@ class MainWindow(QMainWindow):
         # Open car editor dialog
         editor = CarEditorDialog(self.current_car, car_data_path, self)
         result = editor.exec_()
+        # Physics files changed inside data/ do not bump the folder mtimes
+        self._refresh_car(self.current_car)
         
         # After editing, prompt to rename data.acd if it still exists
         if result == QDialog.Accepted and self.car_manager.has_data_acd(self.current_car):
@@ -541,6 +784,7 @@ class MainWindow(QMainWindow):
             
             if reply == QMessageBox.Yes:
                 if self.car_manager.delete_data_acd(self.current_car):
+                    self._refresh_car(self.current_car)
                     self.statusBar.showMessage("data.acd renamed to data.acd.bak")
                     show_toast(self, "✅  data.acd renamed — your changes will be used in-game.", kind='success')
                 else:
@@ -550,6 +794,134 @@ class MainWindow(QMainWindow):
                         "Failed to rename data.acd. You may need to rename it manually."
                     )
         
+    def pack_car_acd(self):
+        """Pack the current car's data/ folder into data.acd"""
+        if not self.current_car or not self.car_manager:
+            QMessageBox.information(self, "Pack data.acd", "Select a car first.")
+            return
+
+        if not self.car_manager.has_data_folder(self.current_car):
+            QMessageBox.warning(
+                self,
+                "Pack data.acd",
+                f"Car '{self.current_car}' has no data folder to pack."
+            )
+            return
+
+        if self.car_manager.has_data_acd(self.current_car):
+            reply = QMessageBox.question(
+                self,
+                "Pack data.acd",
+                f"Car '{self.current_car}' already has a data.acd file.\n\n"
+                "Do you want to overwrite it with the contents of the data folder?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+
+        self.statusBar.showMessage("Packing data.acd...")
+        stats = self.car_manager.pack_data_acd(self.current_car, incremental=True)
+
+        if stats is None:
+            QMessageBox.critical(
+                self,
+                "Packing Failed",
+                "Failed to pack data.acd. Check console for details."
+            )
+            return
+
+        msg = (f"data.acd packed: {stats['entries']} files "
+               f"({stats['encrypted']} encrypted, {stats['copied']} reused)")
+        self.statusBar.showMessage(msg)
+        show_toast(self, f"✅  {msg}", kind='success')
+        self._refresh_car(self.current_car)
+        self.on_car_selected(self.car_list.currentIndex(), None)
+
+    def unpack_all_cars(self):
+        """Unpack every car that still ships data.acd, in parallel"""
+        if not self.car_manager:
+            return
+
+        cars = self.car_manager.get_packed_cars(skip_up_to_date=True)
+        if not cars:
+            show_toast(self, "All packed cars are already unpacked.", kind='info')
+            return
+
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Unpack All")
+        layout = QVBoxLayout(dlg)
+        text = QLabel(
+            f"<b>{len(cars)}</b> cars have a data.acd that is not unpacked yet.<br>"
+            "Cars whose data folder is newer than data.acd are skipped."
+        )
+        text.setWordWrap(True)
+        text.setTextFormat(Qt.RichText)
+        layout.addWidget(text)
+        rename_check = QCheckBox("Rename data.acd to data.acd.bak after unpacking")
+        rename_check.setChecked(True)
+        layout.addWidget(rename_check)
+        btn_row = QHBoxLayout()
+        btn_row.addStretch()
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(dlg.reject)
+        ok_btn = QPushButton("Unpack")
+        ok_btn.setDefault(True)
+        ok_btn.setStyleSheet(btn_primary())
+        ok_btn.clicked.connect(dlg.accept)
+        btn_row.addWidget(cancel_btn)
+        btn_row.addWidget(ok_btn)
+        layout.addLayout(btn_row)
+        if dlg.exec_() != QDialog.Accepted:
+            return
+
+        progress = QProgressDialog("Unpacking cars...", "Cancel", 0, len(cars), self)
+        progress.setWindowTitle("Unpack All")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+
+        thread = BulkUnpackThread(self.car_manager, cars, rename_check.isChecked(), self)
+        self._bulk_unpack_thread = thread
+
+        def on_progress(done, total, car_name, status):
+            progress.setLabelText(f"{status.capitalize()}: {car_name} ({done}/{total})")
+            progress.setValue(done)
+
+        def on_finished(results):
+            progress.close()
+            self._bulk_unpack_thread = None
+            self._show_unpack_all_results(results)
+            for car_name in results['unpacked']:
+                self._refresh_car(car_name)
+            self.on_car_selected(self.car_list.currentIndex(), None)
+
+        def on_cancel():
+            progress.setLabelText("Cancelling... waiting for running unpacks to finish")
+            thread.cancel()
+
+        thread.progress.connect(on_progress)
+        thread.finished_with.connect(on_finished)
+        progress.canceled.connect(on_cancel)
+        thread.start()
+
+    def _show_unpack_all_results(self, results):
+        """Summarize a bulk unpack, listing failures per car"""
+        summary = (f"{len(results['unpacked'])} unpacked, {len(results['skipped'])} skipped, "
+                   f"{len(results['failed'])} failed, {len(results['cancelled'])} cancelled")
+        self.statusBar.showMessage(f"Unpack all: {summary}")
+
+        if results['failed']:
+            lines = [f"{car}: {error}" for car, error in sorted(results['failed'].items())]
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Warning)
+            box.setWindowTitle("Unpack All")
+            box.setText(f"Unpack finished: {summary}.")
+            box.setDetailedText('\n'.join(lines))
+            box.exec_()
+        else:
+            show_toast(self, f"✅  Unpack finished: {summary}", kind='success')
+
     def edit_ui_metadata(self):
         """Open UI metadata editor"""
         if not self.current_car:
@@ -564,7 +936,8 @@ class MainWindow(QMainWindow):
         if result == QDialog.Accepted:
             self.statusBar.showMessage(f"UI metadata updated for {self.current_car}")
             # Refresh car info to show updated name
-            self.on_car_selected(self.car_list.currentItem(), None)
+            self._refresh_car(self.current_car)
+            self.on_car_selected(self.car_list.currentIndex(), None)
     
     def open_component_library(self):
         """Open component library manager"""
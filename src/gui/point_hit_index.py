@@ -0,0 +1,97 @@
+"""
+Display-space hit-testing for the points of a matplotlib line.
+
+Finding the point under the mouse used to transform every point and the
+click once per point. PointHitIndex keeps the pixel coordinates of all
+points in one (n, 2) array and answers nearest-point and box queries
+with one vectorized distance computation. The array is only recomputed
+when the data was replaced (set_data()) or the view changed; the view is
+detected by comparing the affine part of ax.transData, which changes on
+zoom, pan, resize and tight_layout().
+
+Queries take display coordinates (MouseEvent.x / .y), so the click never
+has to be transformed.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+class PointHitIndex:
+    """Pixel positions of a set of data points, cached per view"""
+
+    def __init__(self, ax):
+        """
+        Args:
+            ax: matplotlib Axes the points are drawn in
+        """
+        self.ax = ax
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._display = np.empty((0, 2))
+        self._view_key = None   # None forces a recompute
+
+    def set_data(self, x, y):
+        """
+        Replace the points (data coordinates)
+
+        Args:
+            x: X values
+            y: Y values, same length as x
+        """
+        self._x = np.asarray(x, dtype=np.float64)
+        self._y = np.asarray(y, dtype=np.float64)
+        self._view_key = None
+
+    def _current_view_key(self):
+        matrix = self.ax.transData.get_affine().get_matrix()
+        return matrix.tobytes(), self.ax.get_xscale(), self.ax.get_yscale()
+
+    def display_points(self) -> np.ndarray:
+        """(n, 2) pixel coordinates of the points, recomputed only when stale"""
+        key = self._current_view_key()
+        if key != self._view_key:
+            if len(self._x):
+                self._display = self.ax.transData.transform(np.column_stack((self._x, self._y)))
+            else:
+                self._display = np.empty((0, 2))
+            self._view_key = key
+        return self._display
+
+    def nearest(self, x: float, y: float, radius: float = 10.0) -> Optional[int]:
+        """
+        Index of the point closest to a display position
+
+        Args:
+            x: Display X in pixels (e.g. MouseEvent.x)
+            y: Display Y in pixels
+            radius: Maximum distance in pixels
+
+        Returns:
+            Point index (the first one on ties), or None if no point is
+            closer than radius
+        """
+        display = self.display_points()
+        if not len(display):
+            return None
+        dist2 = (display[:, 0] - x) ** 2 + (display[:, 1] - y) ** 2
+        index = int(np.argmin(dist2))
+        return index if dist2[index] < radius * radius else None
+
+    def in_box(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """
+        Indices of the points inside a display-space rectangle
+
+        Args:
+            x0, y0: One corner in pixels
+            x1, y1: Opposite corner in pixels (any order)
+
+        Returns:
+            Sorted int array of point indices
+        """
+        display = self.display_points()
+        (left, right), (bottom, top) = sorted((x0, x1)), sorted((y0, y1))
+        inside = ((display[:, 0] >= left) & (display[:, 0] <= right)
+                  & (display[:, 1] >= bottom) & (display[:, 1] <= top))
+        return np.flatnonzero(inside)
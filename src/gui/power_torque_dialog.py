@@ -4,6 +4,14 @@ Power/Torque Calculator Dialog for AC Car Editor.
 Displays interactive power (HP) and torque (Nm) curves derived from
 power.lut (which stores torque in Nm) and turbo parameters,
 using matplotlib embedded in a PyQt5 dialog.
+
+For turbo cars the dialog has spin boxes for MAX_BOOST, REFERENCE_RPM and
+GAMMA of every turbo. The chart is built once; a spin box change only
+recomputes the curves (cached base and boost-shape arrays, see
+core.power_calculator) and replaces the line data. Chart updates go
+through a RedrawScheduler, so fast spinning recomputes and repaints at
+most once per frame.
+The values are not written back to engine.ini.
 """
 
 import os
@@ -13,7 +21,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
-    QFormLayout, QPushButton, QWidget
+    QFormLayout, QPushButton, QWidget, QDoubleSpinBox, QSpinBox
 )
 from PyQt5.QtCore import Qt
 
@@ -23,6 +31,7 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 from core.power_calculator import PowerTorqueCalculator
+from gui.redraw_scheduler import RedrawScheduler
 
 
 class PowerTorqueDialog(QDialog):
@@ -40,10 +49,15 @@ class PowerTorqueDialog(QDialog):
         self.setWindowTitle("Power / Torque Calculator")
         self.setMinimumSize(900, 600)
 
+        # Private copies: the spin boxes edit these dicts in place
+        turbo_configs = [dict(tc) for tc in turbo_configs or []]
         self.calculator = PowerTorqueCalculator(torque_points, turbo_configs)
         self.has_turbo = bool(turbo_configs)
+        self._lines = {}
 
         self._build_ui()
+        self._redraw = RedrawScheduler(self.canvas, parent=self)
+        self._build_chart()
         self._update_chart()
 
     def _build_ui(self):
@@ -89,6 +103,9 @@ class PowerTorqueDialog(QDialog):
 
         layout.addLayout(stats_layout)
 
+        if self.has_turbo:
+            layout.addWidget(self._build_turbo_controls())
+
         # --- Disclaimer ---
         disclaimer = QLabel(
             "ℹ️  I valori mostrati sono i valori REALI di potenza nel gioco <b>alle ruote</b>. "
@@ -108,26 +125,50 @@ class PowerTorqueDialog(QDialog):
         btn_layout.addWidget(close_btn)
         layout.addLayout(btn_layout)
 
-    def _update_chart(self):
-        data = self.calculator.compute_curves(rpm_step=50)
-
-        self.figure.clear()
-        rpm = data['rpm_values']
-        if not rpm:
-            return
-
-        ax1 = self.figure.add_subplot(111)
-        ax2 = ax1.twinx()
+    def _build_turbo_controls(self) -> QGroupBox:
+        """Spin boxes for the boost parameters of each turbo (live chart update)"""
+        group = QGroupBox("Turbo parameters (preview only, not saved)")
+        row = QHBoxLayout()
+        for i, tc in enumerate(self.calculator.turbo_configs):
+            form = QFormLayout()
+            max_boost = QDoubleSpinBox()
+            max_boost.setRange(0, 6.0); max_boost.setDecimals(3); max_boost.setSingleStep(0.05); max_boost.setSuffix(" bar")
+            max_boost.setValue(tc.get('max_boost', 0.0))
+            ref_rpm = QSpinBox()
+            ref_rpm.setRange(0, 12000); ref_rpm.setSingleStep(100); ref_rpm.setSuffix(" RPM")
+            ref_rpm.setValue(int(tc.get('reference_rpm', 3000)))
+            gamma = QDoubleSpinBox()
+            gamma.setRange(0.5, 8.0); gamma.setDecimals(2); gamma.setSingleStep(0.1)
+            gamma.setValue(tc.get('gamma', 2.5))
+            for key, spin in (('max_boost', max_boost), ('reference_rpm', ref_rpm), ('gamma', gamma)):
+                spin.valueChanged.connect(
+                    lambda value, index=i, name=key: self._on_turbo_changed(index, name, value))
+                setattr(self, f'turbo_{i}_{key}', spin)
+            form.addRow(f"TURBO_{i} Max Boost:", max_boost)
+            form.addRow("Reference RPM:", ref_rpm)
+            form.addRow("Gamma:", gamma)
+            row.addLayout(form)
+        group.setLayout(row)
+        return group
+
+    def _on_turbo_changed(self, index: int, key: str, value):
+        self.calculator.turbo_configs[index][key] = value
+        self._redraw.request(self._update_chart)
+
+    def _build_chart(self):
+        """Create the axes and (empty) lines once; _update_chart() fills them"""
+        self.ax1 = ax1 = self.figure.add_subplot(111)
+        self.ax2 = ax2 = ax1.twinx()
 
         # Base curves
-        ax1.plot(rpm, data['base_hp'], 'b-', linewidth=1.5, label='Power (NA) [HP]')
-        ax2.plot(rpm, data['base_torque'], 'r--', linewidth=1.5, label='Torque (NA) [Nm]')
+        self._lines['base_hp'], = ax1.plot([], [], 'b-', linewidth=1.5, label='Power (NA) [HP]')
+        self._lines['base_torque'], = ax2.plot([], [], 'r--', linewidth=1.5, label='Torque (NA) [Nm]')
 
         if self.has_turbo:
-            ax1.plot(rpm, data['effective_hp'], 'b-', linewidth=2.5, alpha=0.8,
-                     label='Power (Turbo) [HP]')
-            ax2.plot(rpm, data['effective_torque'], 'r-', linewidth=2.5, alpha=0.8,
-                     label='Torque (Turbo) [Nm]')
+            self._lines['effective_hp'], = ax1.plot([], [], 'b-', linewidth=2.5, alpha=0.8,
+                                                    label='Power (Turbo) [HP]')
+            self._lines['effective_torque'], = ax2.plot([], [], 'r-', linewidth=2.5, alpha=0.8,
+                                                        label='Torque (Turbo) [Nm]')
 
         ax1.set_xlabel('RPM')
         ax1.set_ylabel('Power [HP]', color='blue')
@@ -147,7 +188,20 @@ class PowerTorqueDialog(QDialog):
         ax1.set_title(title)
 
         self.figure.tight_layout()
-        self.canvas.draw()
+
+    def _update_chart(self):
+        data = self.calculator.compute_curves(rpm_step=50)
+
+        rpm = data['rpm_values']
+        if not rpm:
+            return
+
+        for key, line in self._lines.items():
+            line.set_data(rpm, data[key])
+        for ax in (self.ax1, self.ax2):
+            ax.relim()
+            ax.autoscale_view()
+        self._redraw.request_draw()
 
         # Update stats labels
         pbhp = data['peak_base_hp']
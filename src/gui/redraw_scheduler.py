@@ -0,0 +1,127 @@
+"""
+Frame-rate-limited redraw scheduling for matplotlib canvases.
+
+Mouse-move, wheel and spin box handlers fire far more often than the
+screen refreshes (high-rate mice and trackpads send hundreds of events
+per second), and a synchronous canvas.draw() in each of them queues
+redraws nobody sees. A RedrawScheduler collects redraw work instead:
+
+- request(callback) runs callback (e.g. a blit or a chart update) in the
+  next frame; the same callback requested again before that frame is
+  run once;
+- request_draw() does one canvas.draw_idle() in the next frame.
+
+Frames are at most 1 / fps apart. A frame is started by a single-shot
+QTimer, so requests from one burst of events end up in the same frame.
+Requests made while a frame runs (a callback asking for a full draw) are
+served in that frame; new callbacks go to the next one.
+
+The counters show the effect: frames is the number of frames run, merged
+the number of requests folded into an already pending frame, and dropped
+the number of frame intervals lost because a frame took longer than the
+interval. A frame's time runs from its start to the end of the canvas
+draw it requested (the draw_event), or to the end of its callbacks if it
+did not request one.
+"""
+
+import math
+import time
+from typing import Callable, Dict
+
+from PyQt5.QtCore import QObject, QTimer
+
+
+class RedrawScheduler(QObject):
+    """Merge redraw requests into at most one frame per refresh interval"""
+
+    def __init__(self, canvas, fps: float = 60.0, parent=None):
+        """
+        Args:
+            canvas: matplotlib FigureCanvas drawn by request_draw()
+            fps: Maximum frames per second
+            parent: Parent QObject (the timer stops with it)
+        """
+        super().__init__(parent)
+        self.canvas = canvas
+        self.interval = 1.0 / fps
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_frame)
+        self._callbacks: Dict[Callable, None] = {}   # ordered set
+        self._draw = False
+        self._in_frame = False
+        self._last_frame = None   # perf_counter() at the start of the last frame
+        self._draw_started = None  # start of the frame whose draw_idle() has not drawn yet
+        canvas.mpl_connect('draw_event', self._on_draw_event)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.frames = 0
+        self.merged = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._callbacks) or self._draw
+
+    def request(self, callback: Callable[[], None]):
+        """
+        Run callback in the next frame (once, however often it is requested)
+
+        Args:
+            callback: Function without arguments
+        """
+        self._callbacks[callback] = None
+        self._schedule()
+
+    def request_draw(self):
+        """canvas.draw_idle() in the next frame (or the running one)"""
+        self._draw = True
+        if not self._in_frame:
+            self._schedule()
+
+    def _schedule(self):
+        if self._timer.isActive():
+            self.merged += 1
+            return
+        wait = 0.0
+        if self._last_frame is not None:
+            wait = max(0.0, self.interval - (time.perf_counter() - self._last_frame))
+        self._timer.start(math.ceil(wait * 1000))
+
+    def flush(self):
+        """Run pending work now (e.g. before a drag ends)"""
+        self._timer.stop()
+        if self.pending:
+            self._run_frame()
+
+    def _run_frame(self):
+        start = time.perf_counter()
+        self._last_frame = start
+        callbacks = list(self._callbacks)
+        self._callbacks.clear()
+        self._in_frame = True
+        try:
+            for callback in callbacks:
+                callback()
+            draw, self._draw = self._draw, False
+            if draw:
+                self._draw_started = start
+                self.canvas.draw_idle()
+        finally:
+            self._in_frame = False
+        self.frames += 1
+        if not draw:
+            self._count_dropped(start)
+
+    def _on_draw_event(self, event):
+        if self._draw_started is not None:
+            self._count_dropped(self._draw_started)
+            self._draw_started = None
+
+    def _count_dropped(self, start: float):
+        self.dropped += int((time.perf_counter() - start) // self.interval)
+
+    def summary(self) -> str:
+        """Short text for a status label, e.g. '12 frames, 40 merged, 0 dropped'"""
+        return f"{self.frames} frames, {self.merged} merged, {self.dropped} dropped"
@@ -13,6 +13,7 @@ from PyQt5.QtCore import Qt
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from core.ini_parser import IniParser
 from core.rto_parser import RTOParser
 from gui.toast import show_toast
 
@@ -29,8 +30,8 @@ class RTOManagerDialog(QDialog):
         self.ratios_rto_path = os.path.join(car_data_path, 'ratios.rto')
         self.setup_ini_path = os.path.join(car_data_path, 'setup.ini')
         
-        self.final_parser = RTOParser(self.final_rto_path)
-        self.ratios_parser = RTOParser(self.ratios_rto_path)
+        self.final_parser = RTOParser.cached(self.final_rto_path)
+        self.ratios_parser = RTOParser.cached(self.ratios_rto_path)
         
         # Store paths for speed calculation
         self.engine_ini_path = engine_ini if engine_ini else os.path.join(car_data_path, 'engine.ini')
@@ -56,8 +57,7 @@ class RTOManagerDialog(QDialog):
             return gear_ratios
         
         try:
-            from core.ini_parser import IniParser
-            parser = IniParser(self.drivetrain_ini_path)
+            parser = IniParser.cached(self.drivetrain_ini_path)
             
             if parser.has_section('GEARS'):
                 # Read gear count to know how many gears to read
@@ -436,7 +436,7 @@ class RTOManagerDialog(QDialog):
         if not os.path.exists(self.setup_ini_path):
             return False
         try:
-            parser = IniParser(self.setup_ini_path)
+            parser = IniParser.cached(self.setup_ini_path)
             use_gearset = str(parser.get_value('GEARS', 'USE_GEARSET', '0')).strip()
             ratios = str(parser.get_value('FINAL_GEAR_RATIO', 'RATIOS', '')).strip().lower()
             return use_gearset == '1' and ratios == 'final.rto'
@@ -466,85 +466,23 @@ class RTOManagerDialog(QDialog):
 
     def _apply_setup_ini_update(self):
         """Write USE_GEARSET=1 and [FINAL_GEAR_RATIO] RATIOS=final.rto to setup.ini.
-        Uses direct text manipulation to preserve the original file format exactly
-        (no spaces around '=', comments and blank lines kept intact).
+        IniParser only rewrites the changed lines, so the original file format
+        (no spaces around '=', comments and blank lines) is kept intact.
+        USE_GEARSET is only written if the file has a [GEARS] section, and
+        existing keys are matched case-insensitively (e.g. 'use_gearset=0').
         """
         try:
-            import shutil
-
-            # Backup
-            if os.path.exists(self.setup_ini_path):
-                shutil.copy2(self.setup_ini_path, self.setup_ini_path + '.bak')
-
-            # Read as raw lines
-            encoding = 'utf-8-sig'
-            with open(self.setup_ini_path, 'r', encoding=encoding) as f:
-                lines = f.readlines()
-
-            current_section = None
-            gears_use_gearset_patched = False
-            final_gear_ratio_ratios_patched = False
-            final_gear_ratio_section_exists = False
-            new_lines = []
-
-            for line in lines:
-                stripped = line.strip()
-
-                # Detect section header
-                if stripped.startswith('[') and ']' in stripped:
-                    current_section = stripped[1:stripped.index(']')]
-                    if current_section == 'FINAL_GEAR_RATIO':
-                        final_gear_ratio_section_exists = True
-
-                # Patch USE_GEARSET inside [GEARS]
-                if current_section == 'GEARS' and stripped.upper().startswith('USE_GEARSET'):
-                    line = 'USE_GEARSET=1\n'
-                    gears_use_gearset_patched = True
-
-                # Patch RATIOS inside [FINAL_GEAR_RATIO]
-                if current_section == 'FINAL_GEAR_RATIO' and stripped.upper().startswith('RATIOS'):
-                    line = 'RATIOS=final.rto\n'
-                    final_gear_ratio_ratios_patched = True
-
-                new_lines.append(line)
-
-            # If [GEARS] existed but had no USE_GEARSET line, insert it right after the header
-            if not gears_use_gearset_patched:
-                patched = []
-                current_section = None
-                for line in new_lines:
-                    patched.append(line)
-                    stripped = line.strip()
-                    if stripped.startswith('[') and ']' in stripped:
-                        sec = stripped[1:stripped.index(']')]
-                        if sec == 'GEARS':
-                            patched.append('USE_GEARSET=1\n')
-                new_lines = patched
-
-            # If [FINAL_GEAR_RATIO] section doesn't exist at all, append it
-            if not final_gear_ratio_section_exists:
-                if new_lines and not new_lines[-1].endswith('\n'):
-                    new_lines.append('\n')
-                new_lines.append('\n[FINAL_GEAR_RATIO]\n')
-                new_lines.append('RATIOS=final.rto\n')
-            elif not final_gear_ratio_ratios_patched:
-                # Section exists but had no RATIOS line – insert it after the header
-                patched = []
-                current_section = None
-                for line in new_lines:
-                    patched.append(line)
-                    stripped = line.strip()
-                    if stripped.startswith('[') and ']' in stripped:
-                        sec = stripped[1:stripped.index(']')]
-                        if sec == 'FINAL_GEAR_RATIO':
-                            patched.append('RATIOS=final.rto\n')
-                new_lines = patched
-
-            # Write back preserving original line endings
-            with open(self.setup_ini_path, 'w', encoding='utf-8', newline='') as f:
-                f.writelines(new_lines)
+            parser = IniParser(self.setup_ini_path)
+            if parser.has_section('GEARS'):
+                parser.set_value('GEARS', self._existing_key(parser, 'GEARS', 'USE_GEARSET'), '1')
+            parser.set_value('FINAL_GEAR_RATIO',
+                             self._existing_key(parser, 'FINAL_GEAR_RATIO', 'RATIOS'), 'final.rto')
+            if not parser.save(backup=True):
+                show_toast(self, "setup.ini already up to date — nothing changed.", kind='info')
+                return
 
-            show_toast(self, "✅  setup.ini updated with RTO references. Backup created.", kind='success')
+            backup = " Backup created." if os.path.exists(self.setup_ini_path + '.bak') else ""
+            show_toast(self, f"✅  setup.ini updated with RTO references.{backup}", kind='success')
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -552,6 +490,14 @@ class RTOManagerDialog(QDialog):
                 f"Could not update setup.ini:\n{str(e)}"
             )
     
+    @staticmethod
+    def _existing_key(parser, section, key):
+        """Spelling of key as it appears in section (key itself if absent)"""
+        for name in parser.get_section(section):
+            if name.upper() == key.upper():
+                return name
+        return key
+
     def import_final_from_library(self):
         """Import final drive ratios from component library"""
         from gui.component_selector_dialog import ComponentSelectorDialog
@@ -0,0 +1,224 @@
+"""
+Preview thumbnail cache for AC Car Editor.
+
+Car previews (ui/preview.png or a skin's preview.jpg) are often full-size
+or 4K images; decoding and smooth-scaling them on the GUI thread made
+arrowing through the car list stutter. ThumbnailCache keeps scaled
+thumbnails in memory (LRU) and on disk, keyed by source path + mtime +
+file size + target size, so a changed preview is picked up automatically.
+ThumbnailLoader decodes missing thumbnails on a QThreadPool and emits them
+back to the GUI thread. Only QImage is used off the GUI thread (QPixmap is
+not thread-safe).
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PyQt5.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader
+
+
+class ThumbnailCache:
+    """Two-level (memory LRU + disk) cache of scaled preview images"""
+
+    def __init__(self, cache_dir: str, memory_items: int = 64):
+        """
+        Args:
+            cache_dir: Folder for cached thumbnails (created on first write)
+            memory_items: Number of decoded thumbnails kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.memory_items = memory_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cache_key(self, path: str, size: QSize) -> Optional[str]:
+        """
+        Key for a thumbnail of path scaled to fit size
+
+        Returns:
+            Hex digest, or None if the source image does not exist
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        ident = (f"{os.path.normcase(os.path.abspath(path))}|{st.st_mtime_ns}|{st.st_size}|"
+                 f"{size.width()}x{size.height()}")
+        return hashlib.sha1(ident.encode('utf-8')).hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + '.png')
+
+    def _remember(self, key: str, image: QImage):
+        with self._lock:
+            self._memory[key] = image
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def get_cached(self, path: str, size: QSize) -> Optional[QImage]:
+        """Thumbnail from memory only (cheap enough for the GUI thread)"""
+        key = self.cache_key(path, size)
+        if key is None:
+            return None
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+            return image
+
+    def load(self, path: str, size: QSize) -> Optional[QImage]:
+        """
+        Thumbnail from memory, then disk, else decode and scale the source
+
+        Safe to call from worker threads.
+
+        Args:
+            path: Source image path
+            size: Bounding box; the thumbnail keeps the aspect ratio
+
+        Returns:
+            Scaled QImage, or None if the source is missing or unreadable
+        """
+        key = self.cache_key(path, size)
+        if key is None:
+            return None
+        with self._lock:
+            image = self._memory.get(key)
+        if image is not None:
+            return image
+
+        disk_path = self._disk_path(key)
+        image = QImage(disk_path) if os.path.exists(disk_path) else QImage()
+        if image.isNull():
+            image = self._decode(path, size)
+            if image is None:
+                return None
+            try:
+                os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+                tmp_path = disk_path + f'.{threading.get_ident()}.tmp'
+                if image.save(tmp_path, 'PNG'):
+                    os.replace(tmp_path, disk_path)
+            except OSError as e:
+                print(f"Error writing thumbnail cache: {e}")
+
+        self._remember(key, image)
+        return image
+
+    @staticmethod
+    def _decode(path: str, size: QSize) -> Optional[QImage]:
+        reader = QImageReader(path)
+        source_size = reader.size()
+        if source_size.isValid():
+            # Let the decoder downscale (JPEG decodes at 1/2, 1/4, 1/8 for
+            # free); keep 2x the target so the final smooth pass has detail
+            fitted = source_size.scaled(size * 2, Qt.KeepAspectRatio)
+            if fitted.width() < source_size.width():
+                reader.setScaledSize(fitted)
+        image = reader.read()
+        if image.isNull():
+            print(f"Error decoding preview {path}: {reader.errorString()}")
+            return None
+        return image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def prune(self, max_bytes: int = 200 * 1024 * 1024):
+        """Delete the least recently written disk thumbnails above max_bytes"""
+        files = []
+        total = 0
+        for root, _dirs, names in os.walk(self.cache_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        for _mtime, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+class _ThumbnailSignals(QObject):
+    # QRunnable is not a QObject, so results go through this helper
+    done = pyqtSignal(str, QSize, QImage)
+
+
+class _ThumbnailTask(QRunnable):
+    def __init__(self, cache: ThumbnailCache, path: str, size: QSize, signals: _ThumbnailSignals):
+        super().__init__()
+        self.cache = cache
+        self.path = path
+        self.size = QSize(size)
+        self.signals = signals
+
+    def run(self):
+        image = self.cache.load(self.path, self.size)
+        try:
+            self.signals.done.emit(self.path, self.size, image if image is not None else QImage())
+        except RuntimeError:
+            pass  # loader was destroyed while this task ran (application exit)
+
+
+class ThumbnailLoader(QObject):
+    """Decodes thumbnails on a QThreadPool and reports them on the GUI thread"""
+
+    # path, size, image (null QImage if the preview could not be decoded)
+    ready = pyqtSignal(str, QSize, QImage)
+
+    def __init__(self, cache: ThumbnailCache, max_threads: int = 2, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._pending = set()
+        self._signals = _ThumbnailSignals()
+        self._signals.done.connect(self._on_done)
+
+    def request(self, path: str, size: QSize, priority: int = 0) -> Optional[QImage]:
+        """
+        Ask for a thumbnail
+
+        Returns:
+            The QImage right away if it is in memory; otherwise None, and
+            ready is emitted once it has been loaded or decoded
+        """
+        image = self.cache.get_cached(path, size)
+        if image is not None:
+            return image
+        token = self._token(path, size)
+        if token not in self._pending:
+            self._pending.add(token)
+            self.pool.start(_ThumbnailTask(self.cache, path, size, self._signals), priority)
+        return None
+
+    def prefetch(self, path: str, size: QSize):
+        """Warm the cache for a preview the user is likely to look at next"""
+        self.request(path, size, priority=-1)
+
+    def clear_pending(self):
+        """Drop queued (not yet started) decodes, e.g. prefetches that are stale"""
+        self.pool.clear()
+        self._pending.clear()
+
+    def shutdown(self, timeout_ms: int = 2000):
+        """Drop queued decodes and wait for running ones (call before exit)"""
+        self.clear_pending()
+        self.pool.waitForDone(timeout_ms)
+
+    @staticmethod
+    def _token(path: str, size: QSize) -> Tuple[str, int, int]:
+        return (path, size.width(), size.height())
+
+    def _on_done(self, path: str, size: QSize, image: QImage):
+        self._pending.discard(self._token(path, size))
+        self.ready.emit(path, size, image)
@@ -0,0 +1,63 @@
+"""
+Benchmark: straight-line acceleration simulation per car.
+
+Run from the project root:
+    python tests/benchmark_accel.py [cars_folder]
+
+Times AccelerationSimulator on examples/data: the run alone, and
+from_car_data() + run() with the parsed files cached (editor case) and
+with PARSE_CACHE cleared (first load). Given an AC content/cars folder,
+it also runs every car with an unpacked data/ folder (catalog batch).
+"""
+
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.acceleration_sim import AccelerationSimulator
+from core.parse_cache import PARSE_CACHE
+
+EXAMPLE_DATA = os.path.join(os.path.dirname(__file__), '..', 'examples', 'data')
+
+
+def _median_ms(func, repeats: int = 50) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def _cold_run():
+    PARSE_CACHE.clear()
+    AccelerationSimulator.from_car_data(EXAMPLE_DATA).run()
+
+
+def main():
+    sim = AccelerationSimulator.from_car_data(EXAMPLE_DATA)
+    result = sim.run()
+    print(f"examples/data: 0-100 {result['zero_to_100']:.2f} s, "
+          f"quarter mile {result['quarter_mile']:.2f} s @ {result['trap_speed']:.0f} km/h")
+    print(f"  run()                        : {_median_ms(sim.run):6.2f} ms")
+    print(f"  from_car_data + run (cached) : "
+          f"{_median_ms(lambda: AccelerationSimulator.from_car_data(EXAMPLE_DATA).run()):6.2f} ms")
+    print(f"  from_car_data + run (cold)   : {_median_ms(_cold_run):6.2f} ms")
+
+    if len(sys.argv) > 1:
+        cars_folder = sys.argv[1]
+        paths = [os.path.join(cars_folder, name, 'data') for name in sorted(os.listdir(cars_folder))]
+        paths = [path for path in paths if os.path.isdir(path)]
+        PARSE_CACHE.clear()
+        start = time.perf_counter()
+        for path in paths:
+            AccelerationSimulator.from_car_data(path).run()
+        elapsed = time.perf_counter() - start
+        print(f"{len(paths)} cars: {elapsed:.2f} s ({elapsed / max(len(paths), 1) * 1000:.2f} ms/car)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Benchmark: native data.acd decoder vs quickBMS subprocess, full vs
+incremental repack, plus decode throughput (MB/s) on a large synthetic
+archive.
+
+Run from the project root:
+    python tests/benchmark_acd.py [repeats] [synthetic_mb]
+
+The quickBMS path is only measured when tools/quickbms/quickbms.exe can be
+executed on this machine (Windows, or Linux with Wine registered as binfmt).
+The synthetic archive replicates the entries of examples/data.acd (renamed
+copy_N_<name>) until it reaches synthetic_mb megabytes on disk.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import struct
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.acd_archive import AcdArchive, extract_acd, iter_acd_entries, pack_acd
+from core.car_file_manager import CarFileManager
+
+EXAMPLE_ACD = os.path.join(os.path.dirname(__file__), '..', 'examples', 'data.acd')
+EXAMPLE_CAR = 'audi_a5_teamsesh'
+
+
+def _time_native(car_path: str, repeats: int) -> float:
+    acd_path = os.path.join(car_path, 'data.acd')
+    out_dir = os.path.join(car_path, 'data')
+    start = time.perf_counter()
+    for _ in range(repeats):
+        extract_acd(acd_path, out_dir)
+    return (time.perf_counter() - start) / repeats
+
+
+def _time_quickbms(manager: CarFileManager, car_path: str, repeats: int):
+    exe = manager._find_quickbms_path()
+    script = manager._find_quickbms_script()
+    if not exe or not script:
+        return None
+    acd_path = os.path.join(car_path, 'data.acd')
+    out_dir = os.path.join(car_path, 'data_quickbms')
+    os.makedirs(out_dir, exist_ok=True)
+    cmd = [exe, '-o', script, acd_path, out_dir]
+    start = time.perf_counter()
+    for _ in range(repeats):
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    cwd=os.path.dirname(exe))
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+    return (time.perf_counter() - start) / repeats
+
+
+def _time_pack(car_path: str, repeats: int):
+    data_dir = os.path.join(car_path, 'data')
+    acd_path = os.path.join(car_path, 'packed', 'data.acd')
+    os.makedirs(os.path.dirname(acd_path), exist_ok=True)
+    extract_acd(os.path.join(car_path, 'data.acd'), data_dir)
+    engine_ini = os.path.join(data_dir, 'engine.ini')
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        pack_acd(data_dir, acd_path, folder_name=EXAMPLE_CAR)
+    full = (time.perf_counter() - start) / repeats
+
+    pack_acd(data_dir, acd_path, folder_name=EXAMPLE_CAR, incremental=True)
+    elapsed = 0.0
+    for i in range(repeats):
+        with open(engine_ini, 'a', encoding='utf-8') as f:
+            f.write(f"; tweak {i}\n")
+        start = time.perf_counter()
+        stats = pack_acd(data_dir, acd_path, folder_name=EXAMPLE_CAR, incremental=True)
+        elapsed += time.perf_counter() - start
+    incremental = elapsed / repeats
+
+    print(f"  full repack    : {full * 1000:8.2f} ms ({stats['entries']} files)")
+    print(f"  incremental    : {incremental * 1000:8.2f} ms "
+          f"({stats['encrypted']} encrypted, {stats['copied']} copied)")
+
+
+def _build_synthetic_acd(path: str, target_bytes: int) -> int:
+    """Replicate the example entries (payloads stay valid: same folder key)."""
+    with open(EXAMPLE_ACD, 'rb') as f:
+        entries = [(name, offset, size) for name, offset, size in iter_acd_entries(f)]
+        f.seek(0)
+        data = f.read()
+
+    written = 0
+    copy = 0
+    with open(path, 'wb') as out:
+        while written < target_bytes:
+            for name, offset, size in entries:
+                new_name = f"copy_{copy}_{name}".encode('latin-1')
+                out.write(struct.pack('<I', len(new_name)))
+                out.write(new_name)
+                out.write(struct.pack('<I', size))
+                out.write(data[offset:offset + size * 4])
+                written += 8 + len(new_name) + size * 4
+            copy += 1
+    return written
+
+
+def _throughput(car_path: str, target_mb: int, repeats: int):
+    acd_path = os.path.join(car_path, 'synthetic.acd')
+    archive_bytes = _build_synthetic_acd(acd_path, target_mb * 1024 * 1024)
+
+    best = None
+    plain_bytes = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        archive = AcdArchive(acd_path, folder_name=EXAMPLE_CAR)
+        entries = archive.read_all()
+        elapsed = time.perf_counter() - start
+        plain_bytes = sum(len(c) for c in entries.values())
+        best = elapsed if best is None else min(best, elapsed)
+
+    mb = 1024 * 1024
+    print(f"Synthetic archive: {archive_bytes / mb:.0f} MB, {len(entries)} entries "
+          f"(best of {repeats})")
+    print(f"  index + decode : {best * 1000:8.1f} ms")
+    print(f"  archive input  : {archive_bytes / mb / best:8.1f} MB/s")
+    print(f"  plaintext out  : {plain_bytes / mb / best:8.1f} MB/s")
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    synthetic_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    temp_dir = tempfile.mkdtemp()
+    try:
+        car_path = os.path.join(temp_dir, EXAMPLE_CAR)
+        os.makedirs(car_path)
+        shutil.copy2(EXAMPLE_ACD, os.path.join(car_path, 'data.acd'))
+        size_kb = os.path.getsize(EXAMPLE_ACD) / 1024
+
+        print(f"data.acd: {size_kb:.0f} KB, {repeats} runs each")
+
+        native = _time_native(car_path, repeats)
+        print(f"  native decoder : {native * 1000:8.2f} ms/unpack")
+
+        qbms = _time_quickbms(CarFileManager(temp_dir), car_path, repeats)
+        if qbms is None:
+            print("  quickBMS       :      n/a (quickbms.exe not runnable here)")
+        else:
+            print(f"  quickBMS       : {qbms * 1000:8.2f} ms/unpack ({qbms / native:.1f}x slower)")
+
+        _time_pack(car_path, repeats)
+
+        print()
+        _throughput(car_path, synthetic_mb, repeats=3)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
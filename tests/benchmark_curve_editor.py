@@ -0,0 +1,209 @@
+"""
+Benchmark: dragging a point in CurveEditorWidget with the blitted
+renderer vs the old full redraw on every mouse-move.
+
+Run from the project root (QT_QPA_PLATFORM=offscreen works headless):
+    python tests/benchmark_curve_editor.py [points] [frames]
+
+A synthetic torque-like curve (default 200 points) is loaded and the
+middle point is dragged for the given number of mouse-move events
+(default 200). The old renderer (ax.clear(), one ax.plot() per point
+while a point is selected, tight_layout() and canvas.draw(),
+reimplemented here for comparison) is timed with the same frame timer
+the widget shows while dragging.
+
+It also times finding the point under a click: the old loop that
+transformed every point and the click once per point, against
+PointHitIndex.nearest() with the cached pixel positions.
+
+The table work per drag step is timed separately: the old
+QTableWidget rebuild (every item re-created) against LUTTableModel.sync()
+(only changed rows reported).
+
+Drag frames are rendered one per mouse-move here (the redraw scheduler
+is flushed after each move), so the numbers are per rendered frame. The
+last test feeds wheel-zoom events at 1 kHz, like a high-rate mouse,
+through the event loop and reports how many frames the RedrawScheduler
+actually rendered (before it, each event was one synchronous draw).
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+from matplotlib.backend_bases import MouseEvent
+
+from core.lut_parser import LUTCurve
+from gui.curve_editor_widget import CurveEditorWidget
+from gui.lut_table_model import LUTTableModel
+
+
+def _legacy_plot_curve(widget):
+    """plot_curve() as it was before the persistent artists"""
+    ax = widget.ax
+    ax.clear()
+    points = widget.curve.get_points()
+    ax.plot([p[0] for p in points], [p[1] for p in points], 'b-', linewidth=2)
+    for i, (x, y) in enumerate(points):
+        if i == widget.selected_point_index:
+            ax.plot(x, y, 'ro', markersize=10)
+        else:
+            ax.plot(x, y, 'go', markersize=8)
+    ax.set_xlabel(widget.x_label)
+    ax.set_ylabel(widget.y_label)
+    ax.grid(True, alpha=0.3)
+    if widget.drag_axis_limits is not None:
+        ax.set_xlim(widget.drag_axis_limits['xlim'])
+        ax.set_ylim(widget.drag_axis_limits['ylim'])
+    widget.figure.tight_layout()
+    widget.canvas.draw()
+
+
+def _legacy_nearest(ax, points, xdata, ydata):
+    """on_mouse_press() hit-test as it was before PointHitIndex"""
+    min_dist = float('inf')
+    nearest_idx = None
+    for i, (x, y) in enumerate(points):
+        display_point = ax.transData.transform((x, y))
+        display_click = ax.transData.transform((xdata, ydata))
+        dist = ((display_point[0] - display_click[0])**2 +
+                (display_point[1] - display_click[1])**2)**0.5
+        if dist < min_dist:
+            min_dist = dist
+            nearest_idx = i
+    return nearest_idx if min_dist < 10 else None
+
+
+def _hit_test_ms(widget, clicks: int = 50):
+    """Mean milliseconds per click for the old loop and PointHitIndex"""
+    points = widget.curve.get_points()
+    targets = [points[i] for i in np.linspace(0, len(points) - 1, clicks).astype(int)]
+
+    start = time.perf_counter()
+    for x, y in targets:
+        _legacy_nearest(widget.ax, points, x, y)
+    legacy = (time.perf_counter() - start) / clicks * 1000
+
+    pixels = [widget.ax.transData.transform((x, y)) for x, y in targets]
+    start = time.perf_counter()
+    for px, py in pixels:
+        widget.hit_index.nearest(px, py)
+    indexed = (time.perf_counter() - start) / clicks * 1000
+    return legacy, indexed
+
+
+def _legacy_update_table(table, curve):
+    """update_table() as it was before LUTTableModel (signals left out)"""
+    points = curve.get_points()
+    table.setRowCount(len(points))
+    for i, (x, y) in enumerate(points):
+        table.setItem(i, 0, QTableWidgetItem(str(int(round(x)))))
+        table.setItem(i, 1, QTableWidgetItem(str(int(round(y)))))
+
+
+def _table_update_ms(n_points: int, steps: int = 200):
+    """Mean milliseconds per drag step for the QTableWidget rebuild and the model"""
+    curve = LUTCurve.from_points([(i * 10, 0) for i in range(n_points)])
+    index = n_points // 2
+    results = []
+    for legacy in (True, False):
+        if legacy:
+            table = QTableWidget()
+            table.setColumnCount(2)
+            update = lambda: _legacy_update_table(table, curve)
+        else:
+            model = LUTTableModel()
+            model.set_curve(curve)
+            update = model.sync
+        start = time.perf_counter()
+        for step in range(steps):
+            curve.update_point(index, index * 10, step)
+            update()
+        results.append((time.perf_counter() - start) / steps * 1000)
+    return results
+
+
+def _event(widget, name, x, y):
+    px, py = widget.ax.transData.transform((x, y))
+    return MouseEvent(name, widget.canvas, px, py, button=1)
+
+
+def _drag(widget, frames: int, legacy: bool) -> str:
+    x = np.linspace(0, 10000, len(widget.curve))
+    widget.load_curve(LUTCurve.from_points(zip(x, 300 + 100 * np.sin(x / 2000))))
+    index = len(widget.curve) // 2
+    start_x, start_y = widget.curve.x[index], widget.curve.y[index]
+    widget.on_mouse_press(_event(widget, 'button_press_event', start_x, start_y))
+    # Let the scheduled draw run so the blit background is cached
+    widget.redraw.flush()
+    QApplication.processEvents()
+    if legacy:
+        # Old behaviour: nothing animated, full redraw per move
+        widget._end_drag()
+        widget._blit = lambda: _legacy_plot_curve(widget)
+    widget.frame_timer.reset()
+    for frame in range(frames):
+        widget.on_mouse_move(_event(widget, 'motion_notify_event',
+                                    start_x + 5, start_y + 50 * np.sin(frame / 10)))
+        widget.redraw.flush()
+    summary = widget.frame_timer.summary()
+    widget.on_mouse_release(_event(widget, 'button_release_event', start_x, start_y))
+    return summary
+
+
+def _wheel_burst(widget, app, events: int, rate_hz: float = 1000.0) -> str:
+    """Scroll-zoom events at rate_hz through the Qt event loop"""
+    x0, x1 = widget.ax.get_xlim()
+    y0, y1 = widget.ax.get_ylim()
+    px, py = widget.ax.transData.transform(((x0 + x1) / 2, (y0 + y1) / 2))
+    widget.redraw.flush()
+    app.processEvents()
+    widget.redraw.reset_stats()
+    start = time.perf_counter()
+    for i in range(events):
+        button = 'up' if i % 2 else 'down'
+        widget.on_scroll(MouseEvent('scroll_event', widget.canvas, px, py, button=button))
+        while time.perf_counter() - start < (i + 1) / rate_hz:
+            app.processEvents()
+    deadline = time.perf_counter() + 0.1
+    while time.perf_counter() < deadline:
+        app.processEvents()
+    return widget.redraw.summary()
+
+
+def main():
+    n_points = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    results = {}
+    hit_test = None
+    for legacy in (True, False):
+        widget = CurveEditorWidget()
+        widget.resize(1000, 700)
+        widget.show()
+        widget.curve = LUTCurve.from_points([(i, 0) for i in range(n_points)])
+        app.processEvents()
+        results[legacy] = _drag(widget, frames, legacy)
+        if not legacy:
+            hit_test = _hit_test_ms(widget)
+            burst = _wheel_burst(widget, app, events=500)
+        widget.close()
+
+    print(f"{n_points} points, {frames} drag frames")
+    print(f"  full redraw per move: {results[True]}")
+    print(f"  blitted drag:         {results[False]}")
+    print(f"hit-test per click: loop {hit_test[0]:.3f} ms, PointHitIndex {hit_test[1]:.3f} ms")
+    print(f"500 wheel events at 1 kHz: {burst}")
+    legacy_table, model_table = _table_update_ms(n_points)
+    print(f"table update per drag step: QTableWidget rebuild {legacy_table:.3f} ms, "
+          f"LUTTableModel.sync {model_table:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: eager parsing vs the lazy section index IniDocument uses for
+large INI files.
+
+Run from the project root:
+    python tests/benchmark_ini.py [sections]
+
+The synthetic file mimics a cosmetic config from a mod pack (lights.ini /
+digital_instruments.ini style): many small sections with comments. It is
+opened eagerly and lazily (median of 10), then one section is read from
+the lazy document. examples/data/engine.ini is timed for reference.
+"""
+
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.ini_document import IniDocument
+
+ENGINE_INI = os.path.join(os.path.dirname(__file__), '..', 'examples', 'data', 'engine.ini')
+
+
+def _synthetic_ini(sections: int) -> str:
+    parts = []
+    for i in range(sections):
+        parts.append(
+            f"[LIGHT_{i}]\r\n"
+            f"NAME=light_{i}\t\t; mesh name\r\n"
+            f"COLOR=255,{i % 256},0\r\n"
+            f"OFFSET=0.0,{i * 0.01:.2f},0.0\r\n"
+            f"CLIP=1.5\r\n"
+            f"; bulb {i}\r\n"
+            f"\r\n")
+    return ''.join(parts)
+
+
+def _median_ms(func, repeats: int = 10) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    sections = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    text = _synthetic_ini(sections)
+    print(f"{sections} sections, {len(text) / 1e6:.2f} MB")
+    print(f"  eager parse           : {_median_ms(lambda: IniDocument(text, lazy=False)):8.2f} ms")
+    print(f"  lazy index            : {_median_ms(lambda: IniDocument(text, lazy=True)):8.2f} ms")
+    last = f"LIGHT_{sections - 1}"
+    print(f"  lazy index + 1 section: "
+          f"{_median_ms(lambda: IniDocument(text, lazy=True).get(last, 'COLOR')):8.2f} ms")
+
+    if os.path.exists(ENGINE_INI):
+        with open(ENGINE_INI, 'r', encoding='utf-8-sig') as f:
+            engine = f.read()
+        print(f"engine.ini ({len(engine)} chars): "
+              f"{_median_ms(lambda: IniDocument(engine), 200) * 1000:.0f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: evaluating LUT curves with scalar interpolate() calls vs one
+vectorized interpolate_many() call.
+
+Run from the project root:
+    python tests/benchmark_lut.py [samples] [points]
+
+A synthetic torque-like curve (default 500 points) is sampled at 100k
+random RPM values: the old linear-scan lookup (reimplemented here for
+comparison), bisect-based interpolate() in a Python loop, and
+interpolate_many() on the whole array (median of 5 runs each).
+
+It then drags one point of a dense curve (default 10k points) in small
+steps: the old editor path (update_point() + sort_points() + a linear
+scan for the moved point's new index, reimplemented here) against
+move_point(), which bisects for the slot and returns the index.
+"""
+
+import os
+import sys
+import time
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.lut_parser import LUTCurve
+
+
+def _linear_scan(points, x):
+    """interpolate() as it was before the array storage"""
+    if x <= points[0][0]:
+        return points[0][1]
+    if x >= points[-1][0]:
+        return points[-1][1]
+    for i in range(len(points) - 1):
+        x1, y1 = points[i]
+        x2, y2 = points[i + 1]
+        if x1 <= x <= x2:
+            return y1 + (x - x1) / (x2 - x1) * (y2 - y1)
+    return 0.0
+
+
+def _legacy_drag_step(x, y, index, new_x, new_y):
+    """Curve editor drag step as it was: assign, full stable sort, scan for the point"""
+    x[index] = new_x
+    y[index] = new_y
+    order = np.argsort(x, kind='stable')
+    x[:] = x[order]
+    y[:] = y[order]
+    for i, (px, py) in enumerate(zip(x.tolist(), y.tolist())):
+        if abs(px - new_x) < 0.5 and abs(py - new_y) < 0.5:
+            return i
+    return index
+
+
+def _median_ms(func, repeats: int = 5) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rpm = np.linspace(0.0, 9000.0, count)
+    torque = 400.0 * np.sin(rpm / 9000.0 * np.pi) + 50.0
+    curve = LUTCurve.from_points(zip(rpm.tolist(), torque.tolist()))
+    xs = np.random.default_rng(0).uniform(-100.0, 9100.0, samples)
+    xs_list = xs.tolist()
+    points = curve.get_points()
+
+    vectorized = curve.interpolate_many(xs)
+    scalar = np.array([curve.interpolate(x) for x in xs_list])
+    assert np.allclose(vectorized, scalar)
+
+    print(f"{samples} samples on a {count}-point curve")
+    scan_n = max(1, samples // 100)
+    scan_ms = _median_ms(lambda: [_linear_scan(points, x) for x in xs_list[:scan_n]], 3)
+    print(f"  linear scan (old)     : {scan_ms * samples / scan_n:10.2f} ms "
+          f"(extrapolated from {scan_n})")
+    print(f"  bisect interpolate()  : {_median_ms(lambda: [curve.interpolate(x) for x in xs_list]):10.2f} ms")
+    print(f"  interpolate_many()    : {_median_ms(lambda: curve.interpolate_many(xs)):10.2f} ms")
+
+    dense = int(sys.argv[3]) if len(sys.argv) > 3 else 10_000
+    steps = 1000
+    drag_x = np.linspace(0.0, 9000.0, dense).round()
+    path = drag_x[dense // 2] + np.linspace(0.0, 50.0 * 9000.0 / dense, steps).round()
+
+    def legacy():
+        x, y = drag_x.copy(), np.zeros(dense)
+        index = dense // 2
+        for step, new_x in enumerate(path.tolist()):
+            index = _legacy_drag_step(x, y, index, new_x, float(step))
+
+    def bisect_moves():
+        moved = LUTCurve.from_points(zip(drag_x.tolist(), [0.0] * dense))
+        index = dense // 2
+        for step, new_x in enumerate(path.tolist()):
+            index = moved.move_point(index, new_x, float(step))
+
+    print(f"{steps} drag steps on a {dense}-point curve")
+    print(f"  update + sort + scan  : {_median_ms(legacy, 3) / steps * 1000:10.2f} µs/step")
+    print(f"  move_point()          : {_median_ms(bisect_moves, 3) / steps * 1000:10.2f} µs/step")
+
+
+if __name__ == '__main__':
+    main()
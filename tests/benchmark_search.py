@@ -0,0 +1,90 @@
+"""
+Benchmark: build time and query latency of CarSearchIndex on a synthetic
+catalog.
+
+Run from the project root:
+    python tests/benchmark_search.py [cars]
+
+Records mimic mod cars: cryptic folder names, ui_car.json name/brand/tags,
+a short description, specs and author. Each query is timed (median of 20)
+with an empty term cache and again with the terms cached.
+"""
+
+import os
+import sys
+import time
+import random
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.car_search import CarSearchIndex
+
+BRANDS = ['Audi', 'BMW', 'Porsche', 'Ferrari', 'Lamborghini', 'Mercedes-Benz', 'Nissan',
+          'Toyota', 'Honda', 'Mazda', 'Ford', 'Chevrolet', 'Alfa Romeo', 'Lotus', 'McLaren']
+MODELS = ['RS5', 'M3 E46', '911 GT3 RS', '458 Italia', 'Huracan', 'AMG GT', 'GT-R R35',
+          'Supra A80', 'NSX', 'RX-7 FD', 'Mustang', 'Corvette C7', 'Giulia QV', 'Exige', '720S']
+TAGS = ['street', 'race', 'drift', 'turbo', 'rwd', 'awd', 'fwd', 'manual', 'semiautomatic',
+        'vintage', 'gt3', 'tuned', 'stock']
+AUTHORS = ['teamsesh', 'kunos', 'reboot', 'vrc', 'rss', 'urd', 'assettoland', 'legion']
+WORDS = ['fast', 'car', 'with', 'engine', 'power', 'handling', 'track', 'road', 'tuned',
+         'balanced', 'chassis', 'aero', 'grip', 'classic', 'modern', 'edition', 'limited']
+
+QUERIES = ['a', 'rs5', 'porsc', 'porsche 911', 'lamborgini', 'drift turbo',
+           'teamsesh', 'gt3 rs', 'xyzzy']
+
+
+def _synthetic_records(count: int):
+    rng = random.Random(42)
+    records = []
+    for i in range(count):
+        brand = rng.choice(BRANDS)
+        model = rng.choice(MODELS)
+        author = rng.choice(AUTHORS)
+        folder = f"{brand.split()[0].lower()}_{rng.choice(['a5', 'x', 'v2', 'pro'])}_{author}_{i}"
+        records.append({
+            'name': folder,
+            'display_name': f"{brand} {model}",
+            'brand': brand,
+            'tags': rng.sample(TAGS, 3),
+            'author': author,
+            'specs': {'bhp': f"{rng.randint(100, 900)} bhp", 'weight': f"{rng.randint(900, 2000)} kg"},
+            'description': ' '.join(rng.choice(WORDS) for _ in range(25)),
+        })
+    return records
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    records = _synthetic_records(count)
+
+    start = time.perf_counter()
+    index = CarSearchIndex()
+    index.build(records)
+    build = time.perf_counter() - start
+    print(f"{count} cars: build {build * 1000:.0f} ms")
+
+    start = time.perf_counter()
+    for record in records[:100]:
+        index.add(record['name'], dict(record, display_name=record['display_name'] + ' Mk2'))
+    print(f"  re-index 1 car : {(time.perf_counter() - start) * 10:8.3f} ms")
+
+    print("  query              cold (ms)  cached (ms)")
+    for query in QUERIES:
+        cold = []
+        warm = []
+        for _ in range(20):
+            index._term_cache.clear()
+            start = time.perf_counter()
+            results = index.search(query, limit=100)
+            cold.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            index.search(query, limit=100)
+            warm.append(time.perf_counter() - start)
+        top = results[0][0] if results else '-'
+        print(f"  {query!r:16} {statistics.median(cold) * 1000:10.3f} {statistics.median(warm) * 1000:12.3f}"
+              f"   ({len(results)} shown, top: {top})")
+
+
+if __name__ == '__main__':
+    main()
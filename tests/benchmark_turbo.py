@@ -0,0 +1,54 @@
+"""
+Benchmark: transient turbo spool simulation over batches of traces.
+
+Run from the project root:
+    python tests/benchmark_turbo.py [traces] [seconds]
+
+Uses examples/data (power.lut and the TURBO_n sections of engine.ini).
+Each trace is a 2000 -> 7000 RPM pull at AC's physics rate with a
+random throttle level; one trace, then the whole batch, are simulated
+(median of 5 runs each).
+"""
+
+import os
+import sys
+import time
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.ini_parser import IniParser
+from core.lut_parser import LUTCurve
+from core.turbo_spool import TurboSpoolSimulator, read_turbo_configs, PHYSICS_HZ
+
+DATA = os.path.join(os.path.dirname(__file__), '..', 'examples', 'data')
+
+
+def _median_ms(func, repeats: int = 5) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    traces = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    steps = int(seconds * PHYSICS_HZ)
+
+    configs = read_turbo_configs(IniParser(os.path.join(DATA, 'engine.ini')))
+    sim = TurboSpoolSimulator(LUTCurve(os.path.join(DATA, 'power.lut')).get_points(), configs)
+    rpm = np.linspace(2000.0, 7000.0, steps)
+    throttle = np.random.default_rng(0).uniform(0.3, 1.0, (traces, 1))
+
+    print(f"{len(configs)} turbo(s), {steps} steps ({seconds:.1f} s at {PHYSICS_HZ:.0f} Hz)")
+    print(f"  1 trace      : {_median_ms(lambda: sim.simulate(rpm)):8.2f} ms")
+    print(f"  {traces} traces: {_median_ms(lambda: sim.simulate(rpm, throttle)):8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
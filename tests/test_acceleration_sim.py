@@ -0,0 +1,84 @@
+"""
+Tests for the straight-line acceleration simulator (core.acceleration_sim)
+"""
+
+import unittest
+import os
+import sys
+import math
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.acceleration_sim import AccelerationSimulator, QUARTER_MILE, GRAVITY
+
+EXAMPLE_DATA = os.path.join(os.path.dirname(__file__), '..', 'examples', 'data')
+
+
+class TestAccelerationSimulator(unittest.TestCase):
+    """Test the speed-grid integration against closed-form cases"""
+
+    def setUp(self):
+        # Flat 400 Nm, overall ratio 4 on a 0.4 m tyre: 4000 N on 1000 kg = 4 m/s²
+        self.flat = [(0.0, 400.0), (10000.0, 400.0)]
+
+    def _sim(self, **kwargs):
+        args = dict(gear_ratios=[1.0], final_ratio=4.0, mass=1000.0, tyre_radius=0.4,
+                    limiter=20000.0, launch_rpm=1.0)
+        args.update(kwargs)
+        return AccelerationSimulator(self.flat, **args)
+
+    def test_constant_acceleration(self):
+        result = self._sim().run()
+        self.assertAlmostEqual(result['zero_to_100'], (100 / 3.6) / 4.0, places=3)
+        self.assertAlmostEqual(result['zero_to_200'], (200 / 3.6) / 4.0, places=3)
+        self.assertAlmostEqual(result['quarter_mile'], math.sqrt(2 * QUARTER_MILE / 4.0), places=2)
+        self.assertAlmostEqual(result['trap_speed'],
+                               math.sqrt(2 * QUARTER_MILE * 4.0) * 3.6, delta=0.1)
+
+    def test_grip_limits_launch(self):
+        result = self._sim(grip=0.2, driven_load=0.5).run()
+        accel = 0.2 * 0.5 * GRAVITY
+        self.assertAlmostEqual(result['zero_to_100'], (100 / 3.6) / accel, places=2)
+
+    def test_drag_limits_speed(self):
+        # 4000 N = ½ρ·CdA·v² at v = 50 m/s (180 km/h)
+        drag_area = 4000.0 / (0.5 * 1.225 * 50.0 ** 2)
+        result = self._sim(drag_area=drag_area).run()
+        self.assertIsNone(result['zero_to_200'])
+        self.assertAlmostEqual(result['speed'][-1], 180.0, delta=1.0)
+        self.assertGreater(result['zero_to_100'], (100 / 3.6) / 4.0)
+
+    def test_upshifts_and_shift_time(self):
+        fast = self._sim(gear_ratios=[2.0, 1.0], limiter=5000.0, shift_time=0.0).run()
+        slow = self._sim(gear_ratios=[2.0, 1.0], limiter=5000.0, shift_time=0.5).run()
+        self.assertEqual(list(fast['gear'][[0, -1]]), [1, 2])
+        self.assertTrue((fast['gear'][1:] >= fast['gear'][:-1]).all())
+        self.assertAlmostEqual(slow['zero_to_100'] - fast['zero_to_100'], 0.5, places=2)
+
+    def test_missing_inputs(self):
+        result = self._sim(gear_ratios=[]).run()
+        self.assertIsNone(result['zero_to_100'])
+        self.assertIsNone(result['quarter_mile'])
+        self.assertEqual(len(result['time']), 0)
+
+    def test_top_speeds_need_solver_inputs(self):
+        self.assertEqual(len(self._sim(gear_ratios=[1.0, 0.0]).top_speeds()), 2)
+        self.assertIsNone(self._sim(tyre_radius=0.0).top_speeds())
+        self.assertIsNone(self._sim(final_ratio=0.0).top_speeds())
+        self.assertIsNone(AccelerationSimulator([], [1.0], 4.0, 1000.0, 0.4).top_speeds())
+        self.assertIsNone(AccelerationSimulator([(0, 0), (8000, 0)], [1.0], 4.0, 1000.0,
+                                                0.4).top_speeds())
+
+    def test_example_car(self):
+        sim = AccelerationSimulator.from_car_data(EXAMPLE_DATA)
+        self.assertEqual(len(sim.gear_ratios), 6)
+        self.assertEqual(sim.mass, 1500.0)
+        self.assertGreater(sim.drag_area, 0.0)
+        result = sim.run()
+        self.assertGreater(result['zero_to_100'], 3.0)
+        self.assertLess(result['zero_to_100'], 15.0)
+        self.assertGreater(result['quarter_mile'], result['zero_to_100'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,399 @@
+"""
+Tests for the native data.acd decoder (core.acd_archive)
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import shutil
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.acd_archive import (
+    generate_acd_key, read_acd, extract_acd, AcdArchive,
+    encode_entry, decode_entry, pack_acd, MANIFEST_SUFFIX
+)
+from core.car_file_manager import CarFileManager
+from core.ini_parser import IniParser
+from core.lut_parser import LUTCurve
+from core.rto_parser import RTOParser
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+EXAMPLE_ACD = os.path.join(EXAMPLES_DIR, 'data.acd')
+EXAMPLE_DATA = os.path.join(EXAMPLES_DIR, 'data')
+# examples/data.acd was packed in the audi_A5_teamsesh car folder
+EXAMPLE_CAR = 'audi_A5_teamsesh'
+
+
+def _normalize(content: bytes) -> bytes:
+    """The packed files use CRLF, the checked-in copies in examples/data use LF."""
+    return content.replace(b'\r\n', b'\n')
+
+
+class TestAcdKey(unittest.TestCase):
+    """Test key derivation from the car folder name"""
+
+    def test_known_key(self):
+        self.assertEqual(generate_acd_key('audi_a5_teamsesh'), '81-59-220-147-254-196-21-105')
+
+    def test_key_is_case_insensitive(self):
+        self.assertEqual(generate_acd_key('Audi_A5_TeamSesh'), generate_acd_key('audi_a5_teamsesh'))
+
+    def test_short_names(self):
+        """Short names skip most loops but must still give 8 values"""
+        for name in ('a', 'ab', 'abc', 'abcd'):
+            parts = generate_acd_key(name).split('-')
+            self.assertEqual(len(parts), 8)
+            for p in parts:
+                self.assertTrue(0 <= int(p) <= 255)
+
+
+@unittest.skipUnless(os.path.exists(EXAMPLE_ACD), "examples/data.acd not available")
+class TestAcdDecode(unittest.TestCase):
+    """Test decoding the bundled examples/data.acd"""
+
+    def test_read_matches_unpacked_examples(self):
+        entries = read_acd(EXAMPLE_ACD, folder_name=EXAMPLE_CAR)
+        self.assertEqual(len(entries), 47)
+        for name, content in entries.items():
+            with open(os.path.join(EXAMPLE_DATA, name), 'rb') as f:
+                expected = f.read()
+            self.assertEqual(_normalize(content), _normalize(expected), name)
+
+    def test_wrong_folder_name_gives_garbage(self):
+        entries = read_acd(EXAMPLE_ACD, folder_name='some_other_car')
+        self.assertFalse(entries['engine.ini'].startswith(b'[HEADER]'))
+
+    def test_truncated_archive_raises(self):
+        with open(EXAMPLE_ACD, 'rb') as f:
+            data = f.read()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'data.acd')
+            with open(path, 'wb') as f:
+                f.write(data[:1000])
+            with self.assertRaises(ValueError):
+                read_acd(path, folder_name=EXAMPLE_CAR)
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+@unittest.skipUnless(os.path.exists(EXAMPLE_ACD), "examples/data.acd not available")
+class TestAcdArchive(unittest.TestCase):
+    """Test random-access reads without extraction"""
+
+    def setUp(self):
+        self.archive = AcdArchive(EXAMPLE_ACD, folder_name=EXAMPLE_CAR)
+
+    def test_index(self):
+        self.assertEqual(len(self.archive), 47)
+        self.assertIn('engine.ini', self.archive)
+        self.assertNotIn('final.rto', self.archive)
+        self.assertEqual(self.archive.names()[0], 'aero.ini')
+
+    def test_decodes_only_requested_entries(self):
+        self.archive.read_bytes('engine.ini')
+        self.assertEqual(list(self.archive._cache), ['engine.ini'])
+
+    def test_get_ini(self):
+        parser = self.archive.get_ini('engine.ini')
+        expected = IniParser(os.path.join(EXAMPLE_DATA, 'engine.ini'))
+        self.assertEqual(parser.get_value('ENGINE_DATA', 'LIMITER'),
+                         expected.get_value('ENGINE_DATA', 'LIMITER'))
+
+    def test_get_lut(self):
+        curve = self.archive.get_lut('power.lut')
+        expected = LUTCurve(os.path.join(EXAMPLE_DATA, 'power.lut'))
+        self.assertEqual(curve.get_points(), expected.get_points())
+
+    def test_get_rto_from_string(self):
+        parser = RTOParser.from_string("4.90|4.90\n80//31|3.88\n")
+        self.assertEqual(parser.get_ratios(), [4.90, 3.88])
+
+    def test_missing_entry(self):
+        self.assertIsNone(self.archive.get_ini('no_such.ini'))
+        with self.assertRaises(KeyError):
+            self.archive.read_bytes('no_such.ini')
+
+    def test_physics_summary_from_acd(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            car_path = os.path.join(temp_dir, EXAMPLE_CAR)
+            os.makedirs(car_path)
+            shutil.copy2(EXAMPLE_ACD, os.path.join(car_path, 'data.acd'))
+            summary = CarFileManager(temp_dir).get_physics_summary(EXAMPLE_CAR)
+            self.assertEqual(summary['source'], 'acd')
+            self.assertEqual(summary['total_mass'], 1500.0)
+            self.assertEqual(summary['gears'], 6)
+            self.assertIsNotNone(summary['limiter'])
+            self.assertIsNotNone(summary['peak_torque'])
+            # Nothing was written next to data.acd
+            self.assertEqual(os.listdir(car_path), ['data.acd'])
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+@unittest.skipUnless(os.path.exists(EXAMPLE_ACD), "examples/data.acd not available")
+class TestCarFileManagerUnpack(unittest.TestCase):
+    """Test CarFileManager.unpack_data_acd with the native decoder"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        car_path = os.path.join(self.temp_dir, EXAMPLE_CAR)
+        os.makedirs(car_path)
+        shutil.copy2(EXAMPLE_ACD, os.path.join(car_path, 'data.acd'))
+        self.manager = CarFileManager(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_extract_acd_uses_parent_folder_as_key(self):
+        acd_path = os.path.join(self.temp_dir, EXAMPLE_CAR, 'data.acd')
+        out_dir = os.path.join(self.temp_dir, 'out')
+        names = extract_acd(acd_path, out_dir)
+        self.assertIn('engine.ini', names)
+        with open(os.path.join(out_dir, 'engine.ini'), 'rb') as f:
+            self.assertTrue(f.read().startswith(b'[HEADER]'))
+
+    def test_unpack_and_rename(self):
+        self.assertTrue(self.manager.unpack_data_acd(EXAMPLE_CAR, delete_acd=True))
+        self.assertTrue(self.manager.has_data_folder(EXAMPLE_CAR))
+        self.assertFalse(self.manager.has_data_acd(EXAMPLE_CAR))
+        car_path = self.manager.get_car_path(EXAMPLE_CAR)
+        self.assertTrue(os.path.exists(os.path.join(car_path, 'data.acd.bak')))
+        data_files = os.listdir(self.manager.get_car_data_path(EXAMPLE_CAR))
+        self.assertEqual(len(data_files), 47)
+
+    def test_unpack_keep_acd(self):
+        self.assertTrue(self.manager.unpack_data_acd(EXAMPLE_CAR, delete_acd=False))
+        self.assertTrue(self.manager.has_data_acd(EXAMPLE_CAR))
+
+    def test_unpack_missing_acd(self):
+        self.assertFalse(self.manager.unpack_data_acd('no_such_car'))
+
+
+@unittest.skipUnless(os.path.exists(EXAMPLE_ACD), "examples/data.acd not available")
+class TestAcdPack(unittest.TestCase):
+    """Test packing data/ into data.acd"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.car_path = os.path.join(self.temp_dir, EXAMPLE_CAR)
+        self.data_path = os.path.join(self.car_path, 'data')
+        self.acd_path = os.path.join(self.car_path, 'data.acd')
+        os.makedirs(self.car_path)
+        extract_acd(EXAMPLE_ACD, self.data_path, folder_name=EXAMPLE_CAR)
+        self.manager = CarFileManager(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_encode_decode_roundtrip(self):
+        key = generate_acd_key(EXAMPLE_CAR)
+        content = bytes(range(256)) * 3
+        self.assertEqual(decode_entry(encode_entry(content, key), key), content)
+
+    def test_repack_is_byte_identical(self):
+        """examples/data.acd uses the legacy layout with sorted names"""
+        stats = pack_acd(self.data_path, self.acd_path)
+        self.assertEqual(stats['entries'], 47)
+        with open(self.acd_path, 'rb') as f, open(EXAMPLE_ACD, 'rb') as g:
+            self.assertEqual(f.read(), g.read())
+
+    def test_bak_files_are_skipped(self):
+        with open(os.path.join(self.data_path, 'engine.ini.bak'), 'wb') as f:
+            f.write(b'old')
+        pack_acd(self.data_path, self.acd_path)
+        self.assertNotIn('engine.ini.bak', AcdArchive(self.acd_path))
+
+    def test_incremental_reencrypts_only_changed(self):
+        stats = self.manager.pack_data_acd(EXAMPLE_CAR, incremental=True)
+        self.assertEqual(stats['encrypted'], 47)
+        self.assertTrue(os.path.exists(self.acd_path + MANIFEST_SUFFIX))
+
+        engine_path = os.path.join(self.data_path, 'engine.ini')
+        parser = IniParser(engine_path)
+        parser.set_value('ENGINE_DATA', 'LIMITER', '7777')
+        parser.save(backup=True)
+
+        stats = self.manager.pack_data_acd(EXAMPLE_CAR, incremental=True)
+        self.assertEqual(stats, {'entries': 47, 'encrypted': 1, 'copied': 46})
+
+        archive = AcdArchive(self.acd_path)
+        self.assertEqual(archive.get_ini('engine.ini').get_value('ENGINE_DATA', 'LIMITER'), '7777')
+        for name in ('aero.ini', 'power.lut', 'tyres.ini'):
+            with open(os.path.join(self.data_path, name), 'rb') as f:
+                self.assertEqual(archive.read_bytes(name), f.read())
+
+    def test_touched_but_unchanged_file_is_copied(self):
+        self.manager.pack_data_acd(EXAMPLE_CAR)
+        os.utime(os.path.join(self.data_path, 'car.ini'))
+        stats = self.manager.pack_data_acd(EXAMPLE_CAR)
+        self.assertEqual(stats['encrypted'], 0)
+
+    def test_replaced_acd_invalidates_manifest(self):
+        self.manager.pack_data_acd(EXAMPLE_CAR)
+        shutil.copy(EXAMPLE_ACD, self.acd_path)
+        os.utime(self.acd_path, ns=(1, 1))
+        stats = self.manager.pack_data_acd(EXAMPLE_CAR)
+        self.assertEqual(stats['encrypted'], 47)
+
+    def test_full_mode_ignores_manifest(self):
+        self.manager.pack_data_acd(EXAMPLE_CAR)
+        stats = self.manager.pack_data_acd(EXAMPLE_CAR, incremental=False)
+        self.assertEqual(stats['encrypted'], 47)
+
+    def test_corrupt_previous_archive_is_closed(self):
+        self.manager.pack_data_acd(EXAMPLE_CAR)
+        # Truncate data.acd but keep the manifest matching it
+        with open(self.acd_path, 'r+b') as f:
+            f.truncate(1000)
+        manifest_path = self.acd_path + MANIFEST_SUFFIX
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        st = os.stat(self.acd_path)
+        manifest['acd_size'], manifest['acd_mtime_ns'] = st.st_size, st.st_mtime_ns
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+
+        opened = []
+        real_open = open
+
+        def tracking_open(*args, **kwargs):
+            f = real_open(*args, **kwargs)
+            opened.append(f)
+            return f
+
+        with mock.patch('core.acd_archive.open', tracking_open, create=True):
+            with self.assertRaises(ValueError):
+                pack_acd(self.data_path, self.acd_path, incremental=True)
+        self.assertTrue(opened)
+        self.assertTrue(all(f.closed for f in opened))
+        self.assertFalse(os.path.exists(self.acd_path + '.tmp'))
+
+    def test_non_latin1_names_are_reported_before_writing(self):
+        for name in ('\u0434\u0432\u0438\u0433\u0430\u0442\u0435\u043b\u044c.ini', '\u20ac.lut'):
+            with open(os.path.join(self.data_path, name), 'wb') as f:
+                f.write(b'x')
+        with open(EXAMPLE_ACD, 'rb') as f:
+            original = f.read()
+        shutil.copy(EXAMPLE_ACD, self.acd_path)
+        with self.assertRaises(ValueError) as cm:
+            pack_acd(self.data_path, self.acd_path)
+        message = str(cm.exception)
+        self.assertIn('\u20ac.lut', message)
+        self.assertIn('\u0434\u0432\u0438\u0433\u0430\u0442\u0435\u043b\u044c.ini', message)
+        self.assertIn("'latin-1' codec can't encode", message)
+        self.assertIsInstance(cm.exception.__cause__, UnicodeEncodeError)
+        self.assertFalse(os.path.exists(self.acd_path + '.tmp'))
+        with open(self.acd_path, 'rb') as f:
+            self.assertEqual(f.read(), original)
+
+    def test_pack_without_data_folder(self):
+        shutil.rmtree(self.data_path)
+        self.assertIsNone(self.manager.pack_data_acd(EXAMPLE_CAR))
+
+
+@unittest.skipUnless(os.path.exists(EXAMPLE_ACD), "examples/data.acd not available")
+class TestBulkUnpack(unittest.TestCase):
+    """Test CarFileManager.unpack_all on a process pool"""
+
+    CARS = ['car_a', 'car_b', 'car_c']
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        plain_dir = os.path.join(self.temp_dir, '_plain')
+        extract_acd(EXAMPLE_ACD, plain_dir, folder_name=EXAMPLE_CAR)
+        for car in self.CARS:
+            car_path = os.path.join(self.temp_dir, car)
+            os.makedirs(car_path)
+            pack_acd(plain_dir, os.path.join(car_path, 'data.acd'))
+        shutil.rmtree(plain_dir)
+        # A car with a corrupt archive
+        os.makedirs(os.path.join(self.temp_dir, 'broken_car'))
+        with open(os.path.join(self.temp_dir, 'broken_car', 'data.acd'), 'wb') as f:
+            f.write(b'\xff' * 10)
+        self.manager = CarFileManager(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_unpack_all_reports_per_car(self):
+        events = []
+        results = self.manager.unpack_all(
+            max_workers=2,
+            progress_callback=lambda done, total, car, status: events.append((done, total, car, status))
+        )
+        self.assertEqual(sorted(results['unpacked']), self.CARS)
+        self.assertIn('broken_car', results['failed'])
+        self.assertEqual(len(events), 4)
+        self.assertEqual(events[-1][:2], (4, 4))
+        for car in self.CARS:
+            engine = IniParser(os.path.join(self.temp_dir, car, 'data', 'engine.ini'))
+            self.assertTrue(engine.has_section('ENGINE_DATA'))
+            # data.acd kept by default
+            self.assertTrue(self.manager.has_data_acd(car))
+
+    def test_up_to_date_cars_are_skipped(self):
+        self.manager.unpack_all(['car_a'], max_workers=1)
+        data_path = self.manager.get_car_data_path('car_a')
+        acd_path = os.path.join(self.manager.get_car_path('car_a'), 'data.acd')
+        os.utime(acd_path, (1000, 1000))
+        self.assertNotIn('car_a', self.manager.get_packed_cars())
+
+        results = self.manager.unpack_all(['car_a', 'car_b'], max_workers=1)
+        self.assertEqual(results['skipped'], ['car_a'])
+        self.assertEqual(results['unpacked'], ['car_b'])
+
+        # A newer data.acd than data/ must be unpacked again
+        os.utime(data_path, (1000, 1000))
+        os.utime(acd_path, (2000, 2000))
+        self.assertIn('car_a', self.manager.get_packed_cars())
+
+    def test_unpack_over_existing_data_is_up_to_date(self):
+        data_path = self.manager.get_car_data_path('car_a')
+        acd_path = os.path.join(self.manager.get_car_path('car_a'), 'data.acd')
+        for unpack in (lambda: self.manager.unpack_all(['car_a'], max_workers=1),
+                       lambda: self.manager.unpack_data_acd('car_a', delete_acd=False)):
+            unpack()
+            # A newer data.acd is unpacked again over the existing files
+            os.utime(data_path, (1000, 1000))
+            os.utime(acd_path, (2000, 2000))
+            self.assertFalse(self.manager.is_unpack_up_to_date('car_a'))
+            unpack()
+            self.assertTrue(self.manager.is_unpack_up_to_date('car_a'))
+            self.assertNotIn('car_a', self.manager.get_packed_cars())
+
+    def test_delete_acd(self):
+        results = self.manager.unpack_all(['car_a'], max_workers=1, delete_acd=True)
+        self.assertEqual(results['unpacked'], ['car_a'])
+        self.assertFalse(self.manager.has_data_acd('car_a'))
+        car_path = self.manager.get_car_path('car_a')
+        self.assertTrue(os.path.exists(os.path.join(car_path, 'data.acd.bak')))
+
+    def test_delete_acd_keeps_existing_backup(self):
+        car_path = self.manager.get_car_path('car_a')
+        bak_path = os.path.join(car_path, 'data.acd.bak')
+        with open(bak_path, 'wb') as f:
+            f.write(b'earlier backup')
+        results = self.manager.unpack_all(['car_a'], max_workers=1, delete_acd=True)
+        self.assertIn('car_a', results['failed'])
+        self.assertIn('already exists', results['failed']['car_a'])
+        self.assertTrue(self.manager.has_data_acd('car_a'))
+        with open(bak_path, 'rb') as f:
+            self.assertEqual(f.read(), b'earlier backup')
+
+    def test_cancel_before_start(self):
+        results = self.manager.unpack_all(self.CARS, max_workers=1, is_cancelled=lambda: True)
+        handled = len(results['unpacked']) + len(results['cancelled'])
+        self.assertEqual(handled, len(self.CARS))
+        self.assertGreater(len(results['cancelled']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
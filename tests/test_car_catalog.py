@@ -0,0 +1,161 @@
+"""
+Tests for the persistent car catalog (core.car_catalog)
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+import shutil
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.car_catalog import CarCatalog
+
+
+TEST_CAR = os.path.join(os.path.dirname(__file__), 'test_data', 'test_car')
+EXAMPLE_ACD = os.path.join(os.path.dirname(__file__), '..', 'examples', 'data.acd')
+
+
+class TestCarCatalog(unittest.TestCase):
+    """Test incremental refresh and persistence of the catalog"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cars_path = os.path.join(self.temp_dir, 'cars')
+        os.makedirs(self.cars_path)
+        for name in ('car_a', 'car_b'):
+            shutil.copytree(TEST_CAR, os.path.join(self.cars_path, name))
+        self.db_path = os.path.join(self.temp_dir, 'catalog.db')
+        self.catalog = CarCatalog(self.db_path, self.cars_path)
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _bump_mtime(self, path):
+        """Make a change visible even on filesystems with coarse mtimes"""
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+
+    def test_first_refresh_adds_all(self):
+        stats = self.catalog.refresh()
+        self.assertEqual(stats, {'added': 2, 'updated': 0, 'removed': 0, 'unchanged': 0,
+                                 'cancelled': False})
+        self.assertEqual(self.catalog.get_car_names(), ['car_a', 'car_b'])
+
+    def test_record_contents(self):
+        self.catalog.refresh()
+        car = self.catalog.get_car('car_a')
+        self.assertEqual(car['display_name'], 'Test Car')
+        self.assertEqual(car['brand'], 'Test Brand')
+        self.assertEqual(car['tags'], ['test'])
+        self.assertEqual(car['author'], 'AC Car Editor Test')
+        self.assertEqual(car['specs']['bhp'], '430 bhp')
+        self.assertIn('test car', car['description'])
+        self.assertTrue(car['has_data_folder'])
+        self.assertFalse(car['has_data_acd'])
+        self.assertEqual(car['physics']['source'], 'data')
+        self.assertIsNone(self.catalog.get_car('missing'))
+
+    def test_second_refresh_is_unchanged(self):
+        self.catalog.refresh()
+        stats = self.catalog.refresh()
+        self.assertEqual(stats, {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 2,
+                                 'cancelled': False})
+
+    def test_modified_ui_json_is_reread(self):
+        self.catalog.refresh()
+        ui_json = os.path.join(self.cars_path, 'car_a', 'ui', 'ui_car.json')
+        with open(ui_json, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['name'] = 'Renamed Car'
+        with open(ui_json, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        self._bump_mtime(ui_json)
+
+        stats = self.catalog.refresh()
+        self.assertEqual(stats['updated'], 1)
+        self.assertEqual(stats['unchanged'], 1)
+        self.assertEqual(self.catalog.get_car('car_a')['display_name'], 'Renamed Car')
+
+    def test_added_and_removed_cars(self):
+        self.catalog.refresh()
+        shutil.rmtree(os.path.join(self.cars_path, 'car_b'))
+        shutil.copytree(TEST_CAR, os.path.join(self.cars_path, 'car_c'))
+
+        stats = self.catalog.refresh()
+        self.assertEqual(stats, {'added': 1, 'updated': 0, 'removed': 1, 'unchanged': 1,
+                                 'cancelled': False})
+        self.assertEqual(self.catalog.get_car_names(), ['car_a', 'car_c'])
+
+    def test_persists_across_instances(self):
+        self.catalog.refresh()
+        self.catalog.close()
+        self.catalog = CarCatalog(self.db_path, self.cars_path)
+        self.assertEqual(self.catalog.get_car_names(), ['car_a', 'car_b'])
+        self.assertEqual(self.catalog.refresh()['unchanged'], 2)
+
+    def test_invalidate_and_refresh_car(self):
+        self.catalog.refresh()
+        self.catalog.invalidate('car_a')
+        self.assertEqual(self.catalog.refresh()['updated'], 1)
+
+        shutil.rmtree(os.path.join(self.cars_path, 'car_a'))
+        self.assertIsNone(self.catalog.refresh_car('car_a'))
+        self.assertEqual(self.catalog.get_car_names(), ['car_b'])
+
+    def test_cancelled_refresh_keeps_progress(self):
+        seen = []
+        stats = self.catalog.refresh(progress_callback=lambda d, t, n: seen.append(n),
+                                     is_cancelled=lambda: len(seen) >= 1)
+        self.assertEqual(stats['added'], 1)
+        self.assertTrue(stats['cancelled'])
+        self.assertEqual(self.catalog.refresh()['added'], 1)
+
+    def test_batches_stream_every_car(self):
+        shutil.copytree(TEST_CAR, os.path.join(self.cars_path, 'car_c'))
+        self.catalog.refresh()
+        self.catalog.invalidate('car_b')
+        batches = []
+        self.catalog.refresh(batch_callback=batches.append, batch_size=1)
+        self.assertEqual(len(batches), 3)
+        self.assertEqual(sorted(n for b in batches for n in b), ['car_a', 'car_b', 'car_c'])
+        # Re-read cars are reported last, after they are committed
+        self.assertEqual(batches[-1], ['car_b'])
+
+    def test_cancelled_listing_removes_nothing(self):
+        self.catalog.refresh()
+        shutil.rmtree(os.path.join(self.cars_path, 'car_b'))
+        stats = self.catalog.refresh(is_cancelled=lambda: True)
+        self.assertTrue(stats['cancelled'])
+        self.assertEqual(stats['removed'], 0)
+        self.assertEqual(self.catalog.get_car_names(), ['car_a', 'car_b'])
+
+    def test_schema_version_change_rebuilds(self):
+        self.catalog.refresh()
+        self.catalog.close()
+        CarCatalog.SCHEMA_VERSION += 1
+        try:
+            self.catalog = CarCatalog(self.db_path, self.cars_path)
+            self.assertEqual(self.catalog.get_car_names(), [])
+        finally:
+            CarCatalog.SCHEMA_VERSION -= 1
+
+    @unittest.skipUnless(os.path.exists(EXAMPLE_ACD), "examples/data.acd not available")
+    def test_packed_car_physics_from_acd(self):
+        car_path = os.path.join(self.cars_path, 'audi_a5_teamsesh')
+        os.makedirs(car_path)
+        shutil.copy2(EXAMPLE_ACD, os.path.join(car_path, 'data.acd'))
+        self.catalog.refresh()
+        car = self.catalog.get_car('audi_a5_teamsesh')
+        self.assertTrue(car['has_data_acd'])
+        self.assertFalse(car['has_data_folder'])
+        self.assertEqual(car['physics']['source'], 'acd')
+        self.assertIsNotNone(car['physics']['total_mass'])
+
+
+if __name__ == '__main__':
+    unittest.main()
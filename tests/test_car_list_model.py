@@ -0,0 +1,81 @@
+"""
+Tests for the model/view car list (gui.car_list_model)
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5.QtWidgets import QApplication
+
+from gui.car_list_model import CarListModel, CarFilterProxyModel
+
+
+class TestCarListModel(unittest.TestCase):
+    """Test batched appends, sorting and filtering"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for all tests"""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.model = CarListModel()
+        self.proxy = CarFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+
+    def _shown(self):
+        return [self.proxy.name_at(row) for row in range(self.proxy.rowCount())]
+
+    def test_batches_are_shown_sorted(self):
+        self.model.append_names(['ks_porsche', 'BMW_m3'])
+        self.model.append_names(['audi_a5', 'ks_audi_r8', 'bmw_z4'])
+        self.assertEqual(self._shown(), ['audi_a5', 'BMW_m3', 'bmw_z4', 'ks_audi_r8', 'ks_porsche'])
+        self.assertEqual(self.model.names(), ['ks_porsche', 'BMW_m3', 'audi_a5', 'ks_audi_r8', 'bmw_z4'])
+
+    def test_duplicates_are_skipped(self):
+        self.model.append_names(['a', 'b'])
+        self.model.append_names(['b', 'c', 'c'])
+        self.assertEqual(self.model.rowCount(), 3)
+
+    def test_filter_is_case_insensitive_substring(self):
+        self.model.append_names(['ks_audi_r8', 'audi_a5', 'bmw_m3'])
+        self.proxy.set_filter_text('AUDI')
+        self.assertEqual(self._shown(), ['audi_a5', 'ks_audi_r8'])
+        self.proxy.set_filter_text('')
+        self.assertEqual(self.proxy.rowCount(), 3)
+
+    def test_append_while_filtered(self):
+        self.model.append_names(['audi_a5', 'bmw_m3'])
+        self.proxy.set_filter_text('audi')
+        self.model.append_names(['ks_audi_r8', 'ferrari_458', 'audi_a1'])
+        self.assertEqual(self._shown(), ['audi_a1', 'audi_a5', 'ks_audi_r8'])
+        self.proxy.set_filter_text('')
+        self.assertEqual(self._shown(), ['audi_a1', 'audi_a5', 'bmw_m3', 'ferrari_458', 'ks_audi_r8'])
+
+    def test_index_of_and_data(self):
+        self.model.append_names(['c', 'a', 'b'])
+        index = self.proxy.index_of('b')
+        self.assertEqual(index.row(), 1)
+        self.assertEqual(index.data(), 'b')
+        self.assertEqual(self.proxy.mapToSource(index).row(), 2)
+        self.proxy.set_filter_text('a')
+        self.assertFalse(self.proxy.index_of('b').isValid())
+        self.assertFalse(self.proxy.index_of('missing').isValid())
+        self.assertIsNone(self.proxy.name_at(5))
+
+    def test_source_reset(self):
+        self.model.append_names(['a', 'b'])
+        self.model.set_names(['z', 'y'])
+        self.assertEqual(self._shown(), ['y', 'z'])
+        self.model.clear()
+        self.assertEqual(self.proxy.rowCount(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for the ranked car metadata search (core.car_search)
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.car_search import CarSearchIndex, tokenize
+
+
+def _record(name, display_name='', brand='', tags=None, description='', author='', specs=None):
+    return {
+        'name': name, 'display_name': display_name, 'brand': brand, 'tags': tags or [],
+        'description': description, 'author': author, 'specs': specs or {},
+    }
+
+
+class TestCarSearchIndex(unittest.TestCase):
+    """Test matching, ranking and incremental updates"""
+
+    def setUp(self):
+        self.index = CarSearchIndex()
+        self.index.build([
+            _record('audi_A5_teamsesh', 'Audi RS5 Coupe', 'Audi', ['street', 'turbo'],
+                    'Tuned RS5<br>for drifting', 'teamsesh', {'bhp': '450 bhp'}),
+            _record('ks_porsche_911_gt3_rs', 'Porsche 911 GT3 RS', 'Porsche', ['race', 'rwd'],
+                    'Track weapon', 'Kunos'),
+            _record('ks_lamborghini_huracan', 'Lamborghini Huracan GT3', 'Lamborghini', ['race'],
+                    'GT3 racer', 'Kunos'),
+            _record('bmw_m3_e46', 'BMW M3 E46', 'BMW', ['street'],
+                    'Not an audi, but people compare it with the RS5', 'someone'),
+        ])
+
+    def _names(self, query):
+        return [name for name, _score in self.index.search(query)]
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('audi_A5_teamsesh'), ['audi', 'a5', 'teamsesh'])
+        self.assertEqual(tokenize('Tuned RS5<br>for drifting'), ['tuned', 'rs5', 'for', 'drifting'])
+        self.assertEqual(tokenize('Mercedes-Benz AMG'), ['mercedes', 'benz', 'amg'])
+
+    def test_metadata_fields_are_searchable(self):
+        self.assertEqual(self._names('teamsesh'), ['audi_A5_teamsesh'])
+        self.assertEqual(self._names('450'), ['audi_A5_teamsesh'])
+        self.assertEqual(self._names('weapon'), ['ks_porsche_911_gt3_rs'])
+        self.assertEqual(self._names('kunos'), ['ks_lamborghini_huracan', 'ks_porsche_911_gt3_rs'])
+
+    def test_display_name_outranks_description(self):
+        # RS5 is in the Audi's display name but only in the BMW's description
+        self.assertEqual(self._names('rs5'), ['audi_A5_teamsesh', 'bmw_m3_e46'])
+
+    def test_prefix_match(self):
+        self.assertEqual(self._names('porsc'), ['ks_porsche_911_gt3_rs'])
+        self.assertEqual(self._names('lambo'), ['ks_lamborghini_huracan'])
+
+    def test_fuzzy_match_on_typo(self):
+        self.assertEqual(self._names('lamborgini'), ['ks_lamborghini_huracan'])
+        self.assertEqual(self._names('porshe'), ['ks_porsche_911_gt3_rs'])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self._names('gt3 race porsche'), ['ks_porsche_911_gt3_rs'])
+        self.assertEqual(self._names('gt3'), ['ks_lamborghini_huracan', 'ks_porsche_911_gt3_rs'])
+        self.assertEqual(self._names('audi xyzzy'), [])
+        self.assertEqual(self._names('   '), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.search('street', limit=1)), 1)
+
+    def test_incremental_update_and_remove(self):
+        self.assertEqual(self._names('rs5'), ['audi_A5_teamsesh', 'bmw_m3_e46'])
+        self.index.add('audi_A5_teamsesh', _record('audi_A5_teamsesh', 'Audi S5', 'Audi'))
+        self.assertEqual(self._names('rs5'), ['bmw_m3_e46'])
+        self.assertEqual(self._names('s5'), ['audi_A5_teamsesh'])
+        self.assertEqual(len(self.index), 4)
+
+        self.index.remove('bmw_m3_e46')
+        self.assertNotIn('bmw_m3_e46', self._names('rs5'))
+        self.assertNotIn('bmw_m3_e46', self.index)
+        self.assertEqual(self._names('e46'), [])
+        self.index.remove('bmw_m3_e46')  # no-op
+
+
+if __name__ == '__main__':
+    unittest.main()
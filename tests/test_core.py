@@ -8,6 +8,8 @@ import sys
 import tempfile
 import shutil
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
@@ -209,6 +211,84 @@ class TestIniParser(unittest.TestCase):
                 self.assertIsInstance(y, float)
 
 
+
+class TestLUTCurveArrays(unittest.TestCase):
+    """Test the float64 array storage and vectorized interpolation of LUTCurve"""
+
+    def setUp(self):
+        self.curve = LUTCurve.from_string("0|0\n1000|100\n2000|300\n4000|100\n")
+
+    def test_arrays_are_contiguous_float64(self):
+        for array in (self.curve.x, self.curve.y):
+            self.assertEqual(array.dtype, np.float64)
+            self.assertTrue(array.flags.c_contiguous)
+            self.assertFalse(array.flags.writeable)
+        self.assertEqual(self.curve.x.tolist(), [0.0, 1000.0, 2000.0, 4000.0])
+
+    def test_interpolate_many_matches_scalar(self):
+        xs = np.linspace(-500.0, 4500.0, 101)
+        expected = [self.curve.interpolate(x) for x in xs]
+        np.testing.assert_allclose(self.curve.interpolate_many(xs), expected)
+        self.assertEqual(self.curve.interpolate(3000.0), 200.0)
+        self.assertEqual(self.curve.interpolate(2000.0), 300.0)
+        self.assertEqual(self.curve.interpolate_many([[500.0, 5000.0]]).tolist(), [[50.0, 100.0]])
+
+    def test_lookup_follows_edits(self):
+        self.assertEqual(self.curve.interpolate(1500.0), 200.0)
+        self.curve.update_point(2, 2000.0, 500.0)
+        self.assertEqual(self.curve.interpolate(1500.0), 300.0)
+        self.curve.add_point(1500.0, 0.0)
+        self.assertEqual(self.curve.interpolate_many([1500.0]).tolist(), [0.0])
+        self.curve.remove_point(2)
+        self.assertEqual(self.curve.interpolate(1500.0), 300.0)
+        self.curve.clear()
+        self.assertEqual(self.curve.interpolate(1500.0), 0.0)
+        self.assertEqual(self.curve.interpolate_many([1.0, 2.0]).tolist(), [0.0, 0.0])
+
+    def test_unsorted_file_keeps_order(self):
+        curve = LUTCurve.from_string("2000|20\n0|0\n1000|10\n")
+        self.assertEqual(curve.get_points(), [(2000.0, 20.0), (0.0, 0.0), (1000.0, 10.0)])
+        self.assertEqual(curve.interpolate(1500.0), 15.0)
+        self.assertEqual(curve.interpolate_many([500.0]).tolist(), [5.0])
+
+    def test_points_setter(self):
+        points = self.curve.points
+        points[0] = (0.0, 50.0)
+        self.assertEqual(self.curve.points[0], (0.0, 0.0))
+        self.curve.points = points
+        self.assertEqual(self.curve.interpolate(500.0), 75.0)
+        self.assertEqual(LUTCurve.from_points([(1, 2)]).get_points(), [(1.0, 2.0)])
+
+    def test_move_point_returns_new_index(self):
+        self.assertEqual(self.curve.move_point(0, 3000.0, 50.0), 2)
+        self.assertEqual(self.curve.get_points(),
+                         [(1000.0, 100.0), (2000.0, 300.0), (3000.0, 50.0), (4000.0, 100.0)])
+        self.assertEqual(self.curve.interpolate(3500.0), 75.0)
+        self.assertEqual(self.curve.move_point(3, 500.0, 0.0), 0)
+        self.assertEqual(self.curve.x.tolist(), [500.0, 1000.0, 2000.0, 3000.0])
+        self.assertEqual(self.curve.move_point(1, 1500.0, 0.0), 1)
+        self.assertIsNone(self.curve.move_point(4, 0.0, 0.0))
+
+    def test_move_point_matches_stable_sort(self):
+        rng = np.random.default_rng(0)
+        for _ in range(500):
+            n = int(rng.integers(1, 10))
+            x = np.sort(rng.integers(0, 5, n)).astype(float)
+            y = np.arange(n, dtype=float)
+            curve = LUTCurve.from_points(zip(x, y))
+            index, new_x = int(rng.integers(0, n)), float(rng.integers(-1, 6))
+            x[index], y[index] = new_x, -1.0
+            order = np.argsort(x, kind='stable')
+            self.assertEqual(curve.move_point(index, new_x, -1.0),
+                             int(np.flatnonzero(order == index)[0]))
+            self.assertEqual(curve.x.tolist(), x[order].tolist())
+            self.assertEqual(curve.y.tolist(), y[order].tolist())
+
+    def test_move_point_on_unsorted_curve_sorts(self):
+        curve = LUTCurve.from_string("2000|20\n0|0\n1000|10\n")
+        self.assertEqual(curve.move_point(0, 500.0, 5.0), 1)
+        self.assertEqual(curve.get_points(), [(0.0, 0.0), (500.0, 5.0), (1000.0, 10.0)])
+
 class TestCarFileManager(unittest.TestCase):
     """Test car file manager"""
     
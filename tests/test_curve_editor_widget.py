@@ -0,0 +1,205 @@
+"""
+Tests for the interactive curve editor (gui.curve_editor_widget)
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5.QtWidgets import QApplication
+from matplotlib.backend_bases import MouseEvent
+from matplotlib.figure import Figure
+
+from core.lut_parser import LUTCurve
+from gui.curve_editor_widget import CurveEditorWidget
+from gui.frame_timer import FrameTimer
+from gui.point_hit_index import PointHitIndex
+
+
+class TestCurveEditorDrag(unittest.TestCase):
+    """Test that dragging uses the persistent artists and blitting"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for all tests"""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.widget = CurveEditorWidget()
+        self.widget.resize(800, 600)
+        self.widget.load_curve(LUTCurve.from_points([(i * 100, i * 10) for i in range(50)]))
+        self.widget.redraw.flush()   # apply the layout before computing event positions
+        self.draws = 0
+        self.idle_draws = 0
+        canvas = self.widget.canvas
+        draw = canvas.draw
+
+        def counting_draw():
+            self.draws += 1
+            draw()
+
+        def counting_draw_idle():
+            self.idle_draws += 1
+        canvas.draw = counting_draw
+        canvas.draw_idle = counting_draw_idle
+
+    def tearDown(self):
+        self.widget.close()
+
+    def _event(self, name, x, y):
+        px, py = self.widget.ax.transData.transform((x, y))
+        return MouseEvent(name, self.widget.canvas, px, py, button=1)
+
+    def test_artists_are_reused(self):
+        lines = list(self.widget.ax.lines)
+        self.assertEqual(len(lines), 3)
+        self.widget.selected_point_index = 4
+        self.widget.plot_curve()
+        self.assertEqual(list(self.widget.ax.lines), lines)
+        self.assertEqual(list(self.widget._selected_marker.get_xdata()), [400])
+
+    def test_drag_blits_and_relayouts_on_release(self):
+        widget = self.widget
+        draws = self.draws
+        widget.on_mouse_press(self._event('button_press_event', 2000, 200))
+        self.assertTrue(widget.dragging)
+        self.assertEqual(widget.selected_point_index, 20)
+        self.assertTrue(widget._line.get_animated())
+        # The press only schedules the draw that caches the background
+        self.assertEqual(self.draws, draws)
+        self.assertTrue(widget.redraw.pending)
+        self.assertIsNone(widget._background)
+        idle_draws = self.idle_draws
+        widget.redraw.flush()
+        self.assertEqual(self.idle_draws, idle_draws + 1)
+        widget.canvas.draw()   # what draw_idle() does once the event loop runs
+        self.assertIsNotNone(widget._background)
+
+        widget.redraw.reset_stats()
+        draws = self.draws
+        for step in range(10):
+            widget.on_mouse_move(self._event('motion_notify_event', 2000, 200 + step * 5))
+        self.assertEqual(widget.curve.get_points()[20], (2000, 245))
+        self.assertEqual(widget.frame_timer.count, 0)   # rendered in the next frame
+        widget.redraw.flush()
+        self.assertEqual(widget.frame_timer.count, 1)   # ten moves, one blitted frame
+        self.assertEqual(widget.redraw.merged, 9)
+        self.assertEqual(self.draws, draws)   # no full redraw while dragging
+        self.assertEqual(widget._line.get_ydata()[20], 245)
+
+        idle_draws = self.idle_draws
+        widget.on_mouse_release(self._event('button_release_event', 2000, 245))
+        widget.redraw.flush()
+        self.assertEqual((self.draws, self.idle_draws), (draws, idle_draws + 1))
+        self.assertFalse(widget._line.get_animated())
+        self.assertIsNone(widget._background)
+        self.assertIn('fps', widget.frame_label.text())
+
+    def test_box_select_and_group_move(self):
+        widget = self.widget
+        # Box around points 10..14 (x 1000..1400), starting in empty space
+        widget.on_mouse_press(self._event('button_press_event', 950, 200))
+        self.assertFalse(widget.dragging)
+        widget.on_mouse_move(self._event('motion_notify_event', 1450, 60))
+        self.assertTrue(widget._box.get_visible())
+        self.assertTrue(widget.redraw.pending)
+        widget.on_mouse_release(self._event('button_release_event', 1450, 60))
+        self.assertEqual(list(widget.selected_indices), [10, 11, 12, 13, 14])
+        self.assertFalse(widget._box.get_visible())
+        self.assertEqual(sorted(i.row() for i in widget.table.selectionModel().selectedRows()),
+                         [10, 11, 12, 13, 14])
+
+        # Drag point 12 up by 30: the whole group follows
+        widget.on_mouse_press(self._event('button_press_event', 1200, 120))
+        widget.on_mouse_move(self._event('motion_notify_event', 1200, 150))
+        widget.on_mouse_release(self._event('button_release_event', 1200, 150))
+        points = widget.curve.get_points()
+        self.assertEqual(points[9], (900, 90))
+        self.assertEqual(points[10:15], [(x, x // 10 + 30) for x in range(1000, 1500, 100)])
+        self.assertEqual(points[15], (1500, 150))
+
+    def test_group_move_past_neighbours_keeps_selection(self):
+        widget = self.widget
+        widget._set_selection([2, 3], primary=2)
+        widget.on_mouse_press(self._event('button_press_event', 200, 20))
+        widget.on_mouse_move(self._event('motion_notify_event', 450, 20))
+        widget.on_mouse_release(self._event('button_release_event', 450, 20))
+        x = widget.curve.x
+        self.assertTrue((x[1:] >= x[:-1]).all())
+        self.assertEqual(list(x[widget.selected_indices]), [450, 550])
+        self.assertEqual(x[widget.selected_point_index], 450)
+
+    def test_remove_group(self):
+        self.widget._set_selection([0, 1, 2])
+        self.widget.remove_selected_point()
+        self.assertEqual(len(self.widget.curve), 47)
+        self.assertEqual(self.widget.curve.get_points()[0], (300, 30))
+        self.assertIsNone(self.widget.selected_point_index)
+
+
+class TestPointHitIndex(unittest.TestCase):
+    """Test cached display-space hit-testing"""
+
+    def setUp(self):
+        self.figure = Figure(figsize=(4, 3), dpi=100)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 10)
+        self.index = PointHitIndex(self.ax)
+        self.index.set_data([1, 5, 9], [1, 5, 9])
+
+    def _pixels(self, x, y):
+        return self.ax.transData.transform((x, y))
+
+    def test_nearest_within_radius(self):
+        px, py = self._pixels(5.1, 5.0)
+        self.assertEqual(self.index.nearest(px, py), 1)
+        px, py = self._pixels(3, 3)
+        self.assertIsNone(self.index.nearest(px, py))
+        self.assertIsNone(PointHitIndex(self.ax).nearest(px, py))
+
+    def test_cache_follows_view_and_data(self):
+        display = self.index.display_points()
+        self.assertIs(self.index.display_points(), display)
+        self.ax.set_xlim(0, 20)   # zoom out: pixel positions change
+        moved = self.index.display_points()
+        self.assertIsNot(moved, display)
+        px, py = self._pixels(9, 9)
+        self.assertEqual(self.index.nearest(px, py), 2)
+        self.index.set_data([9], [9])
+        self.assertEqual(self.index.nearest(px, py), 0)
+
+    def test_in_box(self):
+        x0, y0 = self._pixels(0, 0)
+        x1, y1 = self._pixels(6, 6)
+        self.assertEqual(list(self.index.in_box(x1, y1, x0, y0)), [0, 1])
+
+
+class TestFrameTimer(unittest.TestCase):
+    """Test the rolling frame-time statistics"""
+
+    def test_statistics(self):
+        timer = FrameTimer(window=2)
+        self.assertEqual(timer.fps, 0.0)
+        self.assertEqual(timer.summary(), '')
+        for seconds in (0.030, 0.010, 0.020):
+            timer.record(seconds)
+        self.assertEqual(timer.count, 3)
+        self.assertAlmostEqual(timer.mean_ms, 15.0)
+        self.assertAlmostEqual(timer.max_ms, 20.0)
+        self.assertAlmostEqual(timer.last_ms, 20.0)
+        self.assertAlmostEqual(timer.fps, 1000 / 15)
+        with timer.frame():
+            pass
+        self.assertEqual(timer.count, 4)
+        timer.reset()
+        self.assertEqual((timer.count, timer.mean_ms), (0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -247,6 +247,59 @@ def run_tests():
     return result.wasSuccessful()
 
 
+class TestRTOSetupIniUpdate(unittest.TestCase):
+    """Test the setup.ini update offered after saving final.rto"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for all tests"""
+        from PyQt5.QtWidgets import QApplication
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.setup_ini = os.path.join(self.temp_dir, 'setup.ini')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _update(self, text):
+        from gui.rto_manager_dialog import RTOManagerDialog
+        with open(self.setup_ini, 'w', newline='') as f:
+            f.write(text)
+        dialog = RTOManagerDialog(self.temp_dir)
+        dialog._apply_setup_ini_update()
+        dialog.close()
+        with open(self.setup_ini, newline='') as f:
+            return f.read()
+
+    def test_lowercase_keys_are_updated_in_place(self):
+        text = self._update("[GEARS]\nuse_gearset=0\n\n[FINAL_GEAR_RATIO]\nratios=old.rto\n")
+        self.assertEqual(text, "[GEARS]\nuse_gearset=1\n\n[FINAL_GEAR_RATIO]\nratios=final.rto\n")
+
+    def test_up_to_date_file_is_not_rewritten(self):
+        from gui import rto_manager_dialog
+        toasts = []
+        original = rto_manager_dialog.show_toast
+        rto_manager_dialog.show_toast = lambda parent, message, kind='success': toasts.append(kind)
+        try:
+            text = self._update("[GEARS]\nUSE_GEARSET=1\n\n[FINAL_GEAR_RATIO]\nRATIOS=final.rto\n")
+        finally:
+            rto_manager_dialog.show_toast = original
+        self.assertEqual(text, "[GEARS]\nUSE_GEARSET=1\n\n[FINAL_GEAR_RATIO]\nRATIOS=final.rto\n")
+        self.assertFalse(os.path.exists(self.setup_ini + '.bak'))
+        self.assertEqual(toasts, ['info'])
+
+    def test_no_gears_section_is_added(self):
+        text = self._update("[FUEL]\nMIN=1\n")
+        self.assertNotIn('[GEARS]', text)
+        self.assertNotIn('USE_GEARSET', text)
+        self.assertIn('[FINAL_GEAR_RATIO]', text)
+        self.assertIn('RATIOS=final.rto', text)
+
+
 if __name__ == '__main__':
     success = run_tests()
     sys.exit(0 if success else 1)
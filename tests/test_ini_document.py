@@ -0,0 +1,189 @@
+"""
+Tests for the format-preserving INI document (core.ini_document)
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.ini_document import IniDocument, LAZY_THRESHOLD
+from core.ini_parser import IniParser
+
+
+SAMPLE = (
+    "; engine of a test car\r\n"
+    "[HEADER]\r\n"
+    "VERSION=1\r\n"
+    "\r\n"
+    "[ENGINE_DATA]\r\n"
+    "MINIMUM=1000\t\t; minimum RPM\r\n"
+    "LIMITER = 8500;no space before comment\r\n"
+    "COLOR=\r\n"
+    "\r\n"
+    "; trailing comment of ENGINE_DATA\r\n"
+    "[TURBO_0]\r\n"
+    "LAG_UP=0.99\r\n"
+)
+
+
+class TestIniDocument(unittest.TestCase):
+    """Test parsing and span patching of IniDocument"""
+
+    def test_unchanged_round_trip(self):
+        doc = IniDocument(SAMPLE)
+        self.assertIs(doc.to_text(), SAMPLE)
+        self.assertFalse(doc.is_modified())
+        self.assertEqual(doc.newline, '\r\n')
+
+    def test_values(self):
+        doc = IniDocument(SAMPLE)
+        self.assertEqual(doc.sections(), ['HEADER', 'ENGINE_DATA', 'TURBO_0'])
+        self.assertEqual(doc.get('ENGINE_DATA', 'MINIMUM'), '1000')
+        self.assertEqual(doc.get('ENGINE_DATA', 'LIMITER'), '8500')
+        self.assertEqual(doc.get('ENGINE_DATA', 'COLOR'), '')
+        self.assertIsNone(doc.get('ENGINE_DATA', 'minimum'))
+        self.assertEqual(doc.items('TURBO_0'), {'LAG_UP': '0.99'})
+
+    def test_edit_replaces_only_value_span(self):
+        doc = IniDocument(SAMPLE)
+        doc.set('ENGINE_DATA', 'MINIMUM', '900')
+        doc.set('ENGINE_DATA', 'LIMITER', '9000')
+        doc.set('ENGINE_DATA', 'COLOR', 'red')
+        expected = (SAMPLE.replace("MINIMUM=1000\t", "MINIMUM=900\t")
+                    .replace("LIMITER = 8500;", "LIMITER = 9000;")
+                    .replace("COLOR=\r\n", "COLOR=red\r\n"))
+        self.assertEqual(doc.to_text(), expected)
+        self.assertEqual(doc.get('ENGINE_DATA', 'MINIMUM'), '900')
+
+    def test_new_key_after_last_key_of_section(self):
+        doc = IniDocument(SAMPLE)
+        doc.set('ENGINE_DATA', 'MAXIMUM', '8200')
+        self.assertEqual(doc.to_text(),
+                         SAMPLE.replace("COLOR=\r\n", "COLOR=\r\nMAXIMUM=8200\r\n"))
+
+    def test_new_section_appended(self):
+        doc = IniDocument(SAMPLE)
+        doc.set('FINAL_GEAR_RATIO', 'RATIOS', 'final.rto')
+        self.assertEqual(doc.to_text(), SAMPLE + "\r\n[FINAL_GEAR_RATIO]\r\nRATIOS=final.rto\r\n")
+        self.assertTrue(doc.has_section('FINAL_GEAR_RATIO'))
+
+    def test_unterminated_last_line(self):
+        doc = IniDocument("[GEARS]\nCOUNT=6")
+        doc.set('GEARS', 'COUNT', '5')
+        doc.set('GEARS', 'USE_GEARSET', '1')
+        self.assertEqual(doc.to_text(), "[GEARS]\nCOUNT=5\nUSE_GEARSET=1\n")
+
+    def test_duplicates_and_malformed_lines(self):
+        text = "[A]\nX=1\nnot a key\n[B]\nY=2\n[A]\nX=3\n"
+        doc = IniDocument(text)
+        self.assertEqual(doc.sections(), ['A', 'B'])
+        self.assertEqual(doc.get('A', 'X'), '3')
+        self.assertEqual(doc.malformed, [(3, 'not a key')])
+        doc.set('A', 'X', '4')
+        self.assertEqual(doc.to_text(), text.replace("X=3", "X=4"))
+
+    def test_copy_is_independent(self):
+        doc = IniDocument(SAMPLE)
+        other = doc.copy()
+        other.set('HEADER', 'VERSION', '2')
+        self.assertEqual(doc.get('HEADER', 'VERSION'), '1')
+        self.assertIs(doc.to_text(), SAMPLE)
+
+
+class TestLazyIniDocument(unittest.TestCase):
+    """Test the section index used for large documents"""
+
+    def test_sections_parsed_on_first_access(self):
+        doc = IniDocument(SAMPLE, lazy=True)
+        self.assertEqual(doc.sections(), ['HEADER', 'ENGINE_DATA', 'TURBO_0'])
+        self.assertTrue(doc.has_section('TURBO_0'))
+        self.assertEqual(doc._sections, {})
+        self.assertEqual(doc.get('ENGINE_DATA', 'LIMITER'), '8500')
+        self.assertEqual(list(doc._sections), ['ENGINE_DATA'])
+
+    def test_matches_eager_parse(self):
+        text = "junk\n[A]\nX=1\n  [B] ; note\nY=2\nbad\n[A]\nZ=3"
+        eager = IniDocument(text, lazy=False)
+        lazy = IniDocument(text, lazy=True)
+        self.assertEqual(lazy.sections(), eager.sections())
+        for section in eager.sections():
+            self.assertEqual(lazy.items(section), eager.items(section))
+        self.assertEqual(sorted(lazy.malformed), sorted(eager.malformed))
+        for doc in (eager, lazy):
+            doc.set('A', 'W', '4')
+            doc.set('B', 'Y', '5')
+        self.assertEqual(lazy.to_text(), eager.to_text())
+
+    def test_large_text_is_lazy_by_default(self):
+        text = ''.join(f"[S{i}]\nK=1\n" for i in range(LAZY_THRESHOLD // 8))
+        doc = IniDocument(text)
+        self.assertEqual(doc._sections, {})
+        self.assertEqual(doc.get('S7', 'K'), '1')
+        self.assertIs(doc.to_text(), text)
+
+
+class TestIniParserPreservesFormat(unittest.TestCase):
+    """Test that IniParser.save() only rewrites changed values"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'engine.ini')
+        with open(self.path, 'wb') as f:
+            f.write(b'\xef\xbb\xbf' + SAMPLE.encode('utf-8') + b'; caf\xe9\r\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_save_keeps_every_other_byte(self):
+        original = self._read()
+        parser = IniParser(self.path)
+        parser.set_value('ENGINE_DATA', 'LIMITER', '8800')
+        self.assertTrue(parser.save(backup=False))
+        self.assertEqual(self._read(), original.replace(b'8500', b'8800'))
+        self.assertFalse(parser.save(backup=False))   # nothing changed since
+
+    def test_numerically_equal_value_is_not_written(self):
+        original = self._read()
+        parser = IniParser(self.path)
+        parser.set_value('TURBO_0', 'LAG_UP', '0.9900')
+        parser.set_value('HEADER', 'VERSION', 2)
+        parser.save(backup=False)
+        self.assertEqual(self._read(), original.replace(b'VERSION=1', b'VERSION=2'))
+
+
+class TestIniParserGetMany(unittest.TestCase):
+    """Test typed batch access with IniParser.get_many()"""
+
+    def setUp(self):
+        self.parser = IniParser.from_string(
+            "[ENGINE_DATA]\nMINIMUM=1000.00\nINERTIA=0.15;kg m2\nBAD=abc\nFLAG=1\n")
+
+    def test_types_and_defaults(self):
+        values = self.parser.get_many('ENGINE_DATA', {
+            'MINIMUM': int, 'INERTIA': float, 'FLAG': bool, 'BAD': float, 'MISSING': int,
+        }, {'BAD': 2.5})
+        self.assertEqual(values, {'MINIMUM': 1000, 'INERTIA': 0.15, 'FLAG': True,
+                                  'BAD': 2.5, 'MISSING': None})
+        self.assertIsInstance(values['MINIMUM'], int)
+
+    def test_casts_are_cached_until_set(self):
+        document = self.parser.document
+        self.parser.get_many('ENGINE_DATA', {'INERTIA': float})
+        self.assertEqual(document._typed[('ENGINE_DATA', 'INERTIA')], {float: 0.15})
+        self.parser.set_value('ENGINE_DATA', 'INERTIA', '0.2')
+        self.assertEqual(self.parser.get_many('ENGINE_DATA', {'INERTIA': float}),
+                         {'INERTIA': 0.2})
+        self.assertEqual(self.parser.get_many('MISSING', {'X': int}, {'X': 7}), {'X': 7})
+
+
+if __name__ == '__main__':
+    unittest.main()
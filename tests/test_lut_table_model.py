@@ -0,0 +1,122 @@
+"""
+Tests for the LUT point table model (gui.lut_table_model)
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+
+from core.lut_parser import LUTCurve
+from gui.curve_editor_widget import CurveEditorWidget
+from gui.lut_table_model import LUTTableModel
+
+
+class TestLUTTableModel(unittest.TestCase):
+    """Test incremental change reporting and edit forwarding"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for all tests"""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.curve = LUTCurve.from_points([(i * 100, i * 10) for i in range(100)])
+        self.model = LUTTableModel()
+        self.model.set_curve(self.curve)
+        self.changes = []
+        self.resets = 0
+        self.model.dataChanged.connect(
+            lambda first, last: self.changes.append((first.row(), last.row())))
+        self.model.modelReset.connect(self._count_reset)
+
+    def _count_reset(self):
+        self.resets += 1
+
+    def _text(self, row, column):
+        return self.model.data(self.model.index(row, column))
+
+    def test_shows_rounded_points(self):
+        self.assertEqual((self.model.rowCount(), self.model.columnCount()), (100, 2))
+        self.assertEqual((self._text(5, 0), self._text(5, 1)), ('500', '50'))
+        self.assertEqual(self.model.headerData(1, Qt.Horizontal), 'Y')
+
+    def test_single_point_change_reports_one_row(self):
+        self.curve.update_point(40, 4000, 123)
+        self.assertEqual(self.model.sync(), 1)
+        self.assertEqual(self.changes, [(40, 40)])
+        self.assertEqual(self._text(40, 1), '123')
+        self.assertEqual(self.model.sync(), 0)   # nothing new
+        self.assertEqual(self.changes, [(40, 40)])
+
+    def test_moved_point_reports_rows_it_passed(self):
+        self.curve.update_point(10, 1250, 10)   # row 10 moves between 12 and 13
+        self.curve.update_point(80, 8000, 1)
+        self.model.sync()
+        self.assertEqual(self.changes, [(10, 12), (80, 80)])
+        self.assertEqual([self._text(row, 0) for row in (10, 11, 12)], ['1100', '1200', '1250'])
+        self.assertEqual(self.resets, 0)
+
+    def test_added_point_resets(self):
+        self.curve.add_point(50, 5)
+        self.model.sync()
+        self.assertEqual(self.resets, 1)
+        self.assertEqual(self.model.rowCount(), 101)
+        self.assertEqual(self._text(1, 0), '50')
+
+    def test_edits_are_forwarded_not_applied(self):
+        edits = []
+        self.model.value_edited.connect(lambda *args: edits.append(args))
+        index = self.model.index(3, 1)
+        self.assertFalse(self.model.setData(index, 'abc'))
+        self.assertTrue(self.model.setData(index, '77'))
+        self.assertEqual(edits, [(3, 1, 77)])
+        self.assertEqual(self.curve.get_points()[3], (300, 30))
+
+
+class TestCurveEditorTable(unittest.TestCase):
+    """Test the editor's table view over the model"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for all tests"""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.widget = CurveEditorWidget()
+        self.widget.load_curve(LUTCurve.from_points([(1000, 100), (2000, 200), (3000, 300)]))
+
+    def tearDown(self):
+        self.widget.close()
+
+    def test_table_edit_updates_and_sorts_curve(self):
+        changed = []
+        self.widget.curve_changed.connect(lambda: changed.append(True))
+        model = self.widget.table_model
+        model.setData(model.index(0, 0), '2500')
+        self.assertEqual(self.widget.curve.get_points(),
+                         [(2000, 200), (2500, 100), (3000, 300)])
+        self.assertEqual(model.data(model.index(1, 0)), '2500')
+        self.assertEqual(changed, [True])
+
+    def test_add_point_keeps_table_selection(self):
+        self.widget.table.selectRow(2)
+        self.widget.x_input.setValue(500)
+        self.widget.y_input.setValue(50)
+        self.widget.add_point_from_form()
+        self.assertEqual(self.widget.table_model.rowCount(), 4)
+        rows = [index.row() for index in self.widget.table.selectionModel().selectedRows()]
+        self.assertEqual(rows, [self.widget.selected_point_index])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Tests for the shared parsed-file cache (core.parse_cache)
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.parse_cache import ParseCache, PARSE_CACHE
+from core.ini_parser import IniParser
+from core.lut_parser import LUTCurve
+from core.rto_parser import RTOParser
+
+
+class TestParseCache(unittest.TestCase):
+    """Test hit/miss accounting and validation of ParseCache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'file.txt')
+        with open(self.path, 'w') as f:
+            f.write('one')
+        self.cache = ParseCache(max_entries=2)
+        self.loads = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _loader(self):
+        self.loads += 1
+        with open(self.path) as f:
+            return f.read()
+
+    def test_hit_after_miss(self):
+        self.assertEqual(self.cache.get(self.path, 'txt', self._loader), 'one')
+        self.assertEqual(self.cache.get(self.path, 'txt', self._loader), 'one')
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(self.cache.stats(),
+                         {'hits': 1, 'misses': 1, 'invalidations': 0, 'entries': 1})
+
+    def test_changed_file_is_reparsed(self):
+        self.cache.get(self.path, 'txt', self._loader)
+        with open(self.path, 'w') as f:
+            f.write('three')
+        self.assertEqual(self.cache.get(self.path, 'txt', self._loader), 'three')
+        self.assertEqual(self.loads, 2)
+
+    def test_invalidate_drops_every_kind(self):
+        self.cache.get(self.path, 'a', self._loader)
+        self.cache.get(self.path, 'b', self._loader)
+        self.cache.invalidate(self.path)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats()['invalidations'], 2)
+
+    def test_missing_file_is_not_cached(self):
+        missing = os.path.join(self.temp_dir, 'missing.txt')
+        self.assertIsNone(self.cache.get(missing, 'txt', lambda: None))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru_limit(self):
+        for name in ('a', 'b', 'c'):
+            path = os.path.join(self.temp_dir, name)
+            open(path, 'w').close()
+            self.cache.get(path, 'txt', lambda: name)
+        self.assertEqual(len(self.cache), 2)
+
+
+class TestCachedParsers(unittest.TestCase):
+    """Test the cached() views of the INI, LUT and RTO parsers"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.ini_path = os.path.join(self.temp_dir, 'engine.ini')
+        with open(self.ini_path, 'w') as f:
+            f.write("[ENGINE_DATA]\nLIMITER=7000\n")
+        self.lut_path = os.path.join(self.temp_dir, 'power.lut')
+        with open(self.lut_path, 'w') as f:
+            f.write("0|100\n1000|200\n")
+        self.rto_path = os.path.join(self.temp_dir, 'final.rto')
+        with open(self.rto_path, 'w') as f:
+            f.write("4.10|4.10\n3.90|3.90\n")
+        PARSE_CACHE.clear()
+
+    def tearDown(self):
+        PARSE_CACHE.clear()
+        shutil.rmtree(self.temp_dir)
+
+    def test_ini_views_share_parse(self):
+        first = IniParser.cached(self.ini_path)
+        second = IniParser.cached(self.ini_path)
+        self.assertIs(first.document, second.document)
+        self.assertEqual(second.get_value('ENGINE_DATA', 'LIMITER'), '7000')
+        self.assertEqual(PARSE_CACHE.stats()['misses'], 1)
+        self.assertEqual(PARSE_CACHE.stats()['hits'], 1)
+
+    def test_ini_copy_on_write(self):
+        editor = IniParser.cached(self.ini_path)
+        reader = IniParser.cached(self.ini_path)
+        editor.set_value('ENGINE_DATA', 'LIMITER', '8000')
+        self.assertEqual(reader.get_value('ENGINE_DATA', 'LIMITER'), '7000')
+        self.assertEqual(IniParser.cached(self.ini_path).get_value('ENGINE_DATA', 'LIMITER'), '7000')
+
+    def test_ini_save_invalidates(self):
+        editor = IniParser.cached(self.ini_path)
+        editor.set_value('ENGINE_DATA', 'LIMITER', '8000')
+        editor.save(backup=False)
+        self.assertEqual(IniParser.cached(self.ini_path).get_value('ENGINE_DATA', 'LIMITER'), '8000')
+        self.assertEqual(PARSE_CACHE.stats()['invalidations'], 1)
+
+    def test_lut_and_rto_copies(self):
+        curve = LUTCurve.cached(self.lut_path)
+        curve.update_point(0, 0.0, 0.0)
+        self.assertEqual(LUTCurve.cached(self.lut_path).points[0], (0.0, 100.0))
+        curve.save(backup=False)
+        self.assertEqual(LUTCurve.cached(self.lut_path).points[0], (0.0, 0.0))
+
+        parser = RTOParser.cached(self.rto_path)
+        self.assertEqual(parser.get_ratios(), [4.10, 3.90])
+        parser.add_ratio(3.70)
+        self.assertEqual(len(RTOParser.cached(self.rto_path).ratios), 2)
+
+    def test_missing_files(self):
+        missing = os.path.join(self.temp_dir, 'missing')
+        self.assertEqual(IniParser.cached(missing + '.ini').get_sections(), [])
+        self.assertEqual(len(LUTCurve.cached(missing + '.lut')), 0)
+        self.assertEqual(RTOParser.cached(missing + '.rto').ratios, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
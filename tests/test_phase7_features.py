@@ -12,7 +12,7 @@ import math
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from core.power_calculator import PowerTorqueCalculator
+from core.power_calculator import PowerTorqueCalculator, _base_curves, _compute_curves, _turbo_gain
 from core.setup_manager import SetupManager
 
 
@@ -172,6 +172,66 @@ class TestPowerTorqueCalculator(unittest.TestCase):
         self.assertAlmostEqual(boost, 1.5, places=3)
 
 
+    def test_compute_curves_matches_scalar_methods(self):
+        """Vectorized curves should agree with the per-RPM methods."""
+        calc = PowerTorqueCalculator(self.torque_points, self.turbo_config)
+        result = calc.compute_curves(rpm_step=175)
+        self.assertEqual(result['rpm_values'][0], 1000)
+        self.assertEqual(result['rpm_values'][-1], 8500)
+        for i, rpm in enumerate(result['rpm_values']):
+            self.assertAlmostEqual(result['base_torque'][i], calc.interpolate_torque(rpm))
+            self.assertAlmostEqual(result['boost_curve'][i], calc.boost_at_rpm(rpm))
+            self.assertAlmostEqual(result['effective_torque'][i], calc.effective_torque(rpm))
+            self.assertAlmostEqual(result['effective_hp'][i],
+                                   calc.torque_to_hp(calc.effective_torque(rpm), rpm))
+        peak_rpm, peak_hp = result['peak_eff_hp']
+        self.assertEqual(peak_hp, max(result['effective_hp']))
+        self.assertEqual(result['effective_hp'][result['rpm_values'].index(peak_rpm)], peak_hp)
+
+    def test_compute_curves_memoized(self):
+        """Equal inputs should return the cached result, even from a new calculator."""
+        first = PowerTorqueCalculator(self.torque_points, self.turbo_config).compute_curves()
+        hits = _compute_curves.cache_info().hits
+        again = PowerTorqueCalculator(list(self.torque_points),
+                                      [dict(self.turbo_config[0])]).compute_curves()
+        self.assertEqual(_compute_curves.cache_info().hits, hits + 1)
+        self.assertEqual(first, again)
+        changed = [dict(self.turbo_config[0], max_boost=1.0)]
+        other = PowerTorqueCalculator(self.torque_points, changed).compute_curves()
+        self.assertLess(other['peak_eff_torque'][1], first['peak_eff_torque'][1])
+
+    def test_compute_curves_result_is_a_copy(self):
+        """Editing a returned curve must not corrupt the memoized result."""
+        calc = PowerTorqueCalculator(self.torque_points, self.turbo_config)
+        first = calc.compute_curves()
+        expected = list(first['effective_torque'])
+        first['effective_torque'][0] = -1.0
+        first['rpm_values'].append(99999)
+        again = calc.compute_curves()
+        self.assertEqual(again['effective_torque'], expected)
+        self.assertNotIn(99999, again['rpm_values'])
+
+    def test_max_boost_change_reuses_cached_arrays(self):
+        """Only MAX_BOOST changed: base curves and boost shape come from the cache."""
+        turbo = dict(self.turbo_config[0])
+        calc = PowerTorqueCalculator(self.torque_points, [turbo])
+        calc.compute_curves(rpm_step=50)
+        base_misses = _base_curves.cache_info().misses
+        gain_misses = _turbo_gain.cache_info().misses
+        for max_boost in (0.5, 0.75, 1.0):
+            turbo['max_boost'] = max_boost
+            result = calc.compute_curves(rpm_step=50)
+            idx = result['rpm_values'].index(4000)
+            self.assertAlmostEqual(result['effective_torque'][idx], 280.0 * (1 + max_boost))
+        self.assertEqual(_base_curves.cache_info().misses, base_misses)
+        self.assertEqual(_turbo_gain.cache_info().misses, gain_misses)
+
+        turbo['gamma'] = 1.0
+        result = calc.compute_curves(rpm_step=50)
+        self.assertEqual(_turbo_gain.cache_info().misses, gain_misses + 1)
+        idx = result['rpm_values'].index(1500)
+        self.assertAlmostEqual(result['boost_curve'][idx], 1.0 * 1500 / 3000)
+
 class TestSetupManager(unittest.TestCase):
     """Test setup manager."""
 
@@ -0,0 +1,120 @@
+"""
+Tests for the frame-rate-limited redraw scheduler (gui.redraw_scheduler)
+"""
+
+import unittest
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtTest import QTest
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from gui.power_torque_dialog import PowerTorqueDialog
+from gui.redraw_scheduler import RedrawScheduler
+
+
+class TestRedrawScheduler(unittest.TestCase):
+    """Test merging, frame limiting and statistics"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for all tests"""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.canvas = FigureCanvas(Figure())
+        self.idle_draws = 0
+
+        def counting_draw_idle():
+            self.idle_draws += 1
+        self.canvas.draw_idle = counting_draw_idle
+        self.scheduler = RedrawScheduler(self.canvas, fps=60)
+        self.calls = []
+
+    def _record(self):
+        self.calls.append('frame')
+
+    def test_requests_merge_into_one_frame(self):
+        for _ in range(5):
+            self.scheduler.request(self._record)
+            self.scheduler.request_draw()
+        self.assertTrue(self.scheduler.pending)
+        self.assertEqual(self.calls, [])
+        self.scheduler.flush()
+        self.assertEqual(self.calls, ['frame'])
+        self.assertEqual(self.idle_draws, 1)
+        self.assertEqual(self.scheduler.frames, 1)
+        self.assertEqual(self.scheduler.merged, 9)
+        self.assertFalse(self.scheduler.pending)
+
+    def test_draw_requested_by_callback_runs_in_same_frame(self):
+        def update():
+            self.calls.append('update')
+            self.scheduler.request_draw()
+        self.scheduler.request(update)
+        self.scheduler.flush()
+        self.assertEqual((self.calls, self.idle_draws, self.scheduler.frames), (['update'], 1, 1))
+
+    def _wait_for_frames(self, count, timeout=2.0):
+        """Process events until count frames ran (other widgets may keep the loop busy)"""
+        deadline = time.perf_counter() + timeout
+        while len(self.calls) < count and time.perf_counter() < deadline:
+            QTest.qWait(5)
+
+    def test_timer_runs_frame_from_event_loop(self):
+        self.scheduler.request(self._record)
+        self._wait_for_frames(1)
+        self.assertEqual(self.calls, ['frame'])
+
+        # Right after a frame the next one waits for the rest of the interval
+        self.scheduler.request(self._record)
+        self.scheduler.flush()
+        self.scheduler.request(self._record)
+        self.assertGreater(self.scheduler._timer.interval(), 0)
+        self._wait_for_frames(3)
+        self.assertEqual(self.calls, ['frame'] * 3)
+
+    def test_slow_frame_counts_dropped_intervals(self):
+        self.scheduler.request(lambda: time.sleep(0.04))
+        self.scheduler.flush()
+        self.assertGreaterEqual(self.scheduler.dropped, 2)
+        self.scheduler.reset_stats()
+        self.assertEqual((self.scheduler.frames, self.scheduler.merged,
+                          self.scheduler.dropped), (0, 0, 0))
+        self.assertEqual(self.scheduler.summary(), '0 frames, 0 merged, 0 dropped')
+
+
+class TestPowerTorqueDialogRedraw(unittest.TestCase):
+    """Test that turbo spin box changes coalesce into one chart update"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for all tests"""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+
+    def test_spin_burst_updates_chart_once(self):
+        dialog = PowerTorqueDialog([(1000, 200), (4000, 300), (7000, 250)],
+                                   [{'max_boost': 1.0, 'reference_rpm': 3000, 'gamma': 2.0}])
+        dialog._redraw.flush()
+        dialog._redraw.reset_stats()
+        for step in range(20):
+            dialog.turbo_0_max_boost.setValue(0.5 + step * 0.05)
+        self.assertEqual(dialog._redraw.frames, 0)
+        dialog._redraw.flush()
+        self.assertEqual((dialog._redraw.frames, dialog._redraw.merged), (1, 19))
+        self.assertEqual(dialog.lbl_turbo_peak_tq.text(), "735.0 Nm @ 4000 RPM")
+        dialog.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 Tests for Speed Calculator
 """
 
+import math
 import unittest
 import os
 import sys
@@ -149,5 +150,55 @@ class TestSpeedCalculator(unittest.TestCase):
         self.assertLess(speeds[6], 350)    # 6th gear < 350 km/h
 
 
+    def test_power_limited_speed_flat_torque(self):
+        """Test drag-limited speed against the analytic solution"""
+        # 300 Nm × 3.0 / 0.3 m = 3000 N = ½ρ·CdA·v² with CdA = 0.6
+        v = math.sqrt(3000 / (0.5 * SpeedCalculator.AIR_DENSITY * 0.6))
+        speeds = SpeedCalculator.calculate_power_limited_speeds(
+            [(0, 300), (20000, 300)], [3.0], 1.0, 20000, 0.3, 0.6)
+        self.assertAlmostEqual(speeds[0], v * 3.6, delta=0.5)
+
+    def test_power_limited_speed_includes_rolling_resistance(self):
+        """Test that rolling resistance lowers the drag-limited speed"""
+        args = ([(0, 300), (20000, 300)], [3.0], 1.0, 20000, 0.3, 0.6)
+        free = SpeedCalculator.calculate_power_limited_speeds(*args)
+        rolling = SpeedCalculator.calculate_power_limited_speeds(
+            *args, rolling_resistance=(200.0, 0.05))
+        v = math.sqrt(2800 / (0.5 * SpeedCalculator.AIR_DENSITY * 0.6 + 0.05))
+        self.assertLess(rolling[0], free[0])
+        self.assertAlmostEqual(rolling[0], v * 3.6, delta=0.5)
+
+    def test_power_limited_speed_rev_limited(self):
+        """Test that a gear reaching the limiter reports the rev-limited speed"""
+        speeds = SpeedCalculator.calculate_power_limited_speeds(
+            [(0, 300), (8000, 300)], [3.5, 0.8], 4.1, 7000, 0.33, 0.0)
+        for ratio, speed in zip([3.5, 0.8], speeds):
+            self.assertAlmostEqual(
+                speed, SpeedCalculator.calculate_max_speed(ratio, 4.1, 7000, 0.33), places=6)
+
+    def test_power_limited_speed_ignores_low_rpm_dip(self):
+        """Test that a torque hole low in the rev range does not cap the gear"""
+        # Too weak to pass ~60 km/h from standstill, but it holds speed above 3000 RPM
+        torque = [(0, 20), (2500, 20), (3000, 300), (20000, 300)]
+        v = math.sqrt(3000 / (0.5 * SpeedCalculator.AIR_DENSITY * 0.6))
+        speeds = SpeedCalculator.calculate_power_limited_speeds(
+            torque, [3.0], 1.0, 20000, 0.3, 0.6)
+        self.assertAlmostEqual(speeds[0], v * 3.6, delta=0.5)
+
+    def test_power_limited_speed_unusable_input(self):
+        """Test zero gears, no torque and empty input"""
+        speeds = SpeedCalculator.calculate_power_limited_speeds(
+            [(0, 300), (8000, 300)], [3.5, 0.0], 4.1, 7000, 0.33, 0.6)
+        self.assertGreater(speeds[0], 0.0)
+        self.assertEqual(speeds[1], 0.0)
+        self.assertEqual(SpeedCalculator.calculate_power_limited_speeds(
+            [], [3.5], 4.1, 7000, 0.33, 0.6), [0.0])
+        self.assertEqual(SpeedCalculator.calculate_power_limited_speeds(
+            [(0, 300)], [], 4.1, 7000, 0.33, 0.6), [])
+        # No torque: the car cannot move against rolling resistance
+        self.assertEqual(SpeedCalculator.calculate_power_limited_speeds(
+            [(0, 0), (8000, 0)], [3.5], 4.1, 7000, 0.33, 0.6, (100.0, 0.0)), [0.0])
+
+
 if __name__ == '__main__':
     unittest.main()
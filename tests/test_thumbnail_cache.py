@@ -0,0 +1,114 @@
+"""
+Tests for the preview thumbnail cache (gui.thumbnail_cache)
+"""
+
+import unittest
+import os
+import sys
+import time
+import tempfile
+import shutil
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QImage, QColor
+
+from gui.thumbnail_cache import ThumbnailCache, ThumbnailLoader
+
+
+class TestThumbnailCache(unittest.TestCase):
+    """Test memory/disk caching and background decoding of previews"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up QApplication for all tests"""
+        cls.app = QApplication.instance()
+        if cls.app is None:
+            cls.app = QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'thumbs')
+        self.preview = os.path.join(self.temp_dir, 'preview.jpg')
+        self._write_preview(QColor('red'))
+        self.size = QSize(300, 150)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_preview(self, color, width=1600, height=900):
+        image = QImage(width, height, QImage.Format_RGB32)
+        image.fill(color)
+        self.assertTrue(image.save(self.preview, 'JPG'))
+
+    def _disk_files(self):
+        return [f for _r, _d, names in os.walk(self.cache_dir) for f in names]
+
+    def test_load_scales_and_keeps_aspect(self):
+        cache = ThumbnailCache(self.cache_dir)
+        self.assertIsNone(cache.get_cached(self.preview, self.size))
+        image = cache.load(self.preview, self.size)
+        self.assertEqual((image.width(), image.height()), (266, 150))
+        self.assertIs(cache.get_cached(self.preview, self.size), image)
+        self.assertEqual(len(self._disk_files()), 1)
+
+    def test_disk_cache_survives_new_instance(self):
+        ThumbnailCache(self.cache_dir).load(self.preview, self.size)
+        image = ThumbnailCache(self.cache_dir).load(self.preview, self.size)
+        self.assertEqual(image.width(), 266)
+        self.assertEqual(len(self._disk_files()), 1)
+
+    def test_changed_source_gets_new_thumbnail(self):
+        cache = ThumbnailCache(self.cache_dir)
+        first = cache.load(self.preview, self.size)
+        self._write_preview(QColor('blue'))
+        st = os.stat(self.preview)
+        os.utime(self.preview, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+        second = cache.load(self.preview, self.size)
+        self.assertNotEqual(first.pixelColor(10, 10), second.pixelColor(10, 10))
+        self.assertEqual(len(self._disk_files()), 2)
+
+    def test_missing_or_broken_source(self):
+        cache = ThumbnailCache(self.cache_dir)
+        self.assertIsNone(cache.load(os.path.join(self.temp_dir, 'nope.png'), self.size))
+        broken = os.path.join(self.temp_dir, 'broken.png')
+        with open(broken, 'wb') as f:
+            f.write(b'not an image')
+        self.assertIsNone(cache.load(broken, self.size))
+
+    def test_memory_lru_limit(self):
+        cache = ThumbnailCache(self.cache_dir, memory_items=2)
+        for w in (100, 200, 300):
+            cache.load(self.preview, QSize(w, 100))
+        self.assertIsNone(cache.get_cached(self.preview, QSize(100, 100)))
+        self.assertIsNotNone(cache.get_cached(self.preview, QSize(300, 100)))
+
+    def test_prune(self):
+        cache = ThumbnailCache(self.cache_dir)
+        for w in (100, 200, 300):
+            cache.load(self.preview, QSize(w, 100))
+        cache.prune(max_bytes=0)
+        self.assertEqual(self._disk_files(), [])
+
+    def test_loader_emits_ready(self):
+        loader = ThumbnailLoader(ThumbnailCache(self.cache_dir))
+        results = []
+        loader.ready.connect(lambda path, size, image: results.append((path, size, image)))
+        self.assertIsNone(loader.request(self.preview, self.size))
+        deadline = time.time() + 10
+        while not results and time.time() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        self.assertEqual(len(results), 1)
+        path, size, image = results[0]
+        self.assertEqual((path, size), (self.preview, self.size))
+        self.assertFalse(image.isNull())
+        # Now served from memory without another round trip
+        self.assertIsNotNone(loader.request(self.preview, self.size))
+
+
+if __name__ == '__main__':
+    unittest.main()
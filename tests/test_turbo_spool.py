@@ -0,0 +1,88 @@
+"""
+Tests for the transient turbo spool simulator (core.turbo_spool)
+"""
+
+import unittest
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.ini_parser import IniParser
+from core.power_calculator import PowerTorqueCalculator
+from core.turbo_spool import TurboSpoolSimulator, read_turbo_configs, PHYSICS_HZ
+
+
+class TestTurboSpoolSimulator(unittest.TestCase):
+    """Test boost integration with LAG_UP / LAG_DN / WASTEGATE"""
+
+    def setUp(self):
+        self.torque_points = [(1000, 100), (3000, 200), (6000, 300), (8000, 250)]
+        self.turbo = {'max_boost': 1.0, 'wastegate': 1.0, 'reference_rpm': 4000,
+                      'gamma': 2.0, 'lag_up': 0.99, 'lag_dn': 0.95}
+
+    def test_converges_to_steady_state(self):
+        twin = [self.turbo, dict(self.turbo, max_boost=0.5, reference_rpm=3000)]
+        sim = TurboSpoolSimulator(self.torque_points, twin)
+        result = sim.simulate(np.full(3000, 3500.0))
+        expected = PowerTorqueCalculator(self.torque_points, twin).boost_at_rpm(3500)
+        self.assertAlmostEqual(result['boost'][-1], expected, places=6)
+        self.assertEqual(result['turbo_boost'].shape, (3000, 2))
+        calc = PowerTorqueCalculator(self.torque_points, twin)
+        self.assertAlmostEqual(result['torque'][-1], calc.effective_torque(3500), places=4)
+
+    def test_first_steps_follow_lag_up(self):
+        sim = TurboSpoolSimulator(self.torque_points, [self.turbo])
+        boost = sim.simulate(np.full(3, 5000.0))['boost']
+        # target is 1 bar above REFERENCE_RPM: boost = 1 - LAG_UP^n
+        np.testing.assert_allclose(boost, [1 - 0.99, 1 - 0.99 ** 2, 1 - 0.99 ** 3])
+
+    def test_decay_uses_lag_dn(self):
+        sim = TurboSpoolSimulator(self.torque_points, [self.turbo])
+        result = sim.simulate(np.full(2, 5000.0), throttle=0.0, initial_boost=1.0)
+        np.testing.assert_allclose(result['boost'], [0.95, 0.95 ** 2])
+        np.testing.assert_allclose(result['torque'], [0.0, 0.0])
+
+    def test_wastegate_caps_boost(self):
+        sim = TurboSpoolSimulator(self.torque_points, [dict(self.turbo, wastegate=0.6)])
+        self.assertAlmostEqual(sim.simulate(np.full(2000, 6000.0))['boost'][-1], 0.6)
+        no_cap = TurboSpoolSimulator(self.torque_points, [dict(self.turbo, wastegate=0.0)])
+        self.assertAlmostEqual(no_cap.simulate(np.full(2000, 6000.0))['boost'][-1], 1.0)
+
+    def test_timestep_independent_spool_time(self):
+        sim = TurboSpoolSimulator(self.torque_points, [self.turbo])
+        fine = sim.time_to_boost(sim.simulate(np.full(2000, 6000.0)))
+        coarse = sim.time_to_boost(sim.simulate(np.full(200, 6000.0), dt=10 / PHYSICS_HZ))
+        self.assertAlmostEqual(float(fine), float(coarse), delta=10 / PHYSICS_HZ)
+
+    def test_batch_matches_single_traces(self):
+        sim = TurboSpoolSimulator(self.torque_points, [self.turbo])
+        rpm = np.linspace(2000, 7000, 400)
+        throttle = np.array([[1.0], [0.5], [0.0]])
+        batch = sim.simulate(rpm, throttle)
+        self.assertEqual(batch['boost'].shape, (3, 400))
+        for i, level in enumerate((1.0, 0.5, 0.0)):
+            single = sim.simulate(rpm, level)
+            np.testing.assert_allclose(batch['boost'][i], single['boost'])
+            np.testing.assert_allclose(batch['torque'][i], single['torque'])
+        times = sim.time_to_boost(batch, 0.9)
+        self.assertTrue(np.isnan(times[2]))
+
+    def test_read_turbo_configs(self):
+        parser = IniParser.from_string(
+            "[TURBO_0]\nLAG_DN=0.985\nLAG_UP=0.960 ; comment\nMAX_BOOST=0.9\n"
+            "WASTEGATE=0.9\nREFERENCE_RPM=3450\nGAMMA=2.5\n[TURBO_1]\nMAX_BOOST=0.4\n")
+        configs = read_turbo_configs(parser)
+        self.assertEqual(len(configs), 2)
+        self.assertEqual(configs[0], {'max_boost': 0.9, 'wastegate': 0.9, 'reference_rpm': 3450.0,
+                                      'gamma': 2.5, 'lag_up': 0.96, 'lag_dn': 0.985})
+        self.assertEqual(configs[1]['max_boost'], 0.4)
+        # Missing keys use the same defaults as the car editor
+        self.assertEqual((configs[1]['lag_up'], configs[1]['lag_dn']), (0.990, 0.985))
+        self.assertEqual(read_turbo_configs(IniParser.from_string("[ENGINE_DATA]\n")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()